@@ -4,10 +4,13 @@ Economic Tracker - Manages economic balance and token costs for LiveBench agents
 
 import os
 import json
+import threading
 from datetime import datetime
 from typing import Dict, Optional, List
 from pathlib import Path
 
+from livebench.utils.append_writer import get_append_writer
+
 
 class EconomicTracker:
     """
@@ -28,7 +31,8 @@ class EconomicTracker:
         input_token_price: float = 2.5,  # per 1M tokens
         output_token_price: float = 10.0,  # per 1M tokens
         data_path: Optional[str] = None,
-        min_evaluation_threshold: float = 0.6  # Minimum score to receive payment
+        min_evaluation_threshold: float = 0.6,  # Minimum score to receive payment
+        max_call_details: int = 500  # Per-call detail entries kept per task
     ):
         """
         Initialize Economic Tracker
@@ -40,12 +44,15 @@ class EconomicTracker:
             output_token_price: Price per 1M output tokens
             data_path: Path to store economic data
             min_evaluation_threshold: Minimum evaluation score to receive payment (default 0.6)
+            max_call_details: Most recent LLM/API call details kept per task record;
+                older calls still count toward the task totals
         """
         self.signature = signature
         self.initial_balance = initial_balance
         self.input_token_price = input_token_price
         self.output_token_price = output_token_price
         self.min_evaluation_threshold = min_evaluation_threshold
+        self.max_call_details = max_call_details
 
         # Set data paths
         self.data_path = data_path or f"./data/agent_data/{signature}/economic"
@@ -78,11 +85,18 @@ class EconomicTracker:
         self.total_work_income = 0.0
         self.total_trading_profit = 0.0
 
+        # Cost tracking may be called from tool worker threads
+        self._lock = threading.RLock()
+
+        # Records are appended through the shared buffered writer
+        self._writer = get_append_writer()
+
         # Ensure directory exists
         os.makedirs(self.data_path, exist_ok=True)
 
     def initialize(self) -> None:
         """Initialize tracker, load existing state or create new"""
+        self._writer.flush(self.balance_file)
         if os.path.exists(self.balance_file):
             # Load existing state
             self._load_latest_state()
@@ -98,6 +112,7 @@ class EconomicTracker:
                 work_income_delta=0.0,
                 trading_profit_delta=0.0
             )
+            self._writer.flush(self.balance_file)
             print(f"✅ Initialized economic tracker for {self.signature}")
             print(f"   Starting balance: ${self.initial_balance:.2f}")
 
@@ -138,21 +153,30 @@ class EconomicTracker:
 
         # Initialize detailed token tracking
         self.task_token_details = {
-            "llm_calls": [],  # List of {input_tokens, output_tokens, cost}
-            "api_calls": []   # List of {api_name, tokens, cost} or {api_name, cost} for flat-rate
+            "llm_calls": [],  # List of {input_tokens, output_tokens, cost} (most recent max_call_details)
+            "api_calls": [],  # List of {api_name, tokens, cost} or {api_name, cost} for flat-rate
+            # Running totals so details can be capped without losing counts
+            "llm_call_count": 0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "api_call_count": 0,
+            "token_based_calls": 0,
+            "flat_rate_calls": 0
         }
     
     def end_task(self) -> None:
         """End tracking for current task and save consolidated task record"""
-        if self.current_task_id:
-            self._save_task_record()
-            # Update end-of-day wall-clock marker
-            self.daily_last_task_end = datetime.now()
-            self.current_task_id = None
-            self.current_task_date = None
-            self.task_start_time = None
-            self.task_costs = {}
-            self.task_token_details = {}  # Reset detailed tracking
+        with self._lock:
+            if self.current_task_id:
+                self._save_task_record()
+                self._writer.flush(self.token_costs_file)
+                # Update end-of-day wall-clock marker
+                self.daily_last_task_end = datetime.now()
+                self.current_task_id = None
+                self.current_task_date = None
+                self.task_start_time = None
+                self.task_costs = {}
+                self.task_token_details = {}  # Reset detailed tracking
 
     def track_tokens(self, input_tokens: int, output_tokens: int) -> float:
         """
@@ -165,34 +189,39 @@ class EconomicTracker:
         Returns:
             Cost in dollars for this call
         """
-        cost = (
-            (input_tokens / 1_000_000.0) * self.input_token_price +
-            (output_tokens / 1_000_000.0) * self.output_token_price
-        )
-
-        # Update session tracking
-        self.session_input_tokens += input_tokens
-        self.session_output_tokens += output_tokens
-        self.session_cost += cost
-        self.daily_cost += cost
-
-        # Update task-level tracking
-        if self.current_task_id:
-            self.task_costs["llm_tokens"] += cost
-
-            # Store detailed call info (no immediate logging)
-            self.task_token_details["llm_calls"].append({
-                "timestamp": datetime.now().isoformat(),
-                "input_tokens": input_tokens,
-                "output_tokens": output_tokens,
-                "cost": cost
-            })
-
-        # Update totals
-        self.total_token_cost += cost
-        self.current_balance -= cost
+        with self._lock:
+            cost = (
+                (input_tokens / 1_000_000.0) * self.input_token_price +
+                (output_tokens / 1_000_000.0) * self.output_token_price
+            )
 
-        return cost
+            # Update session tracking
+            self.session_input_tokens += input_tokens
+            self.session_output_tokens += output_tokens
+            self.session_cost += cost
+            self.daily_cost += cost
+
+            # Update task-level tracking
+            if self.current_task_id:
+                self.task_costs["llm_tokens"] += cost
+
+                # Store detailed call info (no immediate logging)
+                details = self.task_token_details
+                details["llm_call_count"] += 1
+                details["input_tokens"] += input_tokens
+                details["output_tokens"] += output_tokens
+                self._append_call_detail(details["llm_calls"], {
+                    "timestamp": datetime.now().isoformat(),
+                    "input_tokens": input_tokens,
+                    "output_tokens": output_tokens,
+                    "cost": cost
+                })
+
+            # Update totals
+            self.total_token_cost += cost
+            self.current_balance -= cost
+
+            return cost
 
     def track_api_call(self, tokens: int, price_per_1m: float, api_name: str = "API") -> float:
         """
@@ -206,36 +235,39 @@ class EconomicTracker:
         Returns:
             Cost in dollars for this call
         """
-        cost = (tokens / 1_000_000.0) * price_per_1m
-
-        # Update session tracking
-        self.session_cost += cost
-        self.daily_cost += cost
-
-        # Update task-level tracking by channel
-        if self.current_task_id:
-            if "search" in api_name.lower() or "jina" in api_name.lower() or "tavily" in api_name.lower():
-                self.task_costs["search_api"] += cost
-            elif "ocr" in api_name.lower():
-                self.task_costs["ocr_api"] += cost
-            else:
-                self.task_costs["other_api"] += cost
-
-            # Store detailed API call info (no immediate logging)
-            self.task_token_details["api_calls"].append({
-                "timestamp": datetime.now().isoformat(),
-                "api_name": api_name,
-                "pricing_model": "per_token",
-                "tokens": tokens,
-                "price_per_1m": price_per_1m,
-                "cost": cost
-            })
-
-        # Update totals
-        self.total_token_cost += cost
-        self.current_balance -= cost
-
-        return cost
+        with self._lock:
+            cost = (tokens / 1_000_000.0) * price_per_1m
+
+            # Update session tracking
+            self.session_cost += cost
+            self.daily_cost += cost
+
+            # Update task-level tracking by channel
+            if self.current_task_id:
+                if "search" in api_name.lower() or "jina" in api_name.lower() or "tavily" in api_name.lower():
+                    self.task_costs["search_api"] += cost
+                elif "ocr" in api_name.lower():
+                    self.task_costs["ocr_api"] += cost
+                else:
+                    self.task_costs["other_api"] += cost
+
+                # Store detailed API call info (no immediate logging)
+                self.task_token_details["api_call_count"] += 1
+                self.task_token_details["token_based_calls"] += 1
+                self._append_call_detail(self.task_token_details["api_calls"], {
+                    "timestamp": datetime.now().isoformat(),
+                    "api_name": api_name,
+                    "pricing_model": "per_token",
+                    "tokens": tokens,
+                    "price_per_1m": price_per_1m,
+                    "cost": cost
+                })
+
+            # Update totals
+            self.total_token_cost += cost
+            self.current_balance -= cost
+
+            return cost
 
     def track_flat_api_call(self, cost: float, api_name: str = "API") -> float:
         """
@@ -248,32 +280,41 @@ class EconomicTracker:
         Returns:
             Cost in dollars for this call
         """
-        # Update session tracking
-        self.session_cost += cost
-        self.daily_cost += cost
-
-        # Update task-level tracking by channel
-        if self.current_task_id:
-            if "search" in api_name.lower() or "jina" in api_name.lower() or "tavily" in api_name.lower():
-                self.task_costs["search_api"] += cost
-            elif "ocr" in api_name.lower():
-                self.task_costs["ocr_api"] += cost
-            else:
-                self.task_costs["other_api"] += cost
-
-            # Store detailed flat-rate API call info (no immediate logging)
-            self.task_token_details["api_calls"].append({
-                "timestamp": datetime.now().isoformat(),
-                "api_name": api_name,
-                "pricing_model": "flat_rate",
-                "cost": cost
-            })
-
-        # Update totals
-        self.total_token_cost += cost
-        self.current_balance -= cost
-
-        return cost
+        with self._lock:
+            # Update session tracking
+            self.session_cost += cost
+            self.daily_cost += cost
+
+            # Update task-level tracking by channel
+            if self.current_task_id:
+                if "search" in api_name.lower() or "jina" in api_name.lower() or "tavily" in api_name.lower():
+                    self.task_costs["search_api"] += cost
+                elif "ocr" in api_name.lower():
+                    self.task_costs["ocr_api"] += cost
+                else:
+                    self.task_costs["other_api"] += cost
+
+                # Store detailed flat-rate API call info (no immediate logging)
+                self.task_token_details["api_call_count"] += 1
+                self.task_token_details["flat_rate_calls"] += 1
+                self._append_call_detail(self.task_token_details["api_calls"], {
+                    "timestamp": datetime.now().isoformat(),
+                    "api_name": api_name,
+                    "pricing_model": "flat_rate",
+                    "cost": cost
+                })
+
+            # Update totals
+            self.total_token_cost += cost
+            self.current_balance -= cost
+
+            return cost
+
+    def _append_call_detail(self, calls: List[Dict], detail: Dict) -> None:
+        """Append a call detail, keeping only the most recent max_call_details"""
+        calls.append(detail)
+        if len(calls) > self.max_call_details:
+            del calls[:len(calls) - self.max_call_details]
 
     # Note: Individual logging methods removed - now using consolidated task records
     # All token and API usage is tracked in memory during task execution
@@ -284,18 +325,15 @@ class EconomicTracker:
         if not self.current_task_id:
             return
 
-        # Calculate aggregated token counts
-        total_input_tokens = sum(call["input_tokens"] for call in self.task_token_details.get("llm_calls", []))
-        total_output_tokens = sum(call["output_tokens"] for call in self.task_token_details.get("llm_calls", []))
-        llm_call_count = len(self.task_token_details.get("llm_calls", []))
-
-        # Calculate API call stats
-        api_calls = self.task_token_details.get("api_calls", [])
-        api_call_count = len(api_calls)
+        # Aggregated token counts (running totals, independent of the detail cap)
+        details = self.task_token_details
+        total_input_tokens = details.get("input_tokens", 0)
+        total_output_tokens = details.get("output_tokens", 0)
+        llm_call_count = details.get("llm_call_count", 0)
 
-        # Separate API calls by pricing model
-        token_based_api_calls = [call for call in api_calls if call.get("pricing_model") == "per_token"]
-        flat_rate_api_calls = [call for call in api_calls if call.get("pricing_model") == "flat_rate"]
+        # API call stats
+        api_calls = details.get("api_calls", [])
+        api_call_count = details.get("api_call_count", 0)
 
         # Calculate total costs by channel
         total_task_cost = sum(self.task_costs.values())
@@ -317,7 +355,8 @@ class EconomicTracker:
                 "total_cost": self.task_costs.get("llm_tokens", 0.0),
                 "input_price_per_1m": self.input_token_price,
                 "output_price_per_1m": self.output_token_price,
-                "calls_detail": self.task_token_details.get("llm_calls", [])
+                "calls_detail": details.get("llm_calls", []),
+                "calls_detail_omitted": llm_call_count - len(details.get("llm_calls", []))
             },
 
             # API usage summary
@@ -326,9 +365,10 @@ class EconomicTracker:
                 "search_api_cost": self.task_costs.get("search_api", 0.0),
                 "ocr_api_cost": self.task_costs.get("ocr_api", 0.0),
                 "other_api_cost": self.task_costs.get("other_api", 0.0),
-                "token_based_calls": len(token_based_api_calls),
-                "flat_rate_calls": len(flat_rate_api_calls),
-                "calls_detail": api_calls
+                "token_based_calls": details.get("token_based_calls", 0),
+                "flat_rate_calls": details.get("flat_rate_calls", 0),
+                "calls_detail": api_calls,
+                "calls_detail_omitted": api_call_count - len(api_calls)
             },
 
             # Overall summary
@@ -346,8 +386,7 @@ class EconomicTracker:
             "daily_cost": self.daily_cost
         }
 
-        with open(self.token_costs_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(task_record) + "\n")
+        self._writer.write_record(self.token_costs_file, task_record)
 
     def add_work_income(
         self, 
@@ -411,8 +450,7 @@ class EconomicTracker:
             "balance_after": self.current_balance
         }
         
-        with open(self.token_costs_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        self._writer.write_record(self.token_costs_file, log_entry)
 
     def add_trading_profit(self, profit: float, description: str = "") -> None:
         """
@@ -453,6 +491,8 @@ class EconomicTracker:
             trading_profit_delta=trading_profit,
             completed_tasks=completed_tasks or []
         )
+        self._writer.flush(self.balance_file)
+        self._writer.flush(self.token_costs_file)
 
         # Reset daily tracking
         self.daily_cost = 0.0
@@ -498,8 +538,7 @@ class EconomicTracker:
         self.daily_first_task_start = None
         self.daily_last_task_end = None
 
-        with open(self.balance_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(record) + "\n")
+        self._writer.write_record(self.balance_file, record)
 
     def get_balance(self) -> float:
         """Get current balance"""
@@ -570,6 +609,7 @@ class EconomicTracker:
         Returns:
             Dictionary with cost breakdown by channel, date, and task
         """
+        self._writer.flush(self.token_costs_file)
         if not os.path.exists(self.token_costs_file):
             return {
                 "total_costs": {"llm_tokens": 0.0, "search_api": 0.0, "ocr_api": 0.0, "other_api": 0.0, "total": 0.0},
@@ -680,6 +720,7 @@ class EconomicTracker:
         Returns:
             Dictionary with costs by channel and totals
         """
+        self._writer.flush(self.token_costs_file)
         if not os.path.exists(self.token_costs_file):
             return {}
         
@@ -720,6 +761,7 @@ class EconomicTracker:
         Returns:
             Dictionary with daily metrics including tasks, costs by channel, income
         """
+        self._writer.flush(self.token_costs_file)
         if not os.path.exists(self.token_costs_file):
             return {}
         
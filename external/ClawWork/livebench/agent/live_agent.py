@@ -4,8 +4,11 @@ LiveAgent - Main agent class for LiveBench with decision-making framework
 
 import os
 import json
+import time
 import asyncio
 import ast
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from pathlib import Path
@@ -34,6 +37,7 @@ from prompts.live_agent_prompt import (
     STOP_SIGNAL
 )
 from livebench.utils.logger import LiveBenchLogger, set_global_logger
+from livebench.utils.extraction_cache import get_extraction_cache
 
 # Load environment variables
 load_dotenv()
@@ -51,6 +55,28 @@ class LiveAgent:
     5. Survival management
     """
 
+    # Cheap in-process tools that run directly on the event loop
+    INLINE_TOOLS = frozenset({"decide_activity", "learn", "get_status"})
+
+    # Tools with no ordering dependencies on each other; consecutive calls to
+    # these within one model response are executed in parallel
+    PARALLEL_SAFE_TOOLS = frozenset({"search_web", "read_webpage", "read_file", "get_status"})
+
+    # Tools that change economic state. A timeout cannot stop the worker
+    # thread, so an abandoned call could still be paid after the task ended
+    # (or twice if resubmitted); these always run to completion.
+    UNTIMED_TOOLS = frozenset({"submit_work"})
+
+    # Per-tool timeouts in seconds (other tools use DEFAULT_TOOL_TIMEOUT)
+    DEFAULT_TOOL_TIMEOUTS = {
+        "execute_code_sandbox": 600.0,
+        "create_video": 600.0,
+        "read_file": 300.0,
+        "search_web": 90.0,
+        "read_webpage": 90.0,
+    }
+    DEFAULT_TOOL_TIMEOUT = 300.0
+
     def __init__(
         self,
         signature: str,
@@ -81,7 +107,10 @@ class LiveAgent:
         # Tasks per day parameter
         tasks_per_day: int = 1,
         # Multimodal support parameter
-        supports_multimodal: bool = True
+        supports_multimodal: bool = True,
+        # Tool execution parameters
+        tool_workers: int = 4,
+        tool_timeouts: Optional[Dict[str, float]] = None
     ):
         """
         Initialize LiveAgent
@@ -110,6 +139,8 @@ class LiveAgent:
             meta_prompts_dir: Path to evaluation meta-prompts directory
             tasks_per_day: Number of tasks agent can work on per day
             supports_multimodal: Whether the model supports multimodal (image) inputs
+            tool_workers: Size of the thread pool used for blocking tools
+            tool_timeouts: Per-tool timeout overrides in seconds
         """
         self.signature = signature
         self.basemodel = basemodel
@@ -119,6 +150,13 @@ class LiveAgent:
         self.api_timeout = api_timeout
         self.tasks_per_day = tasks_per_day
         self.supports_multimodal = supports_multimodal
+        self.tool_timeouts = {**self.DEFAULT_TOOL_TIMEOUTS, **(tool_timeouts or {})}
+
+        # Blocking tools (LLM evaluation, web requests, OCR, video rendering)
+        # run on a thread pool so they do not stall the event loop; created
+        # lazily and shut down when run_date_range finishes
+        self.tool_workers = max(1, tool_workers)
+        self._tool_executor: Optional[ThreadPoolExecutor] = None
 
         # Set data path
         self.data_path = data_path or f"./livebench/data/agent_data/{signature}"
@@ -164,6 +202,7 @@ class LiveAgent:
         # MCP and AI components
         self.client: Optional[MultiServerMCPClient] = None
         self.tools: Optional[List] = None
+        self._tools_by_name: Dict[str, Any] = {}
         self.model: Optional[Any] = None
         self.agent: Optional[Any] = None
 
@@ -189,6 +228,10 @@ class LiveAgent:
         """Initialize agent components"""
         print(f"🚀 Initializing LiveAgent: {self.signature}")
 
+        # Re-bind the logger in the current context; when agents run
+        # concurrently each one initializes inside its own asyncio task.
+        set_global_logger(self.logger)
+
         # Initialize economic tracker
         self.economic_tracker.initialize()
 
@@ -199,6 +242,7 @@ class LiveAgent:
         from livebench.tools.direct_tools import get_all_tools, set_global_state as set_tool_state
 
         self.tools = get_all_tools()
+        self._tools_by_name = {tool.name: tool for tool in self.tools if hasattr(tool, 'name')}
         print(f"✅ Loaded {len(self.tools)} LiveBench tools")
 
         # Set tool state
@@ -458,57 +502,104 @@ class LiveAgent:
         # Track tokens
         self.economic_tracker.track_tokens(input_tokens, output_tokens)
 
+    def _get_tool_executor(self) -> ThreadPoolExecutor:
+        if self._tool_executor is None:
+            self._tool_executor = ThreadPoolExecutor(
+                max_workers=self.tool_workers,
+                thread_name_prefix=f"tools-{self.signature}"
+            )
+        return self._tool_executor
+
+    def _shutdown_tool_executor(self) -> None:
+        """Release tool threads; tools still running (timed out) are abandoned"""
+        if self._tool_executor is not None:
+            self._tool_executor.shutdown(wait=False, cancel_futures=True)
+            self._tool_executor = None
+
+    async def _invoke_tool(self, tool: Any, tool_args: Dict[str, Any]) -> Any:
+        """Invoke a tool without blocking the event loop, bounded by its timeout"""
+        if tool.name in self.UNTIMED_TOOLS:
+            timeout = None
+        else:
+            timeout = self.tool_timeouts.get(tool.name, self.DEFAULT_TOOL_TIMEOUT)
+        if getattr(tool, 'coroutine', None) is not None:
+            # Native async variant available
+            call = tool.ainvoke(tool_args)
+        elif tool.name in self.INLINE_TOOLS:
+            return tool.invoke(tool_args)
+        else:
+            # Copy the context so the worker thread sees this agent's tool state
+            loop = asyncio.get_running_loop()
+            context = contextvars.copy_context()
+            call = loop.run_in_executor(self._get_tool_executor(), context.run, tool.invoke, tool_args)
+        return await asyncio.wait_for(call, timeout=timeout)
+
     async def _execute_tool(self, tool_name: str, tool_args: Dict[str, Any]) -> Any:
         """Execute a tool by name with given arguments"""
-        # Find the tool
-        for tool in self.tools:
-            if hasattr(tool, 'name') and tool.name == tool_name:
-                try:
-                    # LangChain tools can be invoked directly
-                    result = tool.invoke(tool_args)
+        tool = self._tools_by_name.get(tool_name)
+        if tool is None:
+            error = f"Tool {tool_name} not found"
+            self.logger.terminal_print(f"   ❌ {error}")
 
-                    # Print result to console and terminal log (format for logging to avoid binary data)
-                    formatted_result = format_result_for_logging(result)
-                    self.logger.terminal_print(f"   ✅ Result: {formatted_result}")
-                    
-                    # Log successful tool execution
-                    self.logger.debug(
-                        f"Tool executed successfully: {tool_name}",
-                        context={"tool": tool_name, "args": str(tool_args)[:200]},
-                        print_console=False
-                    )
+            # Log tool not found error
+            self.logger.error(
+                f"Tool not found: {tool_name}",
+                context={
+                    "tool": tool_name,
+                    "available_tools": list(self._tools_by_name)
+                },
+                print_console=False
+            )
 
-                    return result
-                except Exception as e:
-                    error_msg = f"Error: {str(e)}"
-                    self.logger.terminal_print(f"   ❌ {error_msg}")
-                    
-                    # Log tool execution error
-                    self.logger.error(
-                        f"Tool execution failed: {tool_name}",
-                        context={"tool": tool_name, "args": tool_args},
-                        exception=e,
-                        print_console=False
-                    )
-                    
-                    import traceback
-                    traceback.print_exc()
-                    return error_msg
+            return error
 
-        error = f"Tool {tool_name} not found"
-        self.logger.terminal_print(f"   ❌ {error}")
-        
-        # Log tool not found error
-        self.logger.error(
-            f"Tool not found: {tool_name}",
-            context={
-                "tool": tool_name,
-                "available_tools": [t.name for t in self.tools if hasattr(t, 'name')]
-            },
-            print_console=False
-        )
-        
-        return error
+        start = time.perf_counter()
+        try:
+            result = await self._invoke_tool(tool, tool_args)
+            elapsed = time.perf_counter() - start
+
+            # Print result to console and terminal log (format for logging to avoid binary data)
+            formatted_result = format_result_for_logging(result)
+            self.logger.terminal_print(f"   ✅ Result ({tool_name}, {elapsed:.2f}s): {formatted_result}")
+
+            # Log successful tool execution
+            self.logger.debug(
+                f"Tool executed successfully: {tool_name}",
+                context={"tool": tool_name, "args": str(tool_args)[:200], "duration_seconds": round(elapsed, 3)},
+                print_console=False
+            )
+
+            return result
+        except Exception as e:
+            elapsed = time.perf_counter() - start
+            if isinstance(e, asyncio.TimeoutError):
+                error_msg = f"Error: Tool {tool_name} timed out after {elapsed:.0f}s"
+            else:
+                error_msg = f"Error: {str(e)}"
+            self.logger.terminal_print(f"   ❌ {error_msg} ({tool_name}, {elapsed:.2f}s)")
+
+            # Log tool execution error
+            self.logger.error(
+                f"Tool execution failed: {tool_name}",
+                context={"tool": tool_name, "args": tool_args, "duration_seconds": round(elapsed, 3)},
+                exception=e,
+                print_console=False
+            )
+
+            import traceback
+            traceback.print_exc()
+            return error_msg
+
+    def _group_tool_calls(self, tool_calls: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Split a tool-call batch into groups; consecutive parallel-safe calls share a group"""
+        groups: List[List[Dict[str, Any]]] = []
+        for tool_call in tool_calls:
+            parallel = tool_call.get('name') in self.PARALLEL_SAFE_TOOLS
+            if parallel and groups and groups[-1][0].get('name') in self.PARALLEL_SAFE_TOOLS:
+                groups[-1].append(tool_call)
+            else:
+                groups.append([tool_call])
+        return groups
 
     async def run_daily_session(self, date: str) -> Optional[str]:
         """
@@ -710,57 +801,65 @@ class LiveAgent:
                     # Add AI message
                     messages.append({"role": "assistant", "content": agent_response})
 
-                    # Execute each tool call
-                    for tool_call in response.tool_calls:
-                        tool_name = tool_call.get('name', 'unknown')
-                        tool_args = tool_call.get('args', {})
-
-                        self.logger.terminal_print(f"\n   📞 Calling: {tool_name}")
-                        self.logger.terminal_print(f"   📥 Args: {str(tool_args)[:100]}...")
-
-                        # Find and execute the tool
-                        tool_result = await self._execute_tool(tool_name, tool_args)
-
-                        # Check if activity was completed
-                        if tool_name == 'submit_work':
-                            # End task tracking
-                            self.economic_tracker.end_task()
+                    # Execute tool calls; consecutive independent calls run in parallel
+                    for group in self._group_tool_calls(response.tool_calls):
+                        for tool_call in group:
+                            self.logger.terminal_print(f"\n   📞 Calling: {tool_call.get('name', 'unknown')}")
+                            self.logger.terminal_print(f"   📥 Args: {str(tool_call.get('args', {}))[:100]}...")
+                        if len(group) > 1:
+                            self.logger.terminal_print(f"   ⚡ Running {len(group)} tool calls in parallel")
+
+                        # Find and execute the tools
+                        group_results = await asyncio.gather(*(
+                            self._execute_tool(tool_call.get('name', 'unknown'), tool_call.get('args', {}))
+                            for tool_call in group
+                        ))
+
+                        for tool_call, tool_result in zip(group, group_results):
+                            tool_name = tool_call.get('name', 'unknown')
+                            tool_args = tool_call.get('args', {})
+
+                            # Check if activity was completed
+                            if tool_name == 'submit_work':
+                                # End task tracking
+                                self.economic_tracker.end_task()
                             
-                            # Check if work was successful and extract payment
-                            result_dict = tool_result if isinstance(tool_result, dict) else {}
-                            if 'actual_payment' in result_dict or 'payment' in result_dict:
-                                try:
-                                    if not isinstance(result_dict, dict):
-                                        raw_result = str(tool_result)
-                                        try:
-                                            result_dict = json.loads(raw_result)
-                                        except (json.JSONDecodeError, TypeError):
-                                            parsed = ast.literal_eval(raw_result)
-                                            result_dict = parsed if isinstance(parsed, dict) else {}
-                                    # Use actual_payment which respects evaluation threshold
-                                    actual_payment = result_dict.get('actual_payment', result_dict.get('payment', 0))
-                                    evaluation_score = result_dict.get('evaluation_score', 0.0)
+                                # Check if work was successful and extract payment
+                                result_dict = tool_result if isinstance(tool_result, dict) else {}
+                                if 'actual_payment' in result_dict or 'payment' in result_dict:
+                                    try:
+                                        if not isinstance(result_dict, dict):
+                                            raw_result = str(tool_result)
+                                            try:
+                                                result_dict = json.loads(raw_result)
+                                            except (json.JSONDecodeError, TypeError):
+                                                parsed = ast.literal_eval(raw_result)
+                                                result_dict = parsed if isinstance(parsed, dict) else {}
+                                        # Use actual_payment which respects evaluation threshold
+                                        actual_payment = result_dict.get('actual_payment', result_dict.get('payment', 0))
+                                        evaluation_score = result_dict.get('evaluation_score', 0.0)
                                     
-                                    if actual_payment > 0:
-                                        self.daily_work_income += actual_payment
-                                        self.logger.terminal_print(f"\n   💰 Earned: ${actual_payment:.2f} (Score: {evaluation_score:.2f})")
-                                        activity_completed = True
-                                    elif evaluation_score > 0:
-                                        # Work was submitted but didn't meet quality threshold
-                                        self.logger.terminal_print(f"\n   ⚠️  Quality score {evaluation_score:.2f} below threshold - no payment")
-                                        activity_completed = True
-                                except:
-                                    pass
-                            if 'success' in str(tool_result).lower():
+                                        if actual_payment > 0:
+                                            self.daily_work_income += actual_payment
+                                            self.logger.terminal_print(f"\n   💰 Earned: ${actual_payment:.2f} (Score: {evaluation_score:.2f})")
+                                            activity_completed = True
+                                        elif evaluation_score > 0:
+                                            # Work was submitted but didn't meet quality threshold
+                                            self.logger.terminal_print(f"\n   ⚠️  Quality score {evaluation_score:.2f} below threshold - no payment")
+                                            activity_completed = True
+                                    except:
+                                        pass
+                                if 'success' in str(tool_result).lower():
+                                    activity_completed = True
+                            elif tool_name == 'learn' and 'success' in str(tool_result).lower():
                                 activity_completed = True
-                        elif tool_name == 'learn' and 'success' in str(tool_result).lower():
-                            activity_completed = True
 
-                        # Add tool result to messages (handle multimodal content)
-                        tool_message = format_tool_result_message(
-                            tool_name, tool_result, tool_args, activity_completed
-                        )
-                        messages.append(tool_message)
+                            # Add tool result to messages (handle multimodal content)
+                            tool_message = format_tool_result_message(
+                                tool_name, tool_result, tool_args, activity_completed
+                            )
+                            messages.append(tool_message)
+
                     # If activity is completed, stop the loop
                     if activity_completed:
                         self.logger.terminal_print(f"\n✅ Activity completed successfully!")
@@ -900,27 +999,30 @@ class LiveAgent:
         end = dt.strptime(end_date, "%Y-%m-%d")
 
         day_count = 0
-        while current_date <= end:
-            if current_date.weekday() < 5:  # Weekdays only
-                day_count += 1
-                date_str = current_date.strftime("%Y-%m-%d")
-
-                result = await self.run_daily_session(date_str)
-
-                # Check if no tasks available
-                if result == "NO_TASKS_AVAILABLE":
-                    print(f"\n🛑 SIMULATION ENDED - No more tasks available on {date_str}")
-                    print(f"   Completed: {day_count} days")
-                    print(f"   All available tasks have been assigned")
-                    break
+        try:
+            while current_date <= end:
+                if current_date.weekday() < 5:  # Weekdays only
+                    day_count += 1
+                    date_str = current_date.strftime("%Y-%m-%d")
+
+                    result = await self.run_daily_session(date_str)
+
+                    # Check if no tasks available
+                    if result == "NO_TASKS_AVAILABLE":
+                        print(f"\n🛑 SIMULATION ENDED - No more tasks available on {date_str}")
+                        print(f"   Completed: {day_count} days")
+                        print(f"   All available tasks have been assigned")
+                        break
 
-                # Check bankruptcy
-                if self.economic_tracker.is_bankrupt():
-                    print(f"\n💀 GAME OVER - Agent {self.signature} went bankrupt on {date_str}")
-                    print(f"   Survived: {day_count} days")
-                    break
+                    # Check bankruptcy
+                    if self.economic_tracker.is_bankrupt():
+                        print(f"\n💀 GAME OVER - Agent {self.signature} went bankrupt on {date_str}")
+                        print(f"   Survived: {day_count} days")
+                        break
 
-            current_date += timedelta(days=1)
+                current_date += timedelta(days=1)
+        finally:
+            self._shutdown_tool_executor()
 
         # Final summary
         self._print_final_summary(day_count)
@@ -939,6 +1041,13 @@ class LiveAgent:
         print(f"   Total Work Income: ${self.economic_tracker.total_work_income:.2f}")
         print(f"   Total Trading P&L: ${self.economic_tracker.total_trading_profit:.2f}")
         print(f"   Final Status: {summary['survival_status'].upper()}")
+
+        cache_stats = get_extraction_cache().stats()
+        if cache_stats['hits'] or cache_stats['misses']:
+            ocr_stats = cache_stats['by_kind'].get('ocr_page', {})
+            print(f"   Extraction Cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+                  f"({cache_stats['hit_rate']:.0%}), OCR pages reused: {ocr_stats.get('hits', 0)}, "
+                  f"OCR tokens saved: {ocr_stats.get('tokens_saved', 0)}")
         print(f"{'='*60}\n")
 
     def __str__(self) -> str:
@@ -0,0 +1,435 @@
+"""
+Artifact index for the LiveBench API
+
+Agent sandboxes hold every file an agent produced under
+<signature>/sandbox/<date>/..., and the artifacts page samples from all of
+them. Instead of walking the tree on every request, each tenant gets an
+in-memory index built once and then kept current by refresh().
+
+refresh() only stat()s directories: a directory whose mtime is unchanged is
+not listed again, so an idle tree of hundreds of thousands of files costs one
+stat per directory. Directories modified within the last few seconds are
+always rescanned, because a second change in the same mtime tick would
+otherwise go unnoticed. In-place rewrites of a file do not touch its
+directory, so the stored size can lag until the file is served.
+
+Rows live in a compact columnar table (names plus typed arrays) and are
+grouped into (agent, date, extension) buckets, so a random sample of `count`
+artifacts - optionally filtered by agent, date and extension - costs
+O(count) plus the number of matching buckets, independent of index size.
+"""
+
+import bisect
+import itertools
+import os
+import random
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+
+# Extension ids are positions in this tuple
+ARTIFACT_EXTENSIONS = ('.docx', '.pdf', '.pptx', '.xlsx')
+_EXTENSION_IDS = {ext: i for i, ext in enumerate(ARTIFACT_EXTENSIONS)}
+
+# Subtrees of a date directory that hold scratch files rather than deliverables
+SKIP_DIRS = frozenset({'code_exec', 'videos', 'reference_files'})
+
+# Directory depth below the data path: <signature>/sandbox/<date>
+_DEPTH_AGENT = 1
+_DEPTH_DATE = 3
+
+# Directories modified more recently than this are rescanned on every refresh
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def _extension(name: str) -> str:
+    return os.path.splitext(name)[1].lower()
+
+
+def is_indexable(rel_path: str) -> bool:
+    """True if rel_path (relative to the data path) is where artifacts are indexed"""
+    parts = rel_path.split("/")
+    return (
+        len(parts) > _DEPTH_DATE
+        and parts[1] == "sandbox"
+        and all(parts)
+        and not any(p in SKIP_DIRS for p in parts[_DEPTH_DATE:-1])
+        and _extension(parts[-1]) in _EXTENSION_IDS
+    )
+
+
+def parse_byte_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range "Range: bytes=..." header.
+
+    Returns:
+        (start, end) inclusive, or None to send the whole file (no header,
+        multiple ranges or a malformed value, which RFC 9110 says to ignore)
+
+    Raises:
+        ValueError: If the range cannot be satisfied (respond 416)
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    first, last = first.strip(), last.strip()
+    if not sep or not (first or last) or not all(v.isdigit() for v in (first, last) if v):
+        return None
+    if not first:
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise ValueError("Unsatisfiable suffix range")
+        return max(0, size - suffix), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size:
+        raise ValueError("Range start beyond end of file")
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+class ArtifactIndex:
+    """Indexed view of every artifact under one tenant's agent data path"""
+
+    def __init__(self, data_path: Path, racy_window_ns: int = RACY_WINDOW_NS):
+        self.data_path = Path(data_path)
+        self._root = str(self.data_path)
+        self.racy_window_ns = racy_window_ns
+        self.built = False
+        self.last_refresh_sec = 0.0
+        self.dirs_scanned = 0  # directories listed by the last refresh
+
+        self._lock = threading.Lock()          # guards the row table
+        self._refresh_lock = threading.Lock()  # serializes refreshes
+        # rel dir -> (mtime_ns or -1 when racy, tracked subdirectory names)
+        self._tree: Dict[str, Tuple[int, Tuple[str, ...]]] = {}
+
+        # Interned strings
+        self._dirs: List[str] = []
+        self._dir_ids: Dict[str, int] = {}
+        self._agents: List[str] = []
+        self._agent_ids: Dict[str, int] = {}
+        self._dates: List[str] = []
+        self._date_ids: Dict[str, int] = {}
+
+        # Row table; rows are dense (removal swaps the last row in)
+        self._names: List[str] = []
+        self._dir = array("I")
+        self._size = array("q")
+        self._bucket = array("I")
+        self._bpos = array("I")  # position of the row within its bucket
+        self._dir_rows: Dict[int, Dict[str, int]] = {}
+
+        # (agent_id, date_id, ext_id) buckets and their per-dimension groups
+        self._bucket_keys: List[Tuple[int, int, int]] = []
+        self._bucket_ids: Dict[Tuple[int, int, int], int] = {}
+        self._bucket_rows: List[array] = []
+        self._buckets_by_agent: Dict[int, Set[int]] = {}
+        self._buckets_by_date: Dict[int, Set[int]] = {}
+        self._buckets_by_ext: Dict[int, Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    # ------------------------------------------------------------------
+    # Row table
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _intern(value: str, values: List[str], ids: Dict[str, int]) -> int:
+        i = ids.get(value)
+        if i is None:
+            i = len(values)
+            values.append(value)
+            ids[value] = i
+        return i
+
+    def _bucket_for(self, rel_dir: str, ext_id: int) -> int:
+        parts = rel_dir.split("/")
+        agent_id = self._intern(parts[0], self._agents, self._agent_ids)
+        date_id = self._intern(parts[2], self._dates, self._date_ids)
+        key = (agent_id, date_id, ext_id)
+        b = self._bucket_ids.get(key)
+        if b is None:
+            b = len(self._bucket_keys)
+            self._bucket_keys.append(key)
+            self._bucket_ids[key] = b
+            self._bucket_rows.append(array("I"))
+            self._buckets_by_agent.setdefault(agent_id, set()).add(b)
+            self._buckets_by_date.setdefault(date_id, set()).add(b)
+            self._buckets_by_ext.setdefault(ext_id, set()).add(b)
+        return b
+
+    def _add_row(self, rel_dir: str, name: str, size: int) -> None:
+        dir_id = self._intern(rel_dir, self._dirs, self._dir_ids)
+        rows = self._dir_rows.setdefault(dir_id, {})
+        existing = rows.get(name)
+        if existing is not None:
+            self._size[existing] = size
+            return
+        b = self._bucket_for(rel_dir, _EXTENSION_IDS[_extension(name)])
+        row = len(self._names)
+        self._names.append(name)
+        self._dir.append(dir_id)
+        self._size.append(size)
+        self._bucket.append(b)
+        self._bpos.append(len(self._bucket_rows[b]))
+        self._bucket_rows[b].append(row)
+        rows[name] = row
+
+    def _remove_row(self, row: int) -> None:
+        # Swap-remove from the bucket
+        bucket_rows = self._bucket_rows[self._bucket[row]]
+        pos = self._bpos[row]
+        moved = bucket_rows.pop()
+        if pos < len(bucket_rows):
+            bucket_rows[pos] = moved
+            self._bpos[moved] = pos
+        del self._dir_rows[self._dir[row]][self._names[row]]
+
+        # Swap-remove from the table, re-pointing the moved row
+        last = len(self._names) - 1
+        if row != last:
+            self._names[row] = self._names[last]
+            self._dir[row] = self._dir[last]
+            self._size[row] = self._size[last]
+            self._bucket[row] = self._bucket[last]
+            self._bpos[row] = self._bpos[last]
+            self._dir_rows[self._dir[row]][self._names[row]] = row
+            self._bucket_rows[self._bucket[row]][self._bpos[row]] = row
+        self._names.pop()
+        self._dir.pop()
+        self._size.pop()
+        self._bucket.pop()
+        self._bpos.pop()
+
+    def _find(self, rel_path: str) -> Optional[int]:
+        rel_dir, _, name = rel_path.rpartition("/")
+        dir_id = self._dir_ids.get(rel_dir)
+        if dir_id is None:
+            return None
+        return self._dir_rows.get(dir_id, {}).get(name)
+
+    def _entry(self, row: int) -> dict:
+        agent_id, date_id, ext_id = self._bucket_keys[self._bucket[row]]
+        name = self._names[row]
+        return {
+            "agent": self._agents[agent_id],
+            "date": self._dates[date_id],
+            "filename": name,
+            "extension": ARTIFACT_EXTENSIONS[ext_id],
+            "size_bytes": self._size[row],
+            "path": f"{self._dirs[self._dir[row]]}/{name}",
+        }
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+
+    def _scan(self, rel_dir: str, depth: int) -> Tuple[List[str], Dict[str, int]]:
+        """List one directory: (tracked subdirectories, artifact name -> size)"""
+        subdirs: List[str] = []
+        files: Dict[str, int] = {}
+        path = os.path.join(self._root, rel_dir) if rel_dir else self._root
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if depth == _DEPTH_AGENT and entry.name != "sandbox":
+                            continue
+                        if depth >= _DEPTH_DATE and entry.name in SKIP_DIRS:
+                            continue
+                        subdirs.append(entry.name)
+                    elif (
+                        depth >= _DEPTH_DATE
+                        and _extension(entry.name) in _EXTENSION_IDS
+                        and entry.is_file(follow_symlinks=False)
+                    ):
+                        files[entry.name] = entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+        return subdirs, files
+
+    def _drop_tree(self, rel_dir: str) -> int:
+        """Forget a directory that disappeared, with everything below it"""
+        removed = 0
+        stack = [rel_dir]
+        while stack:
+            current = stack.pop()
+            node = self._tree.pop(current, None)
+            if node is not None:
+                stack.extend(f"{current}/{d}" if current else d for d in node[1])
+            with self._lock:
+                dir_id = self._dir_ids.get(current)
+                rows = self._dir_rows.get(dir_id) if dir_id is not None else None
+                while rows:
+                    self._remove_row(next(iter(rows.values())))
+                    removed += 1
+        return removed
+
+    def _sync_dir(self, rel_dir: str, files: Dict[str, int]) -> Tuple[int, int]:
+        with self._lock:
+            dir_id = self._dir_ids.get(rel_dir)
+            current = self._dir_rows.get(dir_id, {}) if dir_id is not None else {}
+            added = sum(1 for name in files if name not in current)
+            gone = [name for name in current if name not in files]
+            for name in gone:
+                # Look the row up each time: removals renumber the moved row
+                self._remove_row(current[name])
+            for name, size in files.items():
+                self._add_row(rel_dir, name, size)
+        return added, len(gone)
+
+    def refresh(self) -> Tuple[int, int]:
+        """
+        Bring the index up to date with the filesystem (the first call builds it)
+
+        Returns:
+            (artifacts added, artifacts removed)
+        """
+        with self._refresh_lock:
+            start = time.perf_counter()
+            added = removed = scanned = 0
+            racy_before = time.time_ns() - self.racy_window_ns
+            stack: List[Tuple[str, int]] = [("", 0)]
+            while stack:
+                rel_dir, depth = stack.pop()
+                path = os.path.join(self._root, rel_dir) if rel_dir else self._root
+                old = self._tree.get(rel_dir)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    removed += self._drop_tree(rel_dir)
+                    continue
+
+                if old is not None and old[0] == st.st_mtime_ns:
+                    subdirs = old[1]
+                else:
+                    try:
+                        subdirs, files = self._scan(rel_dir, depth)
+                    except OSError:
+                        removed += self._drop_tree(rel_dir)
+                        continue
+                    scanned += 1
+                    if old is not None:
+                        for name in set(old[1]) - set(subdirs):
+                            removed += self._drop_tree(f"{rel_dir}/{name}" if rel_dir else name)
+                    stamp = st.st_mtime_ns if st.st_mtime_ns < racy_before else -1
+                    self._tree[rel_dir] = (stamp, tuple(subdirs))
+                    if depth >= _DEPTH_DATE:
+                        a, r = self._sync_dir(rel_dir, files)
+                        added += a
+                        removed += r
+                stack.extend((f"{rel_dir}/{d}" if rel_dir else d, depth + 1) for d in subdirs)
+
+            self.built = True
+            self.dirs_scanned = scanned
+            self.last_refresh_sec = time.perf_counter() - start
+            return added, removed
+
+    def ensure_built(self) -> None:
+        if not self.built:
+            self.refresh()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _matching_buckets(
+        self,
+        agent: Optional[str],
+        date: Optional[str],
+        extension: Optional[str]
+    ) -> List[int]:
+        groups = []
+        wanted = [None, None, None]
+        for dim, (value, ids, by) in enumerate((
+            (agent, self._agent_ids, self._buckets_by_agent),
+            (date, self._date_ids, self._buckets_by_date),
+            (extension, _EXTENSION_IDS, self._buckets_by_ext),
+        )):
+            if value is None:
+                continue
+            value_id = ids.get(value)
+            if value_id is None:
+                return []
+            wanted[dim] = value_id
+            groups.append(by.get(value_id, ()))
+        smallest = min(groups, key=len)
+        return [
+            b for b in smallest
+            if self._bucket_rows[b]
+            and all(w is None or w == k for w, k in zip(wanted, self._bucket_keys[b]))
+        ]
+
+    def sample(
+        self,
+        count: int,
+        agent: Optional[str] = None,
+        date: Optional[str] = None,
+        extension: Optional[str] = None
+    ) -> List[dict]:
+        """Uniform random sample (without replacement) of up to count artifacts"""
+        with self._lock:
+            if agent is None and date is None and extension is None:
+                n = len(self._names)
+                rows = random.sample(range(n), min(count, n))
+            else:
+                buckets = self._matching_buckets(agent, date, extension)
+                prefix = list(itertools.accumulate(len(self._bucket_rows[b]) for b in buckets))
+                total = prefix[-1] if prefix else 0
+                rows = []
+                for offset in random.sample(range(total), min(count, total)):
+                    i = bisect.bisect_right(prefix, offset)
+                    start = prefix[i - 1] if i else 0
+                    rows.append(self._bucket_rows[buckets[i]][offset - start])
+            return [self._entry(row) for row in rows]
+
+    def lookup(self, rel_path: str) -> Optional[dict]:
+        """Indexed artifact at rel_path (relative to the data path), if any"""
+        with self._lock:
+            row = self._find(rel_path)
+            return self._entry(row) if row is not None else None
+
+    def record(self, rel_path: str, size: int) -> None:
+        """Add or update one artifact observed outside a refresh (e.g. when served)"""
+        if not is_indexable(rel_path):
+            return
+        rel_dir, _, name = rel_path.rpartition("/")
+        with self._lock:
+            self._add_row(rel_dir, name, size)
+
+    def discard(self, rel_path: str) -> None:
+        """Drop an artifact that turned out to be missing"""
+        with self._lock:
+            row = self._find(rel_path)
+            if row is not None:
+                self._remove_row(row)
+
+
+_indexes: Dict[str, ArtifactIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_artifact_index(data_path: Path) -> ArtifactIndex:
+    """Return the shared ArtifactIndex for a tenant data path (built lazily)"""
+    key = str(Path(data_path))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = ArtifactIndex(Path(data_path))
+            _indexes[key] = index
+        return index
+
+
+def artifact_indexes() -> List[ArtifactIndex]:
+    """Every index created so far"""
+    with _indexes_lock:
+        return list(_indexes.values())
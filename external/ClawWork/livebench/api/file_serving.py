@@ -0,0 +1,122 @@
+"""
+Artifact file responses for the LiveBench API
+
+Serves a file (or a single byte range of it, for PDF viewers and resumed
+downloads) without loading it into memory. When the ASGI server advertises
+the "http.response.zerocopysend" extension the open file is handed over so
+the server can sendfile() it. Otherwise the file is streamed in chunks read
+with pread() off the event loop. Either way the bytes come from a descriptor
+opened with O_NOFOLLOW, never from re-opening the path, and the headers are
+rebuilt from that descriptor's fstat() if the file changed since it was
+stat()ed. A file that shrinks mid-response aborts it instead of ending the
+body short of its content-length.
+"""
+
+import hashlib
+import os
+from email.utils import formatdate
+from typing import Optional
+
+import anyio
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+from livebench.api.artifact_index import parse_byte_range
+
+
+class ArtifactFileResponse(Response):
+    """File response with Range/If-Range support and zero-copy sending"""
+
+    chunk_size = 256 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        stat_result: os.stat_result,
+        media_type: str,
+        range_header: Optional[str] = None,
+        if_range: Optional[str] = None,
+    ):
+        self.path = str(path)
+        self.background = None
+        self._media_type = media_type
+        self._range_header = range_header
+        self._if_range = if_range
+        self._prepare(stat_result)
+
+    def _prepare(self, stat_result: os.stat_result) -> None:
+        """Status, range and headers for the file as described by stat_result"""
+        self.stat_result = stat_result
+        self.media_type = self._media_type
+        self.size = stat_result.st_size
+
+        etag_base = f"{stat_result.st_mtime}-{self.size}".encode()
+        etag = f'"{hashlib.md5(etag_base, usedforsecurity=False).hexdigest()}"'
+        last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+        headers = {"accept-ranges": "bytes", "etag": etag, "last-modified": last_modified}
+
+        byte_range = None
+        if self._if_range is None or self._if_range.strip() in (etag, last_modified):
+            try:
+                byte_range = parse_byte_range(self._range_header, self.size)
+            except ValueError:
+                self.status_code = 416
+                self.media_type = None
+                self.offset = self.count = 0
+                headers.update({"content-range": f"bytes */{self.size}", "content-length": "0"})
+                self.init_headers(headers)
+                return
+
+        if byte_range is None:
+            self.status_code = 200
+            self.offset, self.count = 0, self.size
+        else:
+            start, end = byte_range
+            self.status_code = 206
+            self.offset, self.count = start, end - start + 1
+            headers["content-range"] = f"bytes {start}-{end}/{self.size}"
+        headers["content-length"] = str(self.count)
+        self.init_headers(headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        extensions = scope.get("extensions") or {}
+        send_body = self.count > 0 and scope.get("method") != "HEAD"
+        # The caller passes a resolved path; refuse a symlink swapped in since
+        flags = os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0)
+        fd = await anyio.to_thread.run_sync(os.open, self.path, flags) if send_body else None
+        try:
+            if fd is not None:
+                # The headers must describe the file actually opened: if it
+                # changed since the caller's stat, rebuild them from the fd
+                current = os.fstat(fd)
+                if (current.st_size, current.st_mtime_ns) != (self.stat_result.st_size, self.stat_result.st_mtime_ns):
+                    self._prepare(current)
+                    send_body = self.count > 0
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            if not send_body:
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+            elif "http.response.zerocopysend" in extensions:
+                with os.fdopen(fd, "rb", closefd=False) as f:
+                    await send({
+                        "type": "http.response.zerocopysend",
+                        "file": f,
+                        "offset": self.offset,
+                        "count": self.count,
+                        "more_body": False,
+                    })
+            else:
+                offset, remaining = self.offset, self.count
+                while remaining > 0:
+                    chunk = await anyio.to_thread.run_sync(os.pread, fd, min(self.chunk_size, remaining), offset)
+                    if not chunk:
+                        # Shrank mid-response: abort rather than end a body
+                        # shorter than the advertised content-length
+                        raise RuntimeError(f"{self.path} shrank while it was being sent")
+                    offset += len(chunk)
+                    remaining -= len(chunk)
+                    await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+        finally:
+            if fd is not None:
+                os.close(fd)
+        if self.background is not None:
+            await self.background()
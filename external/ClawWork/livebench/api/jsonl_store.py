@@ -0,0 +1,403 @@
+"""
+Incremental JSONL read layer for the LiveBench API
+
+Agent data files (balance.jsonl, decisions.jsonl, evaluations.jsonl,
+tasks.jsonl, token_costs.jsonl) are append-only. Instead of re-reading them
+on every request, each file is tailed from a remembered byte offset and only
+newly appended lines are parsed. Per-agent aggregates (latest balance and
+decision, evaluation score sum and count, spend) are kept in memory for the
+hot endpoints. Full histories are only held for the endpoints that return
+them, in a bounded LRU of views that are tailed the same way.
+
+If a file shrinks, is replaced (new inode) or is rewritten in place (same
+size with a new mtime, or changed bytes at its start or just before the read
+offset), the aggregates are rebuilt from scratch.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# Bytes fingerprinted at the start of a file and just before the read offset
+# to detect in-place rewrites that keep the inode
+_FINGERPRINT_BYTES = 256
+
+
+def _parse_record(raw_line: bytes) -> Optional[dict]:
+    raw_line = raw_line.strip()
+    if not raw_line:
+        return None
+    try:
+        record = json.loads(raw_line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return record if isinstance(record, dict) else None
+
+
+class JsonlTail:
+    """Reads complete JSONL records appended to a file since the last call"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.reset()
+
+    def reset(self) -> None:
+        self.offset = 0
+        self._inode: Optional[int] = None
+        self._size: Optional[int] = None
+        self._mtime_ns: Optional[int] = None
+        self._head = b""  # first bytes of the file
+        self._tail = b""  # last consumed bytes, ending at offset
+
+    def _remember(self, st: os.stat_result) -> None:
+        self._inode = st.st_ino
+        self._size = st.st_size
+        self._mtime_ns = st.st_mtime_ns
+
+    def _consumed(self, chunk: bytes) -> None:
+        if self.offset < _FINGERPRINT_BYTES:
+            self._head = (self._head + chunk)[:_FINGERPRINT_BYTES]
+        self._tail = (self._tail + chunk[-_FINGERPRINT_BYTES:])[-_FINGERPRINT_BYTES:]
+        self.offset += len(chunk)
+
+    def _unchanged_before_offset(self, f) -> bool:
+        """Whether the consumed prefix still starts and ends with the same bytes"""
+        if f.read(len(self._head)) != self._head:
+            return False
+        f.seek(self.offset - len(self._tail))
+        return f.read(len(self._tail)) == self._tail
+
+    def seek_to_end(self) -> None:
+        """Skip existing content so only records appended from now on are returned"""
+        self.reset()
+        try:
+            st = os.stat(self.path)
+            with open(self.path, "rb") as f:
+                head = f.read(_FINGERPRINT_BYTES)
+                # Stop after the last complete line so a record that is
+                # still being written is returned once it is finished.
+                block_start = max(0, st.st_size - 65536)
+                f.seek(block_start)
+                block = f.read(st.st_size - block_start)
+        except OSError:
+            return
+        end = block.rfind(b"\n")
+        if end < 0 and block_start > 0:
+            # Very long trailing line; fall back to consuming it normally.
+            self.read_new()
+            return
+        self._remember(st)
+        self.offset = block_start + end + 1
+        self._head = head[:self.offset]
+        self._tail = block[:end + 1][-_FINGERPRINT_BYTES:]
+
+    def read_new(self) -> Tuple[bool, List[dict]]:
+        """
+        Parse lines appended since the previous call.
+
+        A final line without a trailing newline is returned once the file has
+        kept the same size and mtime across two calls and the line parses.
+
+        Returns:
+            (reset, records) - reset is True when the file was truncated,
+            rotated or rewritten and previously returned records are stale.
+        """
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            was_read = self.offset > 0 or self._inode is not None
+            self.reset()
+            return was_read, []
+
+        stable = st.st_size == self._size and st.st_mtime_ns == self._mtime_ns
+        reset = False
+        if self._inode is not None and (
+            st.st_ino != self._inode
+            or st.st_size < self.offset
+            # Appends always grow the file; same size with a new mtime is a rewrite
+            or (st.st_size == self._size and st.st_mtime_ns != self._mtime_ns)
+        ):
+            self.reset()
+            reset = True
+        self._remember(st)
+
+        if st.st_size == self.offset:
+            return reset, []
+
+        with open(self.path, "rb") as f:
+            if self.offset > 0 and not self._unchanged_before_offset(f):
+                self.reset()
+                self._remember(st)
+                reset = True
+                stable = False
+            f.seek(self.offset)
+            data = f.read(st.st_size - self.offset)
+
+        # Only consume complete lines; a partially written record is picked
+        # up on a later call once its newline lands (or the file settles).
+        end = data.rfind(b"\n")
+        records = []
+        if end >= 0:
+            chunk = data[:end + 1]
+            self._consumed(chunk)
+            for raw_line in chunk.split(b"\n"):
+                record = _parse_record(raw_line)
+                if record is not None:
+                    records.append(record)
+        if stable and end + 1 < len(data):
+            record = _parse_record(data[end + 1:])
+            if record is not None:
+                self._consumed(data[end + 1:])
+                records.append(record)
+        return reset, records
+
+
+def _leaderboard_point(record: dict) -> Optional[dict]:
+    if record.get("date") == "initialization":
+        return None
+    return {
+        "date": record.get("date"),
+        "balance": record.get("balance", 0),
+        "task_completion_time_seconds": record.get("task_completion_time_seconds"),
+    }
+
+
+# name -> (file under the agent directory, projection; None keeps the record,
+# a projection returning None skips it)
+HISTORY_VIEWS: Dict[str, Tuple[str, Optional[Callable[[dict], Any]]]] = {
+    "balance": ("economic/balance.jsonl", None),
+    "decisions": ("decisions/decisions.jsonl", None),
+    "tasks": ("work/tasks.jsonl", None),
+    "evaluations": ("work/evaluations.jsonl", None),
+    "evaluation_scores": ("work/evaluations.jsonl", lambda r: r.get("evaluation_score")),
+}
+
+
+class HistoryView:
+    """Every (projected) record of one JSONL file, kept current by tailing it"""
+
+    def __init__(self, path: Path, project: Optional[Callable[[dict], Any]] = None):
+        self._tail = JsonlTail(path)
+        self._project = project
+        self._lock = threading.Lock()
+        self.items: List[Any] = []
+
+    def refresh(self) -> List[Any]:
+        """Return the up-to-date list (shared; callers must not mutate it)"""
+        with self._lock:
+            reset, records = self._tail.read_new()
+            if reset:
+                # New list so responses still holding the old one stay intact
+                self.items = []
+            for record in records:
+                item = record if self._project is None else self._project(record)
+                if item is not None:
+                    self.items.append(item)
+            return self.items
+
+
+class HistoryCache:
+    """LRU of HistoryViews, so only recently requested histories stay in memory"""
+
+    def __init__(self, max_views: int = 128):
+        self.max_views = max(1, max_views)
+        self._lock = threading.Lock()
+        self._views: "OrderedDict[Tuple[str, str], HistoryView]" = OrderedDict()
+
+    def get(self, agent_dir: Path, name: str) -> List[Any]:
+        relative_path, project = HISTORY_VIEWS[name]
+        key = (str(agent_dir), name)
+        with self._lock:
+            view = self._views.get(key)
+            if view is None:
+                view = HistoryView(Path(agent_dir) / relative_path, project)
+                self._views[key] = view
+                while len(self._views) > self.max_views:
+                    self._views.popitem(last=False)
+            else:
+                self._views.move_to_end(key)
+        return view.refresh()
+
+
+_history_cache: Optional[HistoryCache] = None
+_history_cache_lock = threading.Lock()
+
+
+def get_history_cache() -> HistoryCache:
+    """Shared history LRU sized by CLAWWORK_HISTORY_CACHE_VIEWS (128)"""
+    global _history_cache
+    with _history_cache_lock:
+        if _history_cache is None:
+            _history_cache = HistoryCache(int(os.getenv("CLAWWORK_HISTORY_CACHE_VIEWS", "128")))
+        return _history_cache
+
+
+class AgentStore:
+    """In-memory aggregates for a single agent directory"""
+
+    def __init__(self, agent_dir: Path):
+        self.agent_dir = Path(agent_dir)
+        self._lock = threading.Lock()
+        self._balance_tail = JsonlTail(self.agent_dir / "economic" / "balance.jsonl")
+        self._decision_tail = JsonlTail(self.agent_dir / "decisions" / "decisions.jsonl")
+        self._evaluation_tail = JsonlTail(self.agent_dir / "work" / "evaluations.jsonl")
+        self._token_cost_tail = JsonlTail(self.agent_dir / "economic" / "token_costs.jsonl")
+        self._clear_balance()
+        self._clear_decisions()
+        self._clear_evaluations()
+        self._clear_token_costs()
+
+    # ------------------------------------------------------------------
+    # Aggregate state
+    # ------------------------------------------------------------------
+
+    def _clear_balance(self) -> None:
+        self.initial_balance: Optional[dict] = None
+        self.latest_balance: Optional[dict] = None
+        # Stripped per-day points for the leaderboard, which is requested for
+        # every agent at once and so must not go through the history LRU
+        self.leaderboard_points: List[dict] = []
+
+    def _clear_decisions(self) -> None:
+        self.latest_decision: Optional[dict] = None
+
+    def _clear_evaluations(self) -> None:
+        self.num_evaluations = 0
+        self.evaluation_score_sum = 0.0
+
+    def _clear_token_costs(self) -> None:
+        self.spend_by_date: Dict[str, float] = {}
+        self.spend_by_month: Dict[str, float] = {}
+
+    def _apply_balance(self, record: dict) -> None:
+        if self.initial_balance is None:
+            self.initial_balance = record
+        self.latest_balance = record
+        point = _leaderboard_point(record)
+        if point is not None:
+            self.leaderboard_points.append(point)
+
+    def _apply_decision(self, record: dict) -> None:
+        self.latest_decision = record
+
+    def _apply_evaluation(self, record: dict) -> None:
+        score = record.get("evaluation_score")
+        if score is not None:
+            self.num_evaluations += 1
+            self.evaluation_score_sum += score
+
+    def _apply_token_cost(self, record: dict) -> None:
+        record_date = str(record.get("date") or "")
+        try:
+            cost = float((record.get("cost_summary") or {}).get("total_cost") or 0.0)
+        except (TypeError, ValueError):
+            return
+        self.spend_by_date[record_date] = self.spend_by_date.get(record_date, 0.0) + cost
+        month = record_date[:7]
+        self.spend_by_month[month] = self.spend_by_month.get(month, 0.0) + cost
+
+    def refresh(self) -> None:
+        """Fold newly appended records from every tracked file into the aggregates"""
+        with self._lock:
+            for tail, clear, apply in (
+                (self._balance_tail, self._clear_balance, self._apply_balance),
+                (self._decision_tail, self._clear_decisions, self._apply_decision),
+                (self._evaluation_tail, self._clear_evaluations, self._apply_evaluation),
+                (self._token_cost_tail, self._clear_token_costs, self._apply_token_cost),
+            ):
+                reset, records = tail.read_new()
+                if reset:
+                    # The file changed underneath us; records were re-read
+                    # from offset 0, so rebuild the aggregate from scratch.
+                    clear()
+                for record in records:
+                    apply(record)
+
+    # ------------------------------------------------------------------
+    # Read accessors
+    # ------------------------------------------------------------------
+
+    @property
+    def avg_evaluation_score(self) -> Optional[float]:
+        if not self.num_evaluations:
+            return None
+        return self.evaluation_score_sum / self.num_evaluations
+
+    def spend_usage(self, today: str) -> Tuple[float, float]:
+        """Return (daily, monthly) spend in USD for the given YYYY-MM-DD date"""
+        return self.spend_by_date.get(today, 0.0), self.spend_by_month.get(today[:7], 0.0)
+
+    def leaderboard_entry(self) -> Optional[dict]:
+        """Leaderboard row from the running aggregates, or None without balance data"""
+        latest = self.latest_balance
+        if latest is None:
+            return None
+        initial_balance = self.initial_balance.get("balance", 0)
+        current_balance = latest.get("balance", 0)
+        pct_change = ((current_balance - initial_balance) / initial_balance * 100) if initial_balance else 0
+        return {
+            "signature": self.agent_dir.name,
+            "initial_balance": initial_balance,
+            "current_balance": current_balance,
+            "pct_change": round(pct_change, 1),
+            "total_token_cost": latest.get("total_token_cost", 0),
+            "total_work_income": latest.get("total_work_income", 0),
+            "net_worth": latest.get("net_worth", 0),
+            "survival_status": latest.get("survival_status", "unknown"),
+            "num_tasks": self.num_evaluations,
+            "avg_eval_score": self.avg_evaluation_score,
+            # Balance history stripped to essential fields, excluding initialization
+            "balance_history": self.leaderboard_points,
+        }
+
+    def history(self, name: str) -> List[Any]:
+        """Full history for one of HISTORY_VIEWS, from the shared LRU (do not mutate)"""
+        return get_history_cache().get(self.agent_dir, name)
+
+
+class TenantStore:
+    """AgentStores for every agent directory under a tenant's data path"""
+
+    def __init__(self, data_path: Path):
+        self.data_path = Path(data_path)
+        self._lock = threading.Lock()
+        self._agents: Dict[str, AgentStore] = {}
+
+    def agent(self, signature: str) -> AgentStore:
+        """Return the refreshed store for one agent"""
+        with self._lock:
+            store = self._agents.get(signature)
+            if store is None:
+                store = AgentStore(self.data_path / signature)
+                self._agents[signature] = store
+        store.refresh()
+        return store
+
+    def agents(self) -> List[AgentStore]:
+        """Return refreshed stores for every agent directory, dropping removed ones"""
+        if not self.data_path.exists():
+            return []
+        signatures = [p.name for p in self.data_path.iterdir() if p.is_dir()]
+        with self._lock:
+            for stale in set(self._agents) - set(signatures):
+                del self._agents[stale]
+        return [self.agent(signature) for signature in signatures]
+
+
+_tenant_stores: Dict[str, TenantStore] = {}
+_tenant_stores_lock = threading.Lock()
+
+
+def get_tenant_store(data_path: Path) -> TenantStore:
+    """Return the shared TenantStore for a tenant data path"""
+    key = str(Path(data_path))
+    with _tenant_stores_lock:
+        store = _tenant_stores.get(key)
+        if store is None:
+            store = TenantStore(Path(data_path))
+            _tenant_stores[key] = store
+        return store
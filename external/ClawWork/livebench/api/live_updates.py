@@ -0,0 +1,428 @@
+"""
+Live update pipeline for the LiveBench API
+
+Watches tenant agent data for appended balance and decision records and
+fans them out to WebSocket clients. On Linux, changes are picked up through
+inotify; elsewhere (or when inotify is unavailable) files are polled with
+stat(). Each file is tailed from a saved offset, so every appended record is
+broadcast rather than just the last line.
+
+Each client gets a bounded send queue drained by its own task, so one slow
+client cannot hold up the others. When a queue is full, a queued update of
+the same type for the same agent is replaced by the newer one; otherwise the
+oldest queued message is dropped.
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import os
+import struct
+import sys
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+from livebench.api.jsonl_store import JsonlTail
+
+
+# (subdirectory, filename) under an agent directory -> broadcast message type
+WATCHED_FILES: Dict[Tuple[str, str], str] = {
+    ("economic", "balance.jsonl"): "balance_update",
+    ("decisions", "decisions.jsonl"): "activity_update",
+}
+_WATCHED_SUBDIRS = {subdir for subdir, _ in WATCHED_FILES}
+_MERGEABLE_TYPES = set(WATCHED_FILES.values())
+
+# Directory depth below the tenants root at which each level lives:
+# <tenant_key>/agent_data/<signature>/<subdir>/<file>
+_DEPTH_TENANT = 1
+_DEPTH_AGENT_DATA = 2
+_DEPTH_AGENT = 3
+_DEPTH_SUBDIR = 4
+
+
+def _merge_key(message: dict) -> Optional[Tuple[str, str]]:
+    msg_type = message.get("type")
+    signature = message.get("signature")
+    if msg_type in _MERGEABLE_TYPES and signature:
+        return msg_type, signature
+    return None
+
+
+class ClientChannel:
+    """Bounded outbound queue for one WebSocket, drained by its own task"""
+
+    def __init__(
+        self,
+        websocket: Any,
+        tenant_key: str,
+        max_queue: int = 256,
+        send_timeout: float = 10.0,
+        on_close: Optional[Callable[["ClientChannel"], None]] = None,
+    ):
+        self.websocket = websocket
+        self.tenant_key = tenant_key
+        self.max_queue = max(1, max_queue)
+        self.send_timeout = send_timeout
+        self._on_close = on_close
+        self._queue: Deque[dict] = deque()
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.sent = 0
+        self.merged = 0
+        self.dropped = 0
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._drain())
+
+    def close(self) -> None:
+        if self._task and self._task is not asyncio.current_task():
+            self._task.cancel()
+        self._task = None
+
+    def offer(self, message: dict) -> None:
+        """Queue a message without waiting; merges or drops when the queue is full"""
+        if len(self._queue) >= self.max_queue:
+            key = _merge_key(message)
+            if key is not None:
+                for index, queued in enumerate(self._queue):
+                    if _merge_key(queued) == key:
+                        del self._queue[index]
+                        self.merged += 1
+                        break
+            if len(self._queue) >= self.max_queue:
+                self._queue.popleft()
+                self.dropped += 1
+        self._queue.append(message)
+        self._ready.set()
+
+    async def _drain(self) -> None:
+        try:
+            while True:
+                if not self._queue:
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+                message = self._queue.popleft()
+                await asyncio.wait_for(self.websocket.send_json(message), timeout=self.send_timeout)
+                self.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Send failed or timed out: the client is gone or too slow to keep.
+            if self._on_close:
+                self._on_close(self)
+
+
+class _WatchError(OSError):
+    """Raised when an inotify watch cannot be added (e.g. watch limit reached)"""
+
+
+class _Inotify:
+    """Minimal ctypes binding for Linux inotify (no third-party dependency)"""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+
+    WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+    _EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, libc: Any, fd: int):
+        self._libc = libc
+        self.fd = fd
+        self._dirs_by_wd: Dict[int, Path] = {}
+        self._watched: Set[Path] = set()
+
+    @classmethod
+    def create(cls) -> Optional["_Inotify"]:
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        return cls(libc, fd)
+
+    def add_watch(self, path: Path) -> None:
+        if path in self._watched:
+            return
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(str(path)), self.WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR):
+                return
+            raise _WatchError(err, os.strerror(err), str(path))
+        self._dirs_by_wd[wd] = path
+        self._watched.add(path)
+
+    def read_events(self) -> Iterator[Tuple[Optional[Path], int]]:
+        """Yield (path, mask) for pending events; path is None on queue overflow"""
+        while True:
+            try:
+                buf = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _, name_len = self._EVENT_HEADER.unpack_from(buf, offset)
+                offset += self._EVENT_HEADER.size
+                name = buf[offset:offset + name_len].rstrip(b"\0")
+                offset += name_len
+                if mask & self.IN_Q_OVERFLOW:
+                    yield None, mask
+                    continue
+                directory = self._dirs_by_wd.get(wd)
+                if mask & self.IN_IGNORED:
+                    if directory is not None:
+                        del self._dirs_by_wd[wd]
+                        self._watched.discard(directory)
+                    continue
+                if directory is None:
+                    continue
+                yield (directory / os.fsdecode(name)) if name else directory, mask
+
+    def close(self) -> None:
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+class LiveUpdatePipeline:
+    """Tails watched agent files under a tenants root and publishes appended records"""
+
+    def __init__(
+        self,
+        tenants_root: Path,
+        publish: Callable[[dict, str], None],
+        mode: str = "auto",
+        poll_interval: float = 1.0,
+    ):
+        """
+        Args:
+            tenants_root: Directory containing <tenant_key>/agent_data/<signature>/...
+            publish: Called with (message, tenant_key) for every appended record
+            mode: "auto" (inotify when available), "inotify" or "poll"
+            poll_interval: Seconds between stat() scans in polling mode
+        """
+        self.tenants_root = Path(tenants_root)
+        self.publish = publish
+        self.mode = mode
+        self.poll_interval = poll_interval
+        self.active_mode: Optional[str] = None
+        self._tails: Dict[Path, JsonlTail] = {}
+        self._stats: Dict[Path, Tuple[int, int, int]] = {}
+
+    # ------------------------------------------------------------------
+    # File discovery and tailing
+    # ------------------------------------------------------------------
+
+    def _classify(self, path: Path) -> Optional[Tuple[str, str, str]]:
+        """Return (tenant_key, signature, message_type) for a watched file"""
+        try:
+            parts = path.relative_to(self.tenants_root).parts
+        except ValueError:
+            return None
+        if len(parts) != 5 or parts[1] != "agent_data":
+            return None
+        msg_type = WATCHED_FILES.get((parts[3], parts[4]))
+        if msg_type is None:
+            return None
+        return parts[0], parts[2], msg_type
+
+    def _iter_dirs(self, root: Path, depth: int) -> Iterator[Tuple[Path, int]]:
+        """Yield (directory, depth) for every directory that can hold watched files"""
+        try:
+            if not root.is_dir():
+                return
+        except OSError:
+            return
+        yield root, depth
+        if depth >= _DEPTH_SUBDIR:
+            return
+        try:
+            children = list(root.iterdir())
+        except OSError:
+            return
+        for child in children:
+            if depth == _DEPTH_TENANT and child.name != "agent_data":
+                continue
+            if depth == _DEPTH_AGENT and child.name not in _WATCHED_SUBDIRS:
+                continue
+            yield from self._iter_dirs(child, depth + 1)
+
+    def _iter_files(self, root: Path, depth: int) -> Iterator[Path]:
+        for directory, dir_depth in self._iter_dirs(root, depth):
+            if dir_depth != _DEPTH_SUBDIR:
+                continue
+            for (subdir, filename) in WATCHED_FILES:
+                if directory.name == subdir:
+                    path = directory / filename
+                    if path.is_file():
+                        yield path
+
+    def _watchable_depth(self, path: Path) -> int:
+        """Return the depth of a directory that can hold watched files, or -1"""
+        try:
+            parts = path.relative_to(self.tenants_root).parts
+        except ValueError:
+            return -1
+        depth = len(parts)
+        if depth > _DEPTH_SUBDIR:
+            return -1
+        if depth >= _DEPTH_AGENT_DATA and parts[1] != "agent_data":
+            return -1
+        if depth == _DEPTH_SUBDIR and parts[3] not in _WATCHED_SUBDIRS:
+            return -1
+        return depth
+
+    def prime(self) -> None:
+        """Start tailing existing files at their current end"""
+        for path in self._iter_files(self.tenants_root, 0):
+            tail = JsonlTail(path)
+            tail.seek_to_end()
+            self._tails[path] = tail
+            self._stats[path] = self._stat_key(path)
+
+    def process(self, path: Path) -> int:
+        """Publish records appended to a watched file; returns the number published"""
+        info = self._classify(path)
+        if info is None:
+            return 0
+        tenant_key, signature, msg_type = info
+        tail = self._tails.get(path)
+        if tail is None:
+            tail = JsonlTail(path)
+            self._tails[path] = tail
+        reset, records = tail.read_new()
+        if reset:
+            # File was rewritten: publish only its current latest state.
+            records = records[-1:]
+        for record in records:
+            self.publish({"type": msg_type, "signature": signature, "data": record}, tenant_key)
+        return len(records)
+
+    # ------------------------------------------------------------------
+    # Watch loops
+    # ------------------------------------------------------------------
+
+    async def run(self) -> None:
+        self.prime()
+        inotify = None
+        if self.mode in ("auto", "inotify"):
+            inotify = _Inotify.create()
+            if inotify is None and self.mode == "inotify":
+                print("inotify unavailable; falling back to polling for live updates")
+        if inotify is not None:
+            try:
+                await self._run_inotify(inotify)
+                return
+            except _WatchError as e:
+                print(f"inotify watch failed ({e}); falling back to polling for live updates")
+            finally:
+                inotify.close()
+        await self._run_polling()
+
+    @staticmethod
+    def _stat_key(path: Path) -> Tuple[int, int, int]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return (-1, -1, -1)
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def poll_once(self) -> int:
+        """Stat every watched file once and tail the ones that changed"""
+        published = 0
+        for path in self._iter_files(self.tenants_root, 0):
+            key = self._stat_key(path)
+            if self._stats.get(path) != key:
+                self._stats[path] = key
+                published += self.process(path)
+        return published
+
+    async def _run_polling(self) -> None:
+        self.active_mode = "poll"
+        while True:
+            try:
+                self.poll_once()
+            except Exception as e:
+                print(f"Error watching files: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+    def _watch_tree(self, inotify: _Inotify, root: Path) -> List[Path]:
+        """Add watches below root; returns watched files already present"""
+        found: List[Path] = []
+        root_depth = self._watchable_depth(root)
+        if root_depth < 0:
+            return found
+        for directory, depth in self._iter_dirs(root, root_depth):
+            inotify.add_watch(directory)
+            if depth == _DEPTH_SUBDIR:
+                found.extend(
+                    directory / filename
+                    for (subdir, filename) in WATCHED_FILES
+                    if subdir == directory.name and (directory / filename).is_file()
+                )
+        return found
+
+    async def _run_inotify(self, inotify: _Inotify) -> None:
+        self.tenants_root.mkdir(parents=True, exist_ok=True)
+        self._watch_tree(inotify, self.tenants_root)
+        self.active_mode = "inotify"
+
+        loop = asyncio.get_running_loop()
+        pending: Set[Path] = set()
+        wakeup = asyncio.Event()
+        rescan = False
+
+        def on_readable() -> None:
+            nonlocal rescan
+            for path, mask in inotify.read_events():
+                if path is None:
+                    rescan = True
+                elif mask & _Inotify.IN_ISDIR:
+                    pending.add(path)
+                elif self._classify(path) is not None:
+                    pending.add(path)
+            if pending or rescan:
+                wakeup.set()
+
+        loop.add_reader(inotify.fd, on_readable)
+        try:
+            while True:
+                await wakeup.wait()
+                wakeup.clear()
+                batch = list(pending)
+                pending.clear()
+                try:
+                    if rescan:
+                        # Kernel queue overflowed: re-sync every watch and file.
+                        rescan = False
+                        self._watch_tree(inotify, self.tenants_root)
+                        batch = list(self._iter_files(self.tenants_root, 0))
+                    for path in batch:
+                        if self._classify(path) is not None:
+                            self.process(path)
+                        else:
+                            # New directory: watch it and pick up files that
+                            # were created before the watch was in place.
+                            for found in self._watch_tree(inotify, path):
+                                self.process(found)
+                except _WatchError:
+                    raise
+                except Exception as e:
+                    print(f"Error watching files: {e}")
+        finally:
+            loop.remove_reader(inotify.fd)
@@ -10,7 +10,6 @@ This FastAPI server provides:
 import os
 import json
 import asyncio
-import random
 import secrets
 import time
 import hashlib
@@ -21,7 +20,6 @@ from pathlib import Path
 from collections import deque
 from typing import Deque, Dict, List, Optional, Tuple
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Query, Depends, Header, Request
-from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import glob
@@ -30,13 +28,28 @@ import tempfile
 import uuid
 import sys
 import signal
+import stat
 
 from contextlib import asynccontextmanager
 
+# Add project root to path so livebench.* imports resolve when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from livebench.api.artifact_index import (
+    ARTIFACT_EXTENSIONS,
+    artifact_indexes,
+    get_artifact_index,
+    is_indexable,
+)
+from livebench.api.file_serving import ArtifactFileResponse
+from livebench.api.jsonl_store import get_tenant_store
+from livebench.api.live_updates import ClientChannel, LiveUpdatePipeline
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Start background tasks
     asyncio.create_task(watch_agent_files())
+    asyncio.create_task(maintain_artifact_indexes())
     yield
     # Clean up (if needed)
 
@@ -85,6 +98,11 @@ RATE_LIMIT_WINDOW_SEC = int(os.getenv("CLAWWORK_RATE_LIMIT_WINDOW_SEC", "60"))
 READ_RATE_LIMIT = int(os.getenv("CLAWWORK_READ_RATE_LIMIT", "240"))
 WRITE_RATE_LIMIT = int(os.getenv("CLAWWORK_WRITE_RATE_LIMIT", "60"))
 MAX_TERMINAL_LOG_BYTES = int(os.getenv("CLAWWORK_MAX_TERMINAL_LOG_BYTES", "262144"))
+WATCH_MODE = os.getenv("CLAWWORK_WATCH_MODE", "auto").strip().lower()
+WATCH_POLL_INTERVAL_SEC = float(os.getenv("CLAWWORK_WATCH_POLL_INTERVAL_SEC", "1.0"))
+WS_SEND_QUEUE_SIZE = int(os.getenv("CLAWWORK_WS_SEND_QUEUE_SIZE", "256"))
+WS_SEND_TIMEOUT_SEC = float(os.getenv("CLAWWORK_WS_SEND_TIMEOUT_SEC", "10"))
+ARTIFACT_INDEX_REFRESH_SEC = float(os.getenv("CLAWWORK_ARTIFACT_INDEX_REFRESH_SEC", "5"))
 ALLOWED_ENV_VAR_KEYS = set(
     _parse_csv_env(
         "CLAWWORK_ALLOWED_ENV_KEYS",
@@ -167,28 +185,11 @@ def _calculate_spend_usage(agent_dir: Path) -> Tuple[float, float]:
     if not token_costs_path.exists():
         return 0.0, 0.0
     today = datetime.utcnow().strftime("%Y-%m-%d")
-    month_prefix = today[:7]
-    daily = 0.0
-    monthly = 0.0
     try:
-        with open(token_costs_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    record = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                record_date = str(record.get("date") or "")
-                cost = float((record.get("cost_summary") or {}).get("total_cost") or 0.0)
-                if record_date.startswith(month_prefix):
-                    monthly += cost
-                if record_date == today:
-                    daily += cost
+        store = get_tenant_store(agent_dir.parent).agent(agent_dir.name)
     except Exception:
         return 0.0, 0.0
-    return daily, monthly
+    return store.spend_usage(today)
 
 
 def _spawn_simulation_process(config_path: str, log_path: str, env: Optional[dict] = None) -> subprocess.Popen:
@@ -445,24 +446,41 @@ class EconomicMetrics(BaseModel):
 # WebSocket Connection Manager
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: Dict[WebSocket, str] = {}
+        self.active_connections: Dict[WebSocket, ClientChannel] = {}
 
     async def connect(self, websocket: WebSocket, tenant_key: str):
         await websocket.accept()
-        self.active_connections[websocket] = tenant_key
+        channel = ClientChannel(
+            websocket,
+            tenant_key,
+            max_queue=WS_SEND_QUEUE_SIZE,
+            send_timeout=WS_SEND_TIMEOUT_SEC,
+            on_close=lambda ch: self.disconnect(ch.websocket),
+        )
+        self.active_connections[websocket] = channel
+        channel.start()
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.pop(websocket, None)
+        channel = self.active_connections.pop(websocket, None)
+        if channel:
+            channel.close()
+
+    def send(self, websocket: WebSocket, message: dict):
+        """Queue a message for a single client"""
+        channel = self.active_connections.get(websocket)
+        if channel:
+            channel.offer(message)
+
+    def publish(self, message: dict, tenant_key: Optional[str] = None):
+        """Queue message for every matching client without waiting on any socket"""
+        for channel in list(self.active_connections.values()):
+            if tenant_key and channel.tenant_key != tenant_key:
+                continue
+            channel.offer(message)
 
     async def broadcast(self, message: dict, tenant_key: Optional[str] = None):
         """Broadcast message to all connected clients"""
-        for connection, connection_tenant in list(self.active_connections.items()):
-            if tenant_key and connection_tenant != tenant_key:
-                continue
-            try:
-                await connection.send_json(message)
-            except:
-                pass
+        self.publish(message, tenant_key=tenant_key)
 
 
 manager = ConnectionManager()
@@ -912,53 +930,37 @@ async def get_agents(request: Request, _: None = Depends(require_read_auth)):
         }
 
     seen_signatures = set()
-    for agent_dir in data_path.iterdir():
-        if agent_dir.is_dir():
-            signature = agent_dir.name
-            seen_signatures.add(signature)
-
-            # Get latest balance
-            balance_file = agent_dir / "economic" / "balance.jsonl"
-            balance_data = None
-            if balance_file.exists():
-                with open(balance_file, 'r') as f:
-                    lines = f.readlines()
-                    if lines:
-                        balance_data = json.loads(lines[-1])
-
-            # Get latest decision
-            decision_file = agent_dir / "decisions" / "decisions.jsonl"
-            current_activity = None
-            current_date = None
-            if decision_file.exists():
-                with open(decision_file, 'r') as f:
-                    lines = f.readlines()
-                    if lines:
-                        decision = json.loads(lines[-1])
-                        current_activity = decision.get("activity")
-                        current_date = decision.get("date")
-
-            sim_candidates = running_by_signature.get(signature, [])
-            sim = sim_candidates[0] if sim_candidates else None
-            is_running = sim is not None
-            sim_id = sim.get("id") if sim else None
-            if sim_id:
-                consumed_sim_ids.add(sim_id)
-
-            if balance_data or is_running:
-                latest = latest_by_signature.get(signature) or {}
-                agents.append({
-                    "signature": signature,
-                    "balance": (balance_data or {}).get("balance", 0),
-                    "net_worth": (balance_data or {}).get("net_worth", 0),
-                    "survival_status": (balance_data or {}).get("survival_status", "unknown"),
-                    "current_activity": current_activity or ("Starting simulation" if is_running else None),
-                    "current_date": current_date,
-                    "total_token_cost": (balance_data or {}).get("total_token_cost", 0),
-                    "is_running": is_running,
-                    "simulation_id": sim_id,
-                    "model": latest.get("model"),
-                })
+    for store in get_tenant_store(data_path).agents():
+        signature = store.agent_dir.name
+        seen_signatures.add(signature)
+
+        # Latest balance and decision come from the incremental store
+        balance_data = store.latest_balance
+        decision = store.latest_decision or {}
+        current_activity = decision.get("activity")
+        current_date = decision.get("date")
+
+        sim_candidates = running_by_signature.get(signature, [])
+        sim = sim_candidates[0] if sim_candidates else None
+        is_running = sim is not None
+        sim_id = sim.get("id") if sim else None
+        if sim_id:
+            consumed_sim_ids.add(sim_id)
+
+        if balance_data or is_running:
+            latest = latest_by_signature.get(signature) or {}
+            agents.append({
+                "signature": signature,
+                "balance": (balance_data or {}).get("balance", 0),
+                "net_worth": (balance_data or {}).get("net_worth", 0),
+                "survival_status": (balance_data or {}).get("survival_status", "unknown"),
+                "current_activity": current_activity or ("Starting simulation" if is_running else None),
+                "current_date": current_date,
+                "total_token_cost": (balance_data or {}).get("total_token_cost", 0),
+                "is_running": is_running,
+                "simulation_id": sim_id,
+                "model": latest.get("model"),
+            })
 
     for sim in running_simulations:
         sim_id = sim.get("id")
@@ -993,41 +995,12 @@ async def get_agent_details(signature: str, request: Request, _: None = Depends(
     if not agent_dir.exists():
         raise HTTPException(status_code=404, detail="Agent not found")
 
-    # Get balance history
-    balance_file = agent_dir / "economic" / "balance.jsonl"
-    balance_history = []
-    if balance_file.exists():
-        with open(balance_file, 'r') as f:
-            for line in f:
-                balance_history.append(json.loads(line))
-
-    # Get decisions
-    decision_file = agent_dir / "decisions" / "decisions.jsonl"
-    decisions = []
-    if decision_file.exists():
-        with open(decision_file, 'r') as f:
-            for line in f:
-                decisions.append(json.loads(line))
-
-    # Get evaluation statistics
-    evaluations_file = agent_dir / "work" / "evaluations.jsonl"
-    avg_evaluation_score = None
-    evaluation_scores = []
-    
-    if evaluations_file.exists():
-        with open(evaluations_file, 'r') as f:
-            for line in f:
-                eval_data = json.loads(line)
-                score = eval_data.get("evaluation_score")
-                if score is not None:
-                    evaluation_scores.append(score)
-        
-        if evaluation_scores:
-            avg_evaluation_score = sum(evaluation_scores) / len(evaluation_scores)
-    
+    store = get_tenant_store(data_path).agent(signature)
+    avg_evaluation_score = store.avg_evaluation_score
+
     # Get latest status
-    latest_balance = balance_history[-1] if balance_history else {}
-    latest_decision = decisions[-1] if decisions else {}
+    latest_balance = store.latest_balance or {}
+    latest_decision = store.latest_decision or {}
 
     return {
         "signature": signature,
@@ -1040,11 +1013,12 @@ async def get_agent_details(signature: str, request: Request, _: None = Depends(
             "current_activity": latest_decision.get("activity"),
             "current_date": latest_decision.get("date"),
             "avg_evaluation_score": avg_evaluation_score,  # Average 0.0-1.0 score
-            "num_evaluations": len(evaluation_scores)
+            "num_evaluations": store.num_evaluations
         },
-        "balance_history": balance_history,
-        "decisions": decisions,
-        "evaluation_scores": evaluation_scores  # List of all scores
+        # Full histories come from the shared LRU of tailed views
+        "balance_history": store.history("balance"),
+        "decisions": store.history("decisions"),
+        "evaluation_scores": store.history("evaluation_scores")  # List of all scores
     }
 
 
@@ -1058,24 +1032,10 @@ async def get_agent_tasks(signature: str, request: Request, _: None = Depends(re
     if not agent_dir.exists():
         raise HTTPException(status_code=404, detail="Agent not found")
 
-    tasks_file = agent_dir / "work" / "tasks.jsonl"
-    evaluations_file = agent_dir / "work" / "evaluations.jsonl"
-
-    tasks = []
-    if tasks_file.exists():
-        with open(tasks_file, 'r') as f:
-            for line in f:
-                tasks.append(json.loads(line))
-
-    # Load evaluations indexed by task_id
-    evaluations = {}
-    if evaluations_file.exists():
-        with open(evaluations_file, 'r') as f:
-            for line in f:
-                eval_data = json.loads(line)
-                task_id = eval_data.get("task_id")
-                if task_id:
-                    evaluations[task_id] = eval_data
+    store = get_tenant_store(data_path).agent(signature)
+    # Copy task records so the merge below does not mutate cached state
+    tasks = [dict(task) for task in store.history("tasks")]
+    evaluations = {e["task_id"]: e for e in store.history("evaluations") if e.get("task_id")}
 
     # Merge tasks with evaluations
     for task in tasks:
@@ -1186,20 +1146,14 @@ async def get_agent_economic(signature: str, request: Request, _: None = Depends
     if not balance_file.exists():
         raise HTTPException(status_code=404, detail="No economic data found")
 
-    dates = []
-    balance_history = []
-    token_costs = []
-    work_income = []
+    store = get_tenant_store(data_path).agent(signature)
+    records = store.history("balance")
+    dates = [data.get("date", "") for data in records]
+    balance_history = [data.get("balance", 0) for data in records]
+    token_costs = [data.get("daily_token_cost", 0) for data in records]
+    work_income = [data.get("work_income_delta", 0) for data in records]
 
-    with open(balance_file, 'r') as f:
-        for line in f:
-            data = json.loads(line)
-            dates.append(data.get("date", ""))
-            balance_history.append(data.get("balance", 0))
-            token_costs.append(data.get("daily_token_cost", 0))
-            work_income.append(data.get("work_income_delta", 0))
-
-    latest = json.loads(line) if line else {}
+    latest = store.latest_balance or {}
 
     return {
         "balance": latest.get("balance", 0),
@@ -1223,67 +1177,11 @@ async def get_leaderboard(request: Request, _: None = Depends(require_read_auth)
 
     agents = []
 
-    for agent_dir in data_path.iterdir():
-        if not agent_dir.is_dir():
-            continue
-
-        signature = agent_dir.name
-
-        # Load balance history
-        balance_file = agent_dir / "economic" / "balance.jsonl"
-        balance_history = []
-        if balance_file.exists():
-            with open(balance_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        balance_history.append(json.loads(line))
-
-        if not balance_history:
-            continue
-
-        latest = balance_history[-1]
-        initial_balance = balance_history[0].get("balance", 0)
-        current_balance = latest.get("balance", 0)
-        pct_change = ((current_balance - initial_balance) / initial_balance * 100) if initial_balance else 0
-
-        # Load evaluation scores
-        evaluations_file = agent_dir / "work" / "evaluations.jsonl"
-        evaluation_scores = []
-        if evaluations_file.exists():
-            with open(evaluations_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        eval_data = json.loads(line)
-                        score = eval_data.get("evaluation_score")
-                        if score is not None:
-                            evaluation_scores.append(score)
-
-        avg_eval_score = (sum(evaluation_scores) / len(evaluation_scores)) if evaluation_scores else None
-
-        # Strip balance history to essential fields, exclude initialization
-        stripped_history = [
-            {
-                "date": entry.get("date"),
-                "balance": entry.get("balance", 0),
-                "task_completion_time_seconds": entry.get("task_completion_time_seconds"),
-            }
-            for entry in balance_history
-            if entry.get("date") != "initialization"
-        ]
-
-        agents.append({
-            "signature": signature,
-            "initial_balance": initial_balance,
-            "current_balance": current_balance,
-            "pct_change": round(pct_change, 1),
-            "total_token_cost": latest.get("total_token_cost", 0),
-            "total_work_income": latest.get("total_work_income", 0),
-            "net_worth": latest.get("net_worth", 0),
-            "survival_status": latest.get("survival_status", "unknown"),
-            "num_tasks": len(evaluation_scores),
-            "avg_eval_score": avg_eval_score,
-            "balance_history": stripped_history,
-        })
+    for store in get_tenant_store(data_path).agents():
+        # Built from running aggregates; no balance file is re-read
+        entry = store.leaderboard_entry()
+        if entry is not None:
+            agents.append(entry)
 
     # Sort by current_balance descending
     agents.sort(key=lambda a: a["current_balance"], reverse=True)
@@ -1291,7 +1189,6 @@ async def get_leaderboard(request: Request, _: None = Depends(require_read_auth)
     return {"agents": agents}
 
 
-ARTIFACT_EXTENSIONS = {'.pdf', '.docx', '.xlsx', '.pptx'}
 ARTIFACT_MIME_TYPES = {
     '.pdf': 'application/pdf',
     '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
@@ -1304,48 +1201,27 @@ ARTIFACT_MIME_TYPES = {
 async def get_random_artifacts(
     request: Request,
     count: int = Query(default=30, ge=1, le=100),
+    agent: Optional[str] = Query(default=None),
+    date: Optional[str] = Query(default=None),
+    extension: Optional[str] = Query(default=None),
     _: None = Depends(require_read_auth),
 ):
-    """Get a random sample of agent-produced artifact files"""
-    data_path = _get_tenant_paths(request)["data_path"]
-    if not data_path.exists():
-        return {"artifacts": []}
+    """Get a random sample of agent-produced artifact files, optionally filtered"""
+    if agent is not None:
+        agent = _validate_agent_signature(agent)
+    if extension is not None:
+        extension = extension.strip().lower()
+        if not extension.startswith("."):
+            extension = "." + extension
+        if extension not in ARTIFACT_EXTENSIONS:
+            raise HTTPException(status_code=400, detail="Unsupported artifact type")
 
-    artifacts = []
-    for agent_dir in data_path.iterdir():
-        if not agent_dir.is_dir():
-            continue
-        sandbox_dir = agent_dir / "sandbox"
-        if not sandbox_dir.exists():
-            continue
-        signature = agent_dir.name
-        for date_dir in sandbox_dir.iterdir():
-            if not date_dir.is_dir():
-                continue
-            for file_path in date_dir.rglob("*"):
-                if not file_path.is_file():
-                    continue
-                # Skip code_exec, videos, and reference_files directories
-                rel_parts = file_path.relative_to(date_dir).parts
-                if any(p in ('code_exec', 'videos', 'reference_files') for p in rel_parts):
-                    continue
-                ext = file_path.suffix.lower()
-                if ext not in ARTIFACT_EXTENSIONS:
-                    continue
-                rel_path = str(file_path.relative_to(data_path))
-                artifacts.append({
-                    "agent": signature,
-                    "date": date_dir.name,
-                    "filename": file_path.name,
-                    "extension": ext,
-                    "size_bytes": file_path.stat().st_size,
-                    "path": rel_path,
-                })
-
-    if len(artifacts) > count:
-        artifacts = random.sample(artifacts, count)
+    index = get_artifact_index(_get_tenant_paths(request)["data_path"])
+    if not index.built:
+        # First request for a tenant created after startup
+        await asyncio.to_thread(index.ensure_built)
 
-    return {"artifacts": artifacts}
+    return {"artifacts": index.sample(count, agent=agent, date=date, extension=extension)}
 
 
 @app.get("/api/artifacts/file")
@@ -1354,7 +1230,7 @@ async def get_artifact_file(
     path: str = Query(...),
     _: None = Depends(require_read_auth),
 ):
-    """Serve an artifact file for preview/download"""
+    """Serve an artifact file for preview/download (supports Range requests)"""
     if not path or "\x00" in path:
         raise HTTPException(status_code=400, detail="Invalid path")
 
@@ -1362,20 +1238,50 @@ async def get_artifact_file(
     if requested_path.is_absolute() or ".." in requested_path.parts:
         raise HTTPException(status_code=400, detail="Invalid path")
 
-    data_root = _get_tenant_paths(request)["data_path"].resolve()
+    data_path = _get_tenant_paths(request)["data_path"]
+    index = get_artifact_index(data_path)
+    rel_path = requested_path.as_posix()
+
+    # Always check the resolved path: an indexed file may have been replaced
+    # by a symlink since the index last saw it
+    data_root = data_path.resolve()
     file_path = (data_root / requested_path).resolve()
     # Ensure resolved path is within DATA_PATH
     if file_path != data_root and data_root not in file_path.parents:
+        index.discard(rel_path)
         raise HTTPException(status_code=403, detail="Access denied")
 
-    if not file_path.exists() or not file_path.is_file():
-        raise HTTPException(status_code=404, detail="File not found")
+    # The index only vouches for files reached without going through symlinks
+    direct = file_path == data_root / rel_path
+    indexed = direct and index.lookup(rel_path) is not None
+    if not indexed:
+        index.discard(rel_path)
+        # Not indexed (created since the last refresh, or outside a sandbox)
+        if not file_path.is_file():
+            raise HTTPException(status_code=404, detail="File not found")
+        if file_path.suffix.lower() not in ARTIFACT_EXTENSIONS:
+            raise HTTPException(status_code=400, detail="Unsupported artifact type")
+        indexed = direct and is_indexable(rel_path)
 
-    ext = file_path.suffix.lower()
-    if ext not in ARTIFACT_EXTENSIONS:
-        raise HTTPException(status_code=400, detail="Unsupported artifact type")
-    media_type = ARTIFACT_MIME_TYPES.get(ext, 'application/octet-stream')
-    return FileResponse(file_path, media_type=media_type)
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        index.discard(rel_path)
+        raise HTTPException(status_code=404, detail="File not found")
+    if not stat.S_ISREG(st.st_mode):
+        index.discard(rel_path)
+        raise HTTPException(status_code=404, detail="File not found")
+    if indexed:
+        index.record(rel_path, st.st_size)  # also corrects sizes of rewritten files
+
+    media_type = ARTIFACT_MIME_TYPES.get(file_path.suffix.lower(), 'application/octet-stream')
+    return ArtifactFileResponse(
+        file_path,
+        st,
+        media_type=media_type,
+        range_header=request.headers.get("range"),
+        if_range=request.headers.get("if-range"),
+    )
 
 
 @app.get("/api/settings/hidden-agents")
@@ -1444,7 +1350,7 @@ async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket, tenant_key=tenant_key)
     try:
         # Send initial connection message
-        await websocket.send_json({
+        manager.send(websocket, {
             "type": "connected",
             "message": "Connected to LiveBench real-time updates"
         })
@@ -1453,11 +1359,13 @@ async def websocket_endpoint(websocket: WebSocket):
         while True:
             data = await websocket.receive_text()
             # Echo back for now, in production this would handle commands
-            await websocket.send_json({
+            manager.send(websocket, {
                 "type": "echo",
                 "data": data
             })
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(websocket)
 
 
@@ -1476,74 +1384,34 @@ async def broadcast_message(request: Request, message: dict, _: None = Depends(r
 # File watcher for live updates (optional, for when agents are running)
 async def watch_agent_files():
     """
-    Watch agent data files for changes and broadcast updates
-    This runs as a background task
+    Watch agent data files and broadcast every appended record
+    This runs as a background task (inotify on Linux, stat polling elsewhere)
     """
-    import time
-    last_modified = {}
-
-    while True:
-        try:
-            if TENANTS_ROOT.exists():
-                for tenant_dir in TENANTS_ROOT.iterdir():
-                    if not tenant_dir.is_dir():
-                        continue
-
-                    tenant_key = tenant_dir.name
-                    tenant_data_path = tenant_dir / "agent_data"
-                    if not tenant_data_path.exists():
-                        continue
+    pipeline = LiveUpdatePipeline(
+        TENANTS_ROOT,
+        publish=manager.publish,
+        mode=WATCH_MODE,
+        poll_interval=WATCH_POLL_INTERVAL_SEC,
+    )
+    await pipeline.run()
 
-                    for agent_dir in tenant_data_path.iterdir():
-                        if not agent_dir.is_dir():
-                            continue
-
-                        signature = agent_dir.name
-
-                        # Check balance file
-                        balance_file = agent_dir / "economic" / "balance.jsonl"
-                        if balance_file.exists():
-                            mtime = balance_file.stat().st_mtime
-                            key = f"{tenant_key}:{signature}_balance"
-
-                            if key not in last_modified or mtime > last_modified[key]:
-                                last_modified[key] = mtime
-
-                                # Read latest balance
-                                with open(balance_file, 'r') as f:
-                                    lines = f.readlines()
-                                    if lines:
-                                        data = json.loads(lines[-1])
-                                        await manager.broadcast({
-                                            "type": "balance_update",
-                                            "signature": signature,
-                                            "data": data
-                                        }, tenant_key=tenant_key)
-
-                        # Check decisions file
-                        decision_file = agent_dir / "decisions" / "decisions.jsonl"
-                        if decision_file.exists():
-                            mtime = decision_file.stat().st_mtime
-                            key = f"{tenant_key}:{signature}_decision"
-
-                            if key not in last_modified or mtime > last_modified[key]:
-                                last_modified[key] = mtime
-
-                                # Read latest decision
-                                with open(decision_file, 'r') as f:
-                                    lines = f.readlines()
-                                    if lines:
-                                        data = json.loads(lines[-1])
-                                        await manager.broadcast({
-                                            "type": "activity_update",
-                                            "signature": signature,
-                                            "data": data
-                                        }, tenant_key=tenant_key)
-        except Exception as e:
-            print(f"Error watching files: {e}")
-
-        await asyncio.sleep(1)  # Check every second
 
+async def maintain_artifact_indexes():
+    """
+    Build artifact indexes for existing tenants, then rescan changed
+    sandbox directories every ARTIFACT_INDEX_REFRESH_SEC seconds
+    """
+    if TENANTS_ROOT.exists():
+        for tenant_root in TENANTS_ROOT.iterdir():
+            if tenant_root.is_dir():
+                get_artifact_index(tenant_root / "agent_data")
+    while True:
+        for index in artifact_indexes():
+            try:
+                await asyncio.to_thread(index.refresh)
+            except Exception as e:
+                print(f"Error refreshing artifact index for {index.data_path}: {e}")
+        await asyncio.sleep(ARTIFACT_INDEX_REFRESH_SEC)
 
 
 if __name__ == "__main__":
@@ -18,6 +18,8 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from agent.live_agent import LiveAgent
+from scheduler.agent_scheduler import AgentScheduler
+from livebench.utils.append_writer import install_exit_flush
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -113,7 +115,13 @@ async def main(config_path: str):
         print("❌ No agents enabled in configuration")
         return
 
-    print(f"\n📋 Enabled Agents: {len(enabled_agents)}")
+    # Number of agents run at once (env override, then config, default sequential)
+    max_concurrent_agents = int(
+        os.getenv("LIVEBENCH_MAX_CONCURRENT_AGENTS")
+        or lb_config["agent_params"].get("max_concurrent_agents", 1)
+    )
+
+    print(f"\n📋 Enabled Agents: {len(enabled_agents)} (max concurrent: {max_concurrent_agents})")
     for agent_config in enabled_agents:
         print(f"   - {agent_config['signature']} ({agent_config['basemodel']})")
         if "task_filters" in agent_config:
@@ -123,13 +131,8 @@ async def main(config_path: str):
                   f"({len(agent_config['task_assignment']['task_ids'])} tasks)")
     print()
 
-    # Create and run agents
-    results = []
-    for agent_config in enabled_agents:
-        print(f"\n{'='*60}")
-        print(f"🤖 Initializing Agent: {agent_config['signature']}")
-        print(f"{'='*60}\n")
-
+    def make_agent(agent_config: dict) -> LiveAgent:
+        """Create a LiveAgent from its config entry"""
         # Extract agent-specific task configuration
         agent_filters = agent_config.get("task_filters", None)
         agent_assignment = agent_config.get("task_assignment", None)
@@ -151,8 +154,7 @@ async def main(config_path: str):
         # Get default max payment (optional, for backward compatibility)
         default_max_payment = lb_config.get("economic", {}).get("max_work_payment", 50.0)
 
-        # Create agent
-        agent = LiveAgent(
+        return LiveAgent(
             signature=agent_config["signature"],
             basemodel=agent_config["basemodel"],
             initial_balance=lb_config["economic"]["initial_balance"],
@@ -181,15 +183,26 @@ async def main(config_path: str):
             # Pass tasks_per_day
             tasks_per_day=tasks_per_day,
             # Pass multimodal support
-            supports_multimodal=supports_multimodal
+            supports_multimodal=supports_multimodal,
+            # Pass tool execution settings
+            tool_workers=lb_config["agent_params"].get("tool_workers", 4),
+            tool_timeouts=lb_config["agent_params"].get("tool_timeouts")
         )
 
-        # Run agent
-        success = await run_agent(agent, init_date, end_date)
-        results.append({
-            "signature": agent_config["signature"],
-            "success": success
-        })
+    def make_job(agent_config: dict):
+        async def job() -> bool:
+            print(f"\n{'='*60}")
+            print(f"🤖 Initializing Agent: {agent_config['signature']}")
+            print(f"{'='*60}\n")
+            # Agent is created inside its own task so its tool state and
+            # logger stay isolated from other concurrently running agents
+            agent = make_agent(agent_config)
+            return await run_agent(agent, init_date, end_date)
+        return agent_config["signature"], job
+
+    # Create and run agents
+    scheduler = AgentScheduler(max_concurrency=max_concurrent_agents)
+    results = await scheduler.run([make_job(agent_config) for agent_config in enabled_agents])
 
     # Print overall summary
     print(f"\n{'='*60}")
@@ -218,6 +231,10 @@ if __name__ == "__main__":
         print(f"❌ Configuration file not found: {args.config}")
         sys.exit(1)
 
+    # Buffered balance/token-cost lines must reach disk when the API server
+    # stops the simulation with SIGTERM
+    install_exit_flush()
+
     # Run simulation
     try:
         asyncio.run(main(args.config))
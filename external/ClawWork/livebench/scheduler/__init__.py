@@ -0,0 +1,7 @@
+"""
+Scheduling utilities for running multiple LiveBench agents
+"""
+
+from .agent_scheduler import AgentScheduler
+
+__all__ = ["AgentScheduler"]
@@ -0,0 +1,68 @@
+"""
+Bounded concurrent scheduler for LiveBench agents
+
+Agents spend most of their time waiting on LLM and tool I/O, so several
+agents can share one event loop. Each agent runs in its own asyncio task;
+per-agent tool state and the global logger are held in context variables,
+which asyncio copies per task, so agents do not see each other's state.
+"""
+
+import asyncio
+import time
+import traceback
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+# (signature, job) where job runs one agent to completion and returns success
+AgentJob = Tuple[str, Callable[[], Awaitable[bool]]]
+
+
+class AgentScheduler:
+    """Runs agent jobs concurrently with at most `max_concurrency` in flight"""
+
+    def __init__(self, max_concurrency: int = 1):
+        self.max_concurrency = max(1, int(max_concurrency))
+
+    async def _run_job(self, semaphore: asyncio.Semaphore, signature: str,
+                       job: Callable[[], Awaitable[bool]]) -> Dict[str, Any]:
+        async with semaphore:
+            start = time.perf_counter()
+            error: Optional[str] = None
+            try:
+                success = bool(await job())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # One agent failing must not take down the others.
+                print(f"❌ Error running agent {signature}: {str(e)}")
+                traceback.print_exc()
+                success = False
+                error = str(e)
+            result = {
+                "signature": signature,
+                "success": success,
+                "duration_seconds": round(time.perf_counter() - start, 3),
+            }
+            if error:
+                result["error"] = error
+            return result
+
+    async def run(self, jobs: List[AgentJob]) -> List[Dict[str, Any]]:
+        """
+        Run all jobs and return one result dict per job, in input order
+
+        Each result has "signature", "success" and "duration_seconds", plus
+        "error" when the job raised.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = [
+            asyncio.create_task(self._run_job(semaphore, signature, job), name=f"agent:{signature}")
+            for signature, job in jobs
+        ]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
@@ -9,13 +9,34 @@ from langchain_core.tools import tool
 from typing import Dict, Any, Union
 import json
 import os
+from contextvars import ContextVar
 from datetime import datetime
 
 from livebench.utils.logger import get_logger
 
 
-# Global state (will be set by agent)
-_global_state = {}
+# Tool state (will be set by agent). Held in a context variable so that
+# agents running as separate asyncio tasks each see their own state.
+_tool_state: ContextVar[Dict[str, Any]] = ContextVar("livebench_tool_state", default={})
+
+
+class _ToolStateView:
+    """Read-only dict view of the current agent's tool state"""
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return _tool_state.get().get(key, default)
+
+    def keys(self):
+        return _tool_state.get().keys()
+
+    def __getitem__(self, key: str) -> Any:
+        return _tool_state.get()[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in _tool_state.get()
+
+
+_global_state = _ToolStateView()
 
 
 def set_global_state(
@@ -28,9 +49,8 @@ def set_global_state(
     data_path: str,
     supports_multimodal: bool = True
 ):
-    """Set global state for tools"""
-    global _global_state
-    _global_state = {
+    """Set tool state for the current agent (context-local)"""
+    _tool_state.set({
         "signature": signature,
         "economic_tracker": economic_tracker,
         "task_manager": task_manager,
@@ -39,7 +59,7 @@ def set_global_state(
         "current_task": current_task,
         "data_path": data_path,
         "supports_multimodal": supports_multimodal
-    }
+    })
 
 
 @tool
@@ -25,29 +25,38 @@ class SessionSandbox:
     Manages a persistent E2B sandbox for an agent session.
     This ensures files created in one execute_code call are accessible in subsequent calls.
     """
-    _instance: Optional['SessionSandbox'] = None
+    # One instance per agent signature, so concurrently running agents
+    # each get their own sandbox
+    _instances: Dict[Optional[str], 'SessionSandbox'] = {}
     
     def __init__(self):
         self.sandbox: Optional[Sandbox] = None
         self.sandbox_id: Optional[str] = None
         self.uploaded_reference_files: Dict[str, str] = {}  # local_path -> remote_path
     
+    @staticmethod
+    def _current_key() -> Optional[str]:
+        return _get_global_state().get("signature")
+    
     @classmethod
     def get_instance(cls) -> 'SessionSandbox':
-        """Get or create the singleton session sandbox instance"""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        """Get or create the session sandbox instance for the current agent"""
+        key = cls._current_key()
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls()
+            cls._instances[key] = instance
+        return instance
     
     @classmethod
     def reset(cls):
-        """Reset the session sandbox (for new sessions/days)"""
-        if cls._instance and cls._instance.sandbox:
+        """Reset the current agent's session sandbox (for new sessions/days)"""
+        instance = cls._instances.pop(cls._current_key(), None)
+        if instance and instance.sandbox:
             try:
-                cls._instance.sandbox.kill()  # Use kill() for immediate termination
+                instance.sandbox.kill()  # Use kill() for immediate termination
             except:
                 pass
-        cls._instance = None
     
     def get_or_create_sandbox(self, timeout: int = 3600) -> Sandbox:  # Default 1 hour for task duration
         """Get existing sandbox or create a new one, with health check"""
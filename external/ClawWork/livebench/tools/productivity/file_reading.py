@@ -21,8 +21,19 @@ from openai import OpenAI
 from PyPDF2 import PdfReader, PdfWriter
 from typing import Optional
 
+from livebench.utils.extraction_cache import cached_by_content, get_extraction_cache
+
 load_dotenv()
 
+# Rendering parameters (part of the extraction cache key)
+PDF_IMAGE_DPI = 100
+PDF_PAGE_MAX_WIDTH = 600
+PDF_PAGES_PER_IMAGE = 4
+PPTX_IMAGE_DPI = 150
+PPTX_SLIDE_MAX_WIDTH = 1200
+OCR_DPI = 150
+OCR_MAX_SIZE = 1536
+OCR_MODEL = "qwen-vl-ocr-2025-11-20"
 
 
 # Import global state from parent module
@@ -136,6 +147,7 @@ def read_file(filetype: str, file_path: Path) -> Dict[str, Any]:
 
 
 
+@cached_by_content("docx_text")
 def read_docx(docx_path: Path) -> str:
     """
     Read a Microsoft Word document and extract text.
@@ -181,6 +193,7 @@ def read_docx(docx_path: Path) -> str:
         raise RuntimeError(f"Failed to read DOCX file: {str(e)}")
 
 
+@cached_by_content("xlsx_text")
 def read_xlsx(xlsx_path: Path) -> str:
     """
     Read a Microsoft Excel spreadsheet and extract data.
@@ -288,6 +301,7 @@ def read_txt(txt_path: Path) -> str:
         raise RuntimeError(f"Failed to read text file: {str(e)}")
 
 
+@cached_by_content("pptx_images", codec="images", params={"dpi": PPTX_IMAGE_DPI, "max_width": PPTX_SLIDE_MAX_WIDTH})
 def read_pptx_as_images(pptx_path: Path) -> Optional[List[bytes]]:
     """
     Convert PPTX to list of PNG images (one per slide).
@@ -336,13 +350,13 @@ def read_pptx_as_images(pptx_path: Path) -> Optional[List[bytes]]:
             return None
         
         # Convert PDF to images (one per slide)
-        images = convert_from_path(pdf_path, dpi=150)
+        images = convert_from_path(pdf_path, dpi=PPTX_IMAGE_DPI)
         
         # Convert PIL images to PNG bytes
         image_bytes_list = []
         for img in images:
             # Resize to reasonable size (A4 aspect ratio, max 1200px width)
-            max_width = 1200
+            max_width = PPTX_SLIDE_MAX_WIDTH
             if img.width > max_width:
                 ratio = max_width / img.width
                 new_height = int(img.height * ratio)
@@ -374,6 +388,11 @@ def read_pptx_as_images(pptx_path: Path) -> Optional[List[bytes]]:
                 pass
 
 
+@cached_by_content(
+    "pdf_images",
+    codec="images",
+    params={"dpi": PDF_IMAGE_DPI, "max_width": PDF_PAGE_MAX_WIDTH, "pages_per_image": PDF_PAGES_PER_IMAGE}
+)
 def read_pdf_as_images(pdf_path: Path) -> Optional[List[bytes]]:
     """
     Convert PDF to list of PNG images, combining 4 pages into one image to save resources.
@@ -401,7 +420,7 @@ def read_pdf_as_images(pdf_path: Path) -> Optional[List[bytes]]:
     try:
         # Convert PDF to images (one per page)
         # Use lower DPI for efficiency (100 instead of 150)
-        images = convert_from_path(str(pdf_path), dpi=100)
+        images = convert_from_path(str(pdf_path), dpi=PDF_IMAGE_DPI)
         
         if not images:
             print(f"No pages found in PDF: {pdf_path}")
@@ -409,13 +428,13 @@ def read_pdf_as_images(pdf_path: Path) -> Optional[List[bytes]]:
         
         # Combine 4 pages into one image (2x2 grid)
         combined_images = []
-        pages_per_image = 4
+        pages_per_image = PDF_PAGES_PER_IMAGE
         
         for i in range(0, len(images), pages_per_image):
             batch = images[i:i + pages_per_image]
             
             # Resize each page to max 600px width (A4 aspect ratio)
-            max_width = 600
+            max_width = PDF_PAGE_MAX_WIDTH
             resized_batch = []
             
             for img in batch:
@@ -513,6 +532,7 @@ def _call_qwen_ocr(pdf_path: Path) -> dict[str, Any]:
     Optimizations:
     - Limits image resolution to 1536px on longest side for faster processing
     - Uses parallel processing for multiple pages
+    - Caches per-page OCR results by file content hash; cached pages are not re-rendered or re-billed
     
     Cost tracking:
     - OCR pricing: 0.0003 CNY/1K tokens input, 0.0005 CNY/1K tokens output
@@ -521,10 +541,6 @@ def _call_qwen_ocr(pdf_path: Path) -> dict[str, Any]:
     if not pdf_path.is_file():
         raise FileNotFoundError(f"找不到 PDF 文件：{pdf_path}")
 
-    api_key = os.getenv("OCR_VLLM_API_KEY")
-    if not api_key:
-        raise ValueError("未找到 OCR_VLLM_API_KEY 环境变量，请设置 API key")
-
     # Convert PDF to PNG images (one per page)
     try:
         from pdf2image import convert_from_path
@@ -532,21 +548,23 @@ def _call_qwen_ocr(pdf_path: Path) -> dict[str, Any]:
     except ImportError:
         raise ImportError("pdf2image not installed. Run: pip install pdf2image Pillow")
     
-    # Convert PDF pages to images
-    images = convert_from_path(str(pdf_path), dpi=150)
-    total_pages = len(images)
+    total_pages = len(PdfReader(str(pdf_path)).pages)
     print(f"total_pages: {total_pages}")
-    
-    client = OpenAI(
-        api_key=api_key,
-        base_url="https://dashscope.aliyuncs.com/compatible-mode/v1",
-    )
+
+    # OCR results are cached per page, keyed by file content and render settings
+    cache = get_extraction_cache()
+    page_keys = [
+        cache.make_key(pdf_path, "ocr_page", {"page": page_num, "dpi": OCR_DPI, "max_size": OCR_MAX_SIZE, "model": OCR_MODEL})
+        for page_num in range(total_pages)
+    ]
 
     # Helper function to process a single page
-    def process_page(page_num: int, img: Image.Image) -> tuple[int, str, dict]:
-        """Process a single PDF page with OCR"""
+    def process_page(page_num: int) -> tuple[int, str, dict]:
+        """Render and OCR a single PDF page"""
+        img = convert_from_path(str(pdf_path), dpi=OCR_DPI, first_page=page_num + 1, last_page=page_num + 1)[0]
+
         # Resize image to max 1536px on longest side for faster OCR
-        max_size = 1536
+        max_size = OCR_MAX_SIZE
         if max(img.width, img.height) > max_size:
             if img.width > img.height:
                 new_width = max_size
@@ -580,7 +598,7 @@ def _call_qwen_ocr(pdf_path: Path) -> dict[str, Any]:
         ]
 
         response = client.chat.completions.create(
-            model="qwen-vl-ocr-2025-11-20",
+            model=OCR_MODEL,
             messages=messages,
         )
 
@@ -593,7 +611,6 @@ def _call_qwen_ocr(pdf_path: Path) -> dict[str, Any]:
         
         return (page_num, page_content, usage)
 
-    # Process pages in parallel using ThreadPoolExecutor
     all_pages_content: list[str] = [""] * total_pages  # Pre-allocate list
     total_usage = {
         "prompt_tokens": 0,
@@ -601,27 +618,51 @@ def _call_qwen_ocr(pdf_path: Path) -> dict[str, Any]:
         "total_tokens": 0,
     }
 
-    # Use max 4 workers to avoid overwhelming the API
-    max_workers = min(4, total_pages)
-    
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all page processing tasks
-        futures = {
-            executor.submit(process_page, page_num, img): page_num 
-            for page_num, img in enumerate(images)
-        }
-        
-        # Collect results as they complete
-        for future in as_completed(futures):
-            page_num, page_content, usage = future.result()
-            all_pages_content[page_num] = page_content
-            
-            # Accumulate usage stats
-            total_usage["prompt_tokens"] += usage["prompt_tokens"]
-            total_usage["completion_tokens"] += usage["completion_tokens"]
-            total_usage["total_tokens"] += usage["total_tokens"]
-            
-            print(f"✓ Page {page_num + 1}/{total_pages} processed")
+    # Reuse cached pages; only the rest are rendered and sent to the OCR API
+    pending_pages = []
+    for page_num, key in enumerate(page_keys):
+        cached_page = cache.get(key, codec="json", kind="ocr_page")
+        if cached_page is None:
+            pending_pages.append(page_num)
+        else:
+            all_pages_content[page_num] = cached_page["content"]
+            cache.record("ocr_page", "tokens_saved", cached_page["usage"].get("total_tokens", 0))
+    if len(pending_pages) < total_pages:
+        print(f"♻️ OCR cache: reused {total_pages - len(pending_pages)}/{total_pages} pages")
+
+    if pending_pages:
+        api_key = os.getenv("OCR_VLLM_API_KEY")
+        if not api_key:
+            raise ValueError("未找到 OCR_VLLM_API_KEY 环境变量，请设置 API key")
+
+        client = OpenAI(
+            api_key=api_key,
+            base_url="https://dashscope.aliyuncs.com/compatible-mode/v1",
+        )
+
+        # Use max 4 workers to avoid overwhelming the API
+        max_workers = min(4, len(pending_pages))
+
+        # Process pages in parallel using ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Submit all page processing tasks
+            futures = {
+                executor.submit(process_page, page_num): page_num
+                for page_num in pending_pages
+            }
+
+            # Collect results as they complete
+            for future in as_completed(futures):
+                page_num, page_content, usage = future.result()
+                all_pages_content[page_num] = page_content
+                cache.put(page_keys[page_num], {"content": page_content, "usage": usage}, codec="json")
+
+                # Accumulate usage stats
+                total_usage["prompt_tokens"] += usage["prompt_tokens"]
+                total_usage["completion_tokens"] += usage["completion_tokens"]
+                total_usage["total_tokens"] += usage["total_tokens"]
+
+                print(f"✓ Page {page_num + 1}/{total_pages} processed")
 
     full_content = "\n\n".join(all_pages_content)
 
@@ -631,7 +672,7 @@ def _call_qwen_ocr(pdf_path: Path) -> dict[str, Any]:
     try:
         global_state = _get_global_state()
         tracker = global_state.get("economic_tracker")
-        if tracker:
+        if tracker and pending_pages:
             # Track input tokens cost
             input_cost = tracker.track_api_call(
                 tokens=total_usage["prompt_tokens"],
@@ -653,7 +694,7 @@ def _call_qwen_ocr(pdf_path: Path) -> dict[str, Any]:
     return {
         "content": full_content,
         "total_pages": total_pages,
-        "model": "qwen-vl-ocr-2025-11-20",
+        "model": OCR_MODEL,
         "usage": total_usage,
     }
 
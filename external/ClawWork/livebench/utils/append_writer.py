@@ -0,0 +1,247 @@
+"""
+Buffered append writer for JSONL and log files
+
+Keeps one O_APPEND descriptor open per file and batches lines in memory,
+flushing when a file has max_pending lines queued, when the oldest queued
+line is flush_interval seconds old (0 writes every line immediately), on
+explicit flush() calls and at process exit (including SIGTERM once an entry
+point calls install_exit_flush()). A failed write keeps its lines
+queued (the timed flusher logs and retries) and never creates directories,
+so a directory removed on purpose stays removed. Each flush is a single write()
+of complete lines, so readers that consume up to the last newline (e.g.
+the API's JSONL tailer) never see a half-written record.
+
+fsync policy (LIVEBENCH_APPEND_FSYNC):
+- "never": leave durability to the OS
+- "flush": fsync on explicit flush() calls and at exit (default), covering
+  batches already written by the count trigger or the timed flusher
+- "batch": fsync after every batch write
+"""
+
+import os
+import json
+import time
+import atexit
+import signal
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set
+
+FSYNC_POLICIES = ("never", "flush", "batch")
+
+
+def dumps_compact(record: Any) -> str:
+    """Compact single-line JSON used for every appended record"""
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+
+
+class AppendWriter:
+    """Process-wide buffered appender shared by trackers and loggers"""
+
+    def __init__(
+        self,
+        max_pending: int = 64,
+        flush_interval: float = 1.0,
+        fsync: str = "flush",
+        max_open_files: int = 256
+    ):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Invalid fsync policy: {fsync}. Must be one of {FSYNC_POLICIES}")
+        self.max_pending = max(1, max_pending)
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.max_open_files = max(1, max_open_files)
+
+        self._lock = threading.RLock()
+        self._pending: Dict[str, List[bytes]] = {}
+        self._first_pending_at: Dict[str, float] = {}
+        self._fds: "OrderedDict[str, int]" = OrderedDict()  # path -> fd, least recently used first
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._failed: Dict[str, str] = {}  # path -> last write error, until a write succeeds
+        self._unsynced: Set[str] = set()  # paths written since their last fsync
+
+        self.lines_written = 0
+        self.write_calls = 0
+
+    # ------------------------------------------------------------- handles
+
+    def _fd(self, path: str) -> int:
+        fd = self._fds.get(path)
+        if fd is not None:
+            self._fds.move_to_end(path)
+            return fd
+        # Callers create their directories; a missing one means it was removed
+        # on purpose, so let the open fail rather than recreate it
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._fds[path] = fd
+        while len(self._fds) > self.max_open_files:
+            old_path, old_fd = next(iter(self._fds.items()))
+            try:
+                self._flush_path(old_path, sync=False)
+            except OSError as e:
+                self._report_failure(old_path, e)
+            self._drop_fd(old_path)
+        return fd
+
+    def _drop_fd(self, path: str) -> None:
+        fd = self._fds.pop(path, None)
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------- writing
+
+    def write_line(self, path: str, line: str) -> None:
+        """Queue one line (a trailing newline is added)"""
+        data = (line + "\n").encode("utf-8")
+        with self._lock:
+            pending = self._pending.setdefault(path, [])
+            if not pending:
+                self._first_pending_at[path] = time.monotonic()
+            pending.append(data)
+            if len(pending) >= self.max_pending or self.flush_interval <= 0:
+                try:
+                    self._flush_path(path, sync=self.fsync == "batch")
+                    return
+                except OSError as e:
+                    # The line stays queued; the timed flusher retries it
+                    self._report_failure(path, e)
+            if self._flusher is None and self.flush_interval > 0:
+                self._start_flusher()
+
+    def write_record(self, path: str, record: Any) -> None:
+        """Queue one record as a compact JSON line"""
+        self.write_line(path, dumps_compact(record))
+
+    def _flush_path(self, path: str, sync: bool) -> None:
+        pending = self._pending.pop(path, None)
+        first_at = self._first_pending_at.pop(path, None)
+        if pending:
+            self._write_pending(path, pending, first_at)
+        # Batches written by the count trigger or the timed flusher are
+        # synced here too, even when nothing is queued any more
+        if sync and path in self._unsynced:
+            os.fsync(self._fd(path))
+            self._unsynced.discard(path)
+
+    def _write_pending(self, path: str, pending: List[bytes], first_at: Optional[float]) -> None:
+        joined = b"".join(pending)
+        data = memoryview(joined)
+        try:
+            fd = self._fd(path)
+            while data:
+                written = os.write(fd, data)
+                data = data[written:]
+        except OSError:
+            # Put the unwritten bytes back in front of anything queued since,
+            # and reopen the file on the next attempt
+            self._pending[path] = [bytes(data)] + self._pending.get(path, [])
+            self._first_pending_at[path] = first_at if first_at is not None else time.monotonic()
+            self._drop_fd(path)
+            raise
+        self.write_calls += 1
+        self.lines_written += joined.count(b"\n")  # a re-queued chunk may hold several lines
+        if self._failed.pop(path, None) is not None:
+            print(f"✅ Append writer recovered: {path}")
+        if self.fsync != "never":
+            self._unsynced.add(path)
+
+    def _report_failure(self, path: str, error: OSError) -> None:
+        # Log once per distinct error so a persistent failure doesn't flood the console
+        message = str(error)
+        if self._failed.get(path) != message:
+            self._failed[path] = message
+            print(f"⚠️ Append writer could not write {path}, keeping lines queued: {message}")
+
+    def flush(self, path: Optional[str] = None) -> None:
+        """Write queued lines for path (or every file), fsyncing per policy"""
+        sync = self.fsync != "never"
+        with self._lock:
+            paths = [path] if path else list(self._pending.keys() | self._unsynced)
+            for p in paths:
+                self._flush_path(p, sync=sync)
+
+    def close(self, path: str) -> None:
+        """Flush and close the handle for path (e.g. before the file is rewritten)"""
+        with self._lock:
+            self._flush_path(path, sync=self.fsync != "never")
+            self._drop_fd(path)
+
+    def close_all(self) -> None:
+        """Flush everything and close all handles (the writer stays usable)"""
+        with self._lock:
+            self._stop.set()
+            self._stop = threading.Event()
+            self._flusher = None
+            sync = self.fsync != "never"
+            for path in list(self._pending.keys() | self._unsynced):
+                try:
+                    self._flush_path(path, sync=sync)
+                except OSError as e:
+                    self._report_failure(path, e)
+            for path in list(self._fds):
+                self._drop_fd(path)
+
+    # ------------------------------------------------------ timed flushing
+
+    def _start_flusher(self) -> None:
+        self._flusher = threading.Thread(target=self._flush_loop, args=(self._stop,), name="append-writer", daemon=True)
+        self._flusher.start()
+
+    def _flush_loop(self, stop: threading.Event) -> None:
+        while not stop.wait(self.flush_interval / 2):
+            deadline = time.monotonic() - self.flush_interval
+            with self._lock:
+                for path, first_at in list(self._first_pending_at.items()):
+                    if first_at <= deadline:
+                        try:
+                            self._flush_path(path, sync=self.fsync == "batch")
+                        except OSError as e:
+                            self._report_failure(path, e)
+
+
+_writer: Optional[AppendWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_append_writer() -> AppendWriter:
+    """
+    Shared writer configured by LIVEBENCH_APPEND_MAX_PENDING (64),
+    LIVEBENCH_APPEND_FLUSH_INTERVAL_SEC (1.0) and LIVEBENCH_APPEND_FSYNC (flush)
+    """
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = AppendWriter(
+                max_pending=int(os.getenv("LIVEBENCH_APPEND_MAX_PENDING", "64")),
+                flush_interval=float(os.getenv("LIVEBENCH_APPEND_FLUSH_INTERVAL_SEC", "1.0")),
+                fsync=os.getenv("LIVEBENCH_APPEND_FSYNC", "flush").strip().lower()
+            )
+            atexit.register(_writer.close_all)
+        return _writer
+
+
+def install_exit_flush(signals=(signal.SIGTERM,)) -> None:
+    """
+    Flush the shared writer when the process is told to stop
+
+    atexit hooks do not run on a default SIGTERM (how the API server stops
+    simulations), so queued lines would be lost. The handler flushes from a
+    separate thread, because the main thread may be interrupted while holding
+    the writer lock, then exits with the conventional 128 + signal status.
+    Call from the main thread of an entry point.
+    """
+    def shutdown(signum: int) -> None:
+        try:
+            get_append_writer().close_all()
+        finally:
+            os._exit(128 + signum)
+
+    def handle(signum, frame) -> None:
+        threading.Thread(target=shutdown, args=(signum,), name="append-writer-exit").start()
+
+    for signum in signals:
+        signal.signal(signum, handle)
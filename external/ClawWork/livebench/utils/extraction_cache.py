@@ -0,0 +1,313 @@
+"""
+Content-addressed on-disk cache for document extraction
+
+Entries are keyed by the SHA-256 of the source file's bytes plus the
+extraction kind and parameters (DPI, resize limits, page index, model...),
+so the same reference file or artifact is only parsed, rendered or OCR'd
+once no matter how often or from which path it is read. The cache directory
+is shared by the agent's file-reading tools and the LLM evaluator and is
+bounded by total size with least-recently-used eviction.
+"""
+
+import os
+import json
+import struct
+import functools
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+
+DEFAULT_CACHE_DIR = "./livebench/data/cache/extraction"
+DEFAULT_MAX_MB = 2048
+
+# Bump when an extractor's output format changes to invalidate old entries
+CACHE_VERSION = 1
+
+
+def _encode_text(value: str) -> bytes:
+    return value.encode("utf-8")
+
+
+def _decode_text(data: bytes) -> str:
+    return data.decode("utf-8")
+
+
+def _encode_json(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+def _decode_json(data: bytes) -> Any:
+    return json.loads(data.decode("utf-8"))
+
+
+def _encode_images(value: List[bytes]) -> bytes:
+    # Length-prefixed PNG blobs in one file so an entry is evicted atomically
+    parts = [struct.pack(">I", len(value))]
+    for image in value:
+        parts.append(struct.pack(">Q", len(image)))
+        parts.append(image)
+    return b"".join(parts)
+
+
+def _decode_images(data: bytes) -> List[bytes]:
+    (count,) = struct.unpack_from(">I", data, 0)
+    offset = 4
+    images = []
+    for _ in range(count):
+        (size,) = struct.unpack_from(">Q", data, offset)
+        offset += 8
+        images.append(data[offset:offset + size])
+        offset += size
+    if offset != len(data):
+        raise ValueError("Corrupt image cache entry")
+    return images
+
+
+CODECS: Dict[str, Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    "text": (_encode_text, _decode_text),
+    "json": (_encode_json, _decode_json),
+    "images": (_encode_images, _decode_images),
+}
+
+
+class ExtractionCache:
+    """
+    Size-bounded LRU cache of extraction results stored under cache_dir.
+
+    Recency is kept in memory and mirrored to file mtimes so it survives
+    restarts. Hit/miss counters are kept per extraction kind.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # key -> size, oldest first
+        self._total_bytes = 0
+        self._digests: Dict[str, Tuple[int, int, int, str]] = {}  # path -> (ino, size, mtime_ns, digest)
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self.evictions = 0
+        self._load_index()
+
+    # ----------------------------------------------------------------- index
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    def _load_index(self) -> None:
+        if not self.cache_dir.exists():
+            return
+        found = []
+        for entry in self.cache_dir.glob("??/*"):
+            if entry.name.startswith("."):
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            found.append((st.st_mtime_ns, entry.name, st.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total_bytes += size
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            try:
+                self._entry_path(key).unlink()
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------ keys
+
+    def file_digest(self, path: Union[str, Path]) -> str:
+        """SHA-256 of the file content, memoized on (inode, size, mtime)"""
+        path = str(path)
+        st = os.stat(path)
+        signature = (st.st_ino, st.st_size, st.st_mtime_ns)
+        cached = self._digests.get(path)
+        if cached and cached[:3] == signature:
+            return cached[3]
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        hexdigest = digest.hexdigest()
+        self._digests[path] = signature + (hexdigest,)
+        return hexdigest
+
+    def make_key(self, path: Union[str, Path], kind: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Cache key for extracting `kind` from the file at path with params"""
+        material = json.dumps(
+            [CACHE_VERSION, self.file_digest(path), kind, params or {}],
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    # ------------------------------------------------------------ get / put
+
+    def _count(self, kind: str, field: str, amount: int = 1) -> None:
+        counters = self._stats.setdefault(kind, {"hits": 0, "misses": 0})
+        counters[field] = counters.get(field, 0) + amount
+
+    def get(self, key: str, codec: str = "text", kind: str = "default") -> Optional[Any]:
+        """Return the cached value for key, or None (counted as a miss)"""
+        entry = self._entry_path(key)
+        try:
+            with open(entry, "rb") as f:
+                data = f.read()
+            value = CODECS[codec][1](data)
+        except (OSError, ValueError, struct.error):
+            with self._lock:
+                self._count(kind, "misses")
+                if key in self._entries:
+                    self._total_bytes -= self._entries.pop(key)
+            return None
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        with self._lock:
+            self._count(kind, "hits")
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            else:
+                # Written by another process sharing the cache directory
+                self._entries[key] = len(data)
+                self._total_bytes += len(data)
+        return value
+
+    def put(self, key: str, value: Any, codec: str = "text") -> None:
+        """Store value under key, evicting least recently used entries"""
+        data = CODECS[codec][0](value)
+        if len(data) > self.max_bytes:
+            return
+        entry = self._entry_path(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=entry.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, entry)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self._total_bytes -= self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self._total_bytes += len(data)
+            self._evict()
+
+    def get_or_compute(
+        self,
+        path: Union[str, Path],
+        kind: str,
+        compute: Callable[[], Any],
+        params: Optional[Dict[str, Any]] = None,
+        codec: str = "text"
+    ) -> Any:
+        """
+        Return the cached extraction of path, computing and storing it on a miss.
+
+        Results that are None are treated as failures and not cached.
+        """
+        key = self.make_key(path, kind, params)
+        value = self.get(key, codec=codec, kind=kind)
+        if value is not None:
+            return value
+        value = compute()
+        if value is not None:
+            self.put(key, value, codec=codec)
+        return value
+
+    # ----------------------------------------------------------------- stats
+
+    def record(self, kind: str, field: str, amount: int = 1) -> None:
+        """Add to a custom counter (e.g. OCR tokens saved by hits)"""
+        with self._lock:
+            self._count(kind, field, amount)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters per kind plus current size"""
+        with self._lock:
+            by_kind = {kind: dict(counters) for kind, counters in self._stats.items()}
+            hits = sum(c.get("hits", 0) for c in by_kind.values())
+            misses = sum(c.get("misses", 0) for c in by_kind.values())
+            return {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                "entries": len(self._entries),
+                "size_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "by_kind": by_kind,
+            }
+
+    def clear(self) -> None:
+        """Remove every cached entry"""
+        with self._lock:
+            for key in list(self._entries):
+                try:
+                    self._entry_path(key).unlink()
+                except OSError:
+                    pass
+            self._entries.clear()
+            self._total_bytes = 0
+
+
+_cache: Optional[ExtractionCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_extraction_cache() -> ExtractionCache:
+    """
+    Process-wide cache configured by LIVEBENCH_EXTRACTION_CACHE_DIR and
+    LIVEBENCH_EXTRACTION_CACHE_MAX_MB (0 disables storing entries)
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            cache_dir = os.getenv("LIVEBENCH_EXTRACTION_CACHE_DIR", DEFAULT_CACHE_DIR)
+            max_mb = float(os.getenv("LIVEBENCH_EXTRACTION_CACHE_MAX_MB", DEFAULT_MAX_MB))
+            _cache = ExtractionCache(cache_dir, max_bytes=int(max_mb * 1024 * 1024))
+        return _cache
+
+
+def cached_extraction(
+    path: Union[str, Path],
+    kind: str,
+    compute: Callable[[], Any],
+    params: Optional[Dict[str, Any]] = None,
+    codec: str = "text"
+) -> Any:
+    """get_or_compute on the shared cache; falls back to compute() if the file can't be hashed"""
+    cache = get_extraction_cache()
+    try:
+        cache.make_key(path, kind, params)
+    except OSError:
+        return compute()
+    return cache.get_or_compute(path, kind, compute, params=params, codec=codec)
+
+
+def cached_by_content(kind: str, codec: str = "text", params: Optional[Dict[str, Any]] = None):
+    """Decorator caching an extractor whose first argument is the source file path"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(path, *args, **kwargs):
+            key_params = dict(params or {})
+            if args or kwargs:
+                key_params["args"] = [list(args), kwargs]
+            return cached_extraction(path, kind, lambda: func(path, *args, **kwargs), params=key_params, codec=codec)
+        wrapper.uncached = func
+        return wrapper
+    return decorator
@@ -5,11 +5,14 @@ Logs errors, warnings, and debug information to local files
 
 import os
 import json
+from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
 import traceback
 
+from livebench.utils.append_writer import get_append_writer
+
 
 class LiveBenchLogger:
     """Persistent logger for LiveBench agents"""
@@ -37,6 +40,9 @@ class LiveBenchLogger:
         
         # Terminal output log (comprehensive log matching console output)
         self.terminal_log_file: Optional[str] = None
+
+        # Lines are appended through the shared buffered writer
+        self._writer = get_append_writer()
         
     def _write_log(self, log_file: str, level: str, message: str, 
                    context: Optional[Dict[str, Any]] = None,
@@ -59,8 +65,7 @@ class LiveBenchLogger:
                 "traceback": traceback.format_exc()
             }
         
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._writer.write_record(log_file, entry)
     
     def error(self, message: str, context: Optional[Dict[str, Any]] = None, 
               exception: Optional[Exception] = None, print_console: bool = True) -> None:
@@ -74,6 +79,7 @@ class LiveBenchLogger:
             print_console: Whether to print to console
         """
         self._write_log(self.error_log, "ERROR", message, context, exception)
+        self._writer.flush(self.error_log)  # Errors are rare; persist them right away
         
         if print_console:
             print(f"❌ ERROR: {message}")
@@ -135,6 +141,7 @@ class LiveBenchLogger:
     
     def get_recent_errors(self, limit: int = 10) -> list:
         """Get recent error entries"""
+        self._writer.flush(self.error_log)
         if not os.path.exists(self.error_log):
             return []
         
@@ -147,6 +154,7 @@ class LiveBenchLogger:
     
     def get_recent_warnings(self, limit: int = 10) -> list:
         """Get recent warning entries"""
+        self._writer.flush(self.warning_log)
         if not os.path.exists(self.warning_log):
             return []
         
@@ -171,7 +179,11 @@ class LiveBenchLogger:
         terminal_log_dir = os.path.join(self.data_path, "terminal_logs")
         os.makedirs(terminal_log_dir, exist_ok=True)
         
+        # Flush and close the previous day's log before switching files
+        if self.terminal_log_file:
+            self._writer.close(self.terminal_log_file)
         self.terminal_log_file = os.path.join(terminal_log_dir, f"{date}.log")
+        self._writer.close(self.terminal_log_file)
         
         # Write header
         with open(self.terminal_log_file, "w", encoding="utf-8") as f:
@@ -195,30 +207,30 @@ class LiveBenchLogger:
             print(message)
         
         if self.terminal_log_file:
-            with open(self.terminal_log_file, "a", encoding="utf-8") as f:
-                f.write(message + "\n")
+            self._writer.write_line(self.terminal_log_file, message)
 
 
-# Global logger instance (will be set by agent)
-_global_logger: Optional[LiveBenchLogger] = None
+# Global logger instance (will be set by agent). Context-local so that
+# concurrently running agents each log to their own files.
+_global_logger: ContextVar[Optional[LiveBenchLogger]] = ContextVar("livebench_logger", default=None)
 
 
 def set_global_logger(logger: LiveBenchLogger) -> None:
-    """Set the global logger instance"""
-    global _global_logger
-    _global_logger = logger
+    """Set the global logger instance for the current context"""
+    _global_logger.set(logger)
 
 
 def get_logger() -> Optional[LiveBenchLogger]:
-    """Get the global logger instance"""
-    return _global_logger
+    """Get the global logger instance for the current context"""
+    return _global_logger.get()
 
 
 def log_error(message: str, context: Optional[Dict[str, Any]] = None, 
               exception: Optional[Exception] = None) -> None:
     """Convenience function to log error"""
-    if _global_logger:
-        _global_logger.error(message, context, exception)
+    logger = get_logger()
+    if logger:
+        logger.error(message, context, exception)
     else:
         print(f"❌ ERROR (no logger): {message}")
         if exception:
@@ -227,20 +239,23 @@ def log_error(message: str, context: Optional[Dict[str, Any]] = None,
 
 def log_warning(message: str, context: Optional[Dict[str, Any]] = None) -> None:
     """Convenience function to log warning"""
-    if _global_logger:
-        _global_logger.warning(message, context)
+    logger = get_logger()
+    if logger:
+        logger.warning(message, context)
     else:
         print(f"⚠️ WARNING (no logger): {message}")
 
 
 def log_info(message: str, context: Optional[Dict[str, Any]] = None) -> None:
     """Convenience function to log info"""
-    if _global_logger:
-        _global_logger.info(message, context)
+    logger = get_logger()
+    if logger:
+        logger.info(message, context)
 
 
 def log_debug(message: str, context: Optional[Dict[str, Any]] = None) -> None:
     """Convenience function to log debug"""
-    if _global_logger:
-        _global_logger.debug(message, context)
+    logger = get_logger()
+    if logger:
+        logger.debug(message, context)
 
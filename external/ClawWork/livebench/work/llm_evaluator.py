@@ -8,14 +8,50 @@ criteria from eval/meta_prompts/ for each task category (occupation).
 import os
 import json
 import base64
-from typing import Dict, Optional, Tuple, List, Union
+import asyncio
+import hashlib
+import threading
+from typing import Any, Dict, NoReturn, Optional, Tuple, List, Union
 from pathlib import Path
 from datetime import datetime
-from openai import OpenAI
+try:
+    from openai import OpenAI
+except ImportError:
+    OpenAI = None  # only needed once a client is created
 from dotenv import load_dotenv
 
+from livebench.utils.extraction_cache import ExtractionCache, cached_extraction
+
 load_dotenv()
 
+EVALUATION_SYSTEM_PROMPT = (
+    "You are an expert work evaluator. Follow the provided rubric precisely and output a structured evaluation."
+)
+
+# Bump when prompt construction or score parsing changes to invalidate cached results
+EVALUATION_CACHE_VERSION = 1
+
+# Meta-prompts shared by all evaluator instances: path -> (mtime_ns, meta_prompt, rubric_version)
+_meta_prompt_cache: Dict[str, Tuple[int, Dict, str]] = {}
+_cache_lock = threading.Lock()
+
+_result_cache: Optional[ExtractionCache] = None
+
+
+def get_evaluation_result_cache() -> ExtractionCache:
+    """
+    Evaluation results keyed by artifact content hash and rubric version,
+    configured by LIVEBENCH_EVALUATION_CACHE_DIR and
+    LIVEBENCH_EVALUATION_CACHE_MAX_MB (0 disables storing results)
+    """
+    global _result_cache
+    with _cache_lock:
+        if _result_cache is None:
+            cache_dir = os.getenv("LIVEBENCH_EVALUATION_CACHE_DIR", "./livebench/data/cache/evaluations")
+            max_mb = float(os.getenv("LIVEBENCH_EVALUATION_CACHE_MAX_MB", "256"))
+            _result_cache = ExtractionCache(cache_dir, max_bytes=int(max_mb * 1024 * 1024))
+        return _result_cache
+
 
 class LLMEvaluator:
     """
@@ -49,6 +85,8 @@ class LLMEvaluator:
         
         # Priority: EVALUATION_API_BASE > OPENAI_API_BASE
         base_url = os.getenv("EVALUATION_API_BASE") or os.getenv("OPENAI_API_BASE")
+        self._api_key = api_key
+        self._base_url = base_url
         
         # Allow overriding evaluation model
         if os.getenv("EVALUATION_MODEL"):
@@ -62,15 +100,23 @@ class LLMEvaluator:
         
         if base_url:
             print(f"🔧 Evaluation API base URL: {base_url}")
-            self.client = OpenAI(api_key=api_key, base_url=base_url)
         else:
             print(f"🔧 Evaluation using default OpenAI endpoint")
-            self.client = OpenAI(api_key=api_key)
+        self.client = self._create_client()
         
         print(f"🔧 Evaluation model: {self.model}")
         
-        # Cache for loaded meta-prompts
-        self._meta_prompt_cache: Dict[str, Dict] = {}
+        # Loaded meta-prompts are shared across evaluator instances
+        self._meta_prompt_cache = _meta_prompt_cache
+        self.result_cache = get_evaluation_result_cache()
+
+    def _create_client(self) -> Any:
+        """Synchronous OpenAI client for the evaluation endpoint"""
+        if OpenAI is None:
+            raise ImportError("The openai package is required for LLM evaluation")
+        if self._base_url:
+            return OpenAI(api_key=self._api_key, base_url=self._base_url)
+        return OpenAI(api_key=self._api_key)
 
     def evaluate_artifact(
         self,
@@ -95,6 +141,42 @@ class LLMEvaluator:
         if max_payment is None:
             max_payment = self.max_payment
 
+        prepared = self._prepare_evaluation(task, artifact_paths, max_payment)
+        if isinstance(prepared, tuple):
+            return prepared
+        cache_key = prepared['cache_key']
+
+        # Read artifacts and build the multimodal request
+        messages = self._build_messages(task, prepared, description)
+
+        # Call LLM for evaluation
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                # temperature=0.3,  # Lower temperature for consistent evaluation
+                # max_tokens=2000
+            )
+            evaluation_text = response.choices[0].message.content
+        except Exception as e:
+            self._raise_evaluation_error(e, task)
+
+        return self._finish_evaluation(evaluation_text, max_payment, cache_key)
+
+    def _prepare_evaluation(
+        self,
+        task: Dict,
+        artifact_paths: list[str],
+        max_payment: float
+    ) -> Union[Tuple[float, str, float], Dict[str, Any]]:
+        """
+        Resolve the rubric and artifacts for an evaluation
+
+        Returns:
+            A final (score, feedback, payment) tuple when no API call is needed
+            (invalid task, no artifacts, or a cached result), otherwise a dict
+            with meta_prompt, existing/missing artifacts and the result cache key
+        """
         # Get task category (occupation)
         occupation = task.get('occupation', '')
 
@@ -129,70 +211,102 @@ class LLMEvaluator:
                 0.0
             )
 
+        cache_key = self._result_cache_key(task, occupation, existing_artifacts, missing_artifacts)
+        cached = self.result_cache.get(cache_key, codec="json", kind="evaluation")
+        if cached is not None:
+            print(f"♻️ Reusing cached evaluation for task {task.get('task_id')} (artifacts unchanged)")
+            return (cached['score'], cached['feedback'], cached['score'] * max_payment)
+
+        return {
+            'meta_prompt': meta_prompt,
+            'existing_artifacts': existing_artifacts,
+            'missing_artifacts': missing_artifacts,
+            'cache_key': cache_key
+        }
+
+    def _result_cache_key(
+        self,
+        task: Dict,
+        occupation: str,
+        existing_artifacts: list[str],
+        missing_artifacts: list[str]
+    ) -> str:
+        """Key from model, rubric version, task and artifact contents (not the agent's description)"""
+        material = json.dumps([
+            EVALUATION_CACHE_VERSION,
+            self.model,
+            self._rubric_version(occupation),
+            task.get('task_id'),
+            hashlib.sha256(str(task.get('prompt', '')).encode('utf-8')).hexdigest(),
+            [(os.path.basename(p), self.result_cache.file_digest(p)) for p in existing_artifacts],
+            [os.path.basename(p) for p in missing_artifacts]
+        ], default=str)
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _build_messages(self, task: Dict, prepared: Dict[str, Any], description: str) -> List[Dict]:
+        """Read artifact contents and build the chat messages for an evaluation"""
         # Read artifact contents (with size limits for API)
-        artifact_data = self._read_artifacts_with_images(existing_artifacts)
+        artifact_data = self._read_artifacts_with_images(prepared['existing_artifacts'])
 
         # Build evaluation request with multimodal support
         user_message_content = self._build_multimodal_evaluation_content(
-            meta_prompt=meta_prompt,
+            meta_prompt=prepared['meta_prompt'],
             task=task,
             artifact_data=artifact_data,
-            missing_artifacts=missing_artifacts,
+            missing_artifacts=prepared['missing_artifacts'],
             description=description
         )
 
-        # Call LLM for evaluation
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert work evaluator. Follow the provided rubric precisely and output a structured evaluation."
-                    },
-                    {
-                        "role": "user",
-                        "content": user_message_content
-                    }
-                ],
-                # temperature=0.3,  # Lower temperature for consistent evaluation
-                # max_tokens=2000
-            )
-
-            evaluation_text = response.choices[0].message.content
-
-            # Parse evaluation score from response
-            score = self._extract_score(evaluation_text)
-
-            # Convert 0-10 score to 0.0-1.0 scale
-            normalized_score = score / 10.0
-
-            # Calculate payment based on score using task-specific max_payment
-            payment = normalized_score * max_payment
-
-            return (normalized_score, evaluation_text, payment)
-
-        except Exception as e:
-            error_msg = f"LLM evaluation failed: {str(e)}"
-            print(f"❌ {error_msg}")
+        return [
+            {
+                "role": "system",
+                "content": EVALUATION_SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": user_message_content
+            }
+        ]
 
-            # Log detailed error information
-            from livebench.utils.logger import log_error
-            log_error(
-                "LLM evaluation API call failed",
-                context={
-                    "model": self.model,
-                    "occupation": occupation,
-                    "task_id": task.get('task_id'),
-                    "api_base": os.getenv("OPENAI_API_BASE", "default"),
-                    "error_type": type(e).__name__,
-                    "has_api_key": bool(os.getenv("OPENAI_API_KEY"))
-                },
-                exception=e
-            )
+    def _finish_evaluation(self, evaluation_text: str, max_payment: float, cache_key: str) -> Tuple[float, str, float]:
+        """Score the LLM response, cache it and compute the payment"""
+        # Parse evaluation score from response
+        score, matched = self._extract_score(evaluation_text)
+
+        # Convert 0-10 score to 0.0-1.0 scale
+        normalized_score = score / 10.0
+
+        # Guessed or default scores are not cached, so the next run re-evaluates
+        if matched:
+            self.result_cache.put(cache_key, {'score': normalized_score, 'feedback': evaluation_text}, codec="json")
+
+        # Calculate payment based on score using task-specific max_payment
+        payment = normalized_score * max_payment
+
+        return (normalized_score, evaluation_text, payment)
+
+    def _raise_evaluation_error(self, e: Exception, task: Dict) -> NoReturn:
+        """Log a failed evaluation API call and re-raise (no fallback)"""
+        error_msg = f"LLM evaluation failed: {str(e)}"
+        print(f"❌ {error_msg}")
+
+        # Log detailed error information
+        from livebench.utils.logger import log_error
+        log_error(
+            "LLM evaluation API call failed",
+            context={
+                "model": self.model,
+                "occupation": task.get('occupation', ''),
+                "task_id": task.get('task_id'),
+                "api_base": os.getenv("OPENAI_API_BASE", "default"),
+                "error_type": type(e).__name__,
+                "has_api_key": bool(os.getenv("OPENAI_API_KEY"))
+            },
+            exception=e
+        )
 
-            # Re-raise the error - no fallback
-            raise RuntimeError(f"LLM evaluation failed and no fallback is configured: {error_msg}") from e
+        # Re-raise the error - no fallback
+        raise RuntimeError(f"LLM evaluation failed and no fallback is configured: {error_msg}") from e
 
     def _load_meta_prompt(self, occupation: str) -> Optional[Dict]:
         """
@@ -204,33 +318,49 @@ class LLMEvaluator:
         Returns:
             Meta-prompt dictionary or None if not found
         """
+        entry = self._load_meta_prompt_entry(occupation)
+        return entry[1] if entry else None
+
+    def _rubric_version(self, occupation: str) -> str:
+        """Rubric version for an occupation: its 'version' field or a hash of the meta-prompt"""
+        entry = self._load_meta_prompt_entry(occupation)
+        return entry[2] if entry else ""
+
+    def _load_meta_prompt_entry(self, occupation: str) -> Optional[Tuple[int, Dict, str]]:
+        """Load (mtime_ns, meta_prompt, rubric_version), reloading only when the file changes"""
         # Normalize occupation name to match file naming
         normalized = occupation.replace(' ', '_').replace(',', '')
-        
-        # Check cache first
-        if normalized in self._meta_prompt_cache:
-            return self._meta_prompt_cache[normalized]
-        
-        # Try to find matching meta-prompt file
         meta_prompt_path = self.meta_prompts_dir / f"{normalized}.json"
-        
-        if not meta_prompt_path.exists():
+        cache_key = str(meta_prompt_path.resolve())
+
+        try:
+            mtime_ns = meta_prompt_path.stat().st_mtime_ns
+        except OSError:
             print(f"⚠️ No meta-prompt found for occupation: {occupation}")
             print(f"   Looking for: {meta_prompt_path}")
             return None
-        
+
+        # Check cache first
+        cached = self._meta_prompt_cache.get(cache_key)
+        if cached and cached[0] == mtime_ns:
+            return cached
+
         # Load and cache
         try:
             with open(meta_prompt_path, 'r', encoding='utf-8') as f:
-                meta_prompt = json.load(f)
-            
-            self._meta_prompt_cache[normalized] = meta_prompt
-            return meta_prompt
-            
+                raw = f.read()
+            meta_prompt = json.loads(raw)
+            rubric_version = str(meta_prompt.get('version') or hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16])
+
+            entry = (mtime_ns, meta_prompt, rubric_version)
+            with _cache_lock:
+                self._meta_prompt_cache[cache_key] = entry
+            return entry
+
         except Exception as e:
             print(f"⚠️ Error loading meta-prompt for {occupation}: {e}")
             return None
-
+    
     def _read_artifacts(self, artifact_paths: list[str], max_size_kb: int = 2000) -> Dict[str, str]:
         """
         Read artifact file contents with size limits and format extraction
@@ -257,9 +387,9 @@ class LLMEvaluator:
                 else:
                     # Handle different file types
                     if file_ext == '.docx':
-                        contents[path] = self._read_docx_content(path)
+                        contents[path] = cached_extraction(path, "eval_docx_text", lambda: self._read_docx_content(path))
                     elif file_ext == '.xlsx':
-                        contents[path] = self._read_xlsx_content(path)
+                        contents[path] = cached_extraction(path, "eval_xlsx_text", lambda: self._read_xlsx_content(path))
                     elif file_ext in ['.png', '.jpg', '.jpeg', '.gif']:
                         contents[path] = f"[Image file: {file_ext}, {file_size} bytes. Image analysis not yet implemented - evaluator should assess based on task requirements and file existence]"
                     elif file_ext == '.pdf':
@@ -423,7 +553,7 @@ class LLMEvaluator:
             
             # Handle documents with content extraction
             elif file_ext == '.docx':
-                content = self._read_docx_content(path)
+                content = cached_extraction(path, "eval_docx_text", lambda: self._read_docx_content(path))
                 if content.startswith("[DOCX file present but extraction failed"):
                     from livebench.utils.logger import log_error
                     log_error(f"DOCX extraction failed: {path}", context={'path': path})
@@ -435,7 +565,7 @@ class LLMEvaluator:
                 }
             
             elif file_ext == '.xlsx':
-                content = self._read_xlsx_content(path)
+                content = cached_extraction(path, "eval_xlsx_text", lambda: self._read_xlsx_content(path))
                 if content.startswith("[Excel file present but extraction failed"):
                     from livebench.utils.logger import log_error
                     log_error(f"XLSX extraction failed: {path}", context={'path': path})
@@ -447,7 +577,7 @@ class LLMEvaluator:
                 }
             
             elif file_ext == '.pptx':
-                # Use unified PPTX reader from file_reading.py
+                # Use unified PPTX reader from file_reading.py (shares its extraction cache)
                 from livebench.tools.productivity.file_reading import read_pptx_as_images
                 from livebench.utils.logger import log_error
                 
@@ -470,7 +600,7 @@ class LLMEvaluator:
                 }
             
             elif file_ext == '.pdf':
-                # Convert PDF to images (4 pages per combined image)
+                # Convert PDF to images (4 pages per combined image, cached by content)
                 from livebench.tools.productivity.file_reading import read_pdf_as_images
                 from livebench.utils.logger import log_error
                 
@@ -739,7 +869,7 @@ Remember: The scoring scale is 0-10, where:
         
         return prompt
 
-    def _extract_score(self, evaluation_text: str) -> float:
+    def _extract_score(self, evaluation_text: str) -> Tuple[float, bool]:
         """
         Extract numerical score from LLM evaluation response
 
@@ -747,16 +877,18 @@ Remember: The scoring scale is 0-10, where:
             evaluation_text: Full evaluation text from LLM
 
         Returns:
-            Score as float (0-10 scale)
+            Tuple of (score as float on the 0-10 scale, whether an explicit
+            score pattern matched rather than a guessed or default score)
         """
         import re
         
-        # Look for "OVERALL SCORE: X" pattern
+        # Look for "OVERALL SCORE: X" pattern; the meta-prompts ask for
+        # "**OVERALL SCORE:** X", so skip markdown emphasis after the colon
         patterns = [
-            r'OVERALL SCORE:\s*(\d+(?:\.\d+)?)',
-            r'Overall Score:\s*(\d+(?:\.\d+)?)',
-            r'Score:\s*(\d+(?:\.\d+)?)/10',
-            r'Final Score:\s*(\d+(?:\.\d+)?)',
+            r'OVERALL SCORE:[*_\s]*(\d+(?:\.\d+)?)',
+            r'Overall Score:[*_\s]*(\d+(?:\.\d+)?)',
+            r'Score:[*_\s]*(\d+(?:\.\d+)?)/10',
+            r'Final Score:[*_\s]*(\d+(?:\.\d+)?)',
         ]
         
         for pattern in patterns:
@@ -764,7 +896,7 @@ Remember: The scoring scale is 0-10, where:
             if match:
                 score = float(match.group(1))
                 # Clamp to 0-10 range
-                return max(0.0, min(10.0, score))
+                return max(0.0, min(10.0, score)), True
         
         # If no score found, look for any number in first 200 chars
         first_part = evaluation_text[:200]
@@ -773,17 +905,180 @@ Remember: The scoring scale is 0-10, where:
         if numbers:
             score = float(numbers[0])
             if 0 <= score <= 10:
-                return score
+                return score, False
         
         # Default to 5.0 if no score found
         print("⚠️ Could not extract score from evaluation, defaulting to 5.0")
-        return 5.0
+        return 5.0, False
 
     # REMOVED: Fallback evaluation method
     # System now requires LLM evaluation to ensure quality and consistency
     # Errors will propagate if LLM evaluation fails
 
 
+class AsyncLLMEvaluator(LLMEvaluator):
+    """
+    Async LLMEvaluator for evaluating many artifacts concurrently.
+
+    All requests share one pooled HTTP client, at most max_in_flight
+    evaluation calls run at once, and results come from the same
+    content-addressed cache as the sync evaluator. Point
+    EVALUATION_API_BASE at any OpenAI-compatible server (including a local
+    stub) to exercise it without real API calls.
+    """
+
+    def __init__(
+        self,
+        meta_prompts_dir: str = "./eval/meta_prompts",
+        model: str = "gpt-4o",
+        max_payment: float = 50.0,
+        max_in_flight: int = 8,
+        max_connections: int = 16,
+        request_timeout: float = 300.0
+    ):
+        """
+        Initialize Async LLM Evaluator
+
+        Args:
+            meta_prompts_dir: Path to directory containing evaluation meta-prompts
+            model: OpenAI model to use for evaluation
+            max_payment: Maximum payment for perfect work
+            max_in_flight: Maximum evaluations being prepared or sent at once
+            max_connections: Size of the shared HTTP connection pool
+            request_timeout: Timeout in seconds for each evaluation request
+        """
+        super().__init__(meta_prompts_dir=meta_prompts_dir, model=model, max_payment=max_payment)
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_connections = max(1, max_connections)
+        self.request_timeout = request_timeout
+
+        # Pooled client and in-flight limit are bound to the running event loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.async_client = None
+        self._in_flight: Optional[asyncio.Semaphore] = None
+
+    def _create_async_client(self) -> Any:
+        """AsyncOpenAI client over a pooled httpx client"""
+        import httpx
+        from openai import AsyncOpenAI
+
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections
+            ),
+            timeout=self.request_timeout
+        )
+        kwargs = {"api_key": self._api_key, "http_client": http_client}
+        if self._base_url:
+            kwargs["base_url"] = self._base_url
+        return AsyncOpenAI(**kwargs)
+
+    async def _bind_loop(self) -> None:
+        """Create the pooled client and semaphore for the current event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        # Swap in the new client before awaiting anything, so concurrent
+        # callers on this loop share it, then release the old loop's pool
+        old_client, old_loop = self.async_client, self._loop
+        self.async_client = self._create_async_client()
+        self._in_flight = asyncio.Semaphore(self.max_in_flight)
+        self._loop = loop
+        await self._close_client(old_client, old_loop)
+
+    @staticmethod
+    async def _close_client(client: Any, client_loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        if client is None:
+            return
+        if client_loop is not None and client_loop is not asyncio.get_running_loop() and client_loop.is_running():
+            # Its connections belong to a loop still running elsewhere
+            asyncio.run_coroutine_threadsafe(client.close(), client_loop)
+            return
+        try:
+            await client.close()
+        except RuntimeError:
+            pass  # transports of an already closed loop are gone with it
+
+    async def aevaluate_artifact(
+        self,
+        task: Dict,
+        artifact_paths: list[str],
+        description: str = "",
+        max_payment: Optional[float] = None
+    ) -> Tuple[float, str, float]:
+        """
+        Async version of evaluate_artifact
+
+        Returns:
+            Tuple of (evaluation_score 0.0-1.0, feedback_text, payment_amount)
+        """
+        if max_payment is None:
+            max_payment = self.max_payment
+
+        await self._bind_loop()
+
+        # The slot covers building the payload too, so at most max_in_flight
+        # multimodal payloads are held in memory at once
+        async with self._in_flight:
+            # Hashing, document extraction and base64 encoding are blocking
+            prepared = await asyncio.to_thread(self._prepare_evaluation, task, artifact_paths, max_payment)
+            if isinstance(prepared, tuple):
+                return prepared
+            messages = await asyncio.to_thread(self._build_messages, task, prepared, description)
+
+            try:
+                response = await self.async_client.chat.completions.create(
+                    model=self.model,
+                    messages=messages
+                )
+                evaluation_text = response.choices[0].message.content
+            except Exception as e:
+                self._raise_evaluation_error(e, task)
+
+        return self._finish_evaluation(evaluation_text, max_payment, prepared['cache_key'])
+
+    async def evaluate_many(self, jobs: List[Dict[str, Any]]) -> List[Union[Tuple[float, str, float], Exception]]:
+        """
+        Evaluate many (task, artifacts) pairs concurrently
+
+        Args:
+            jobs: List of dicts with 'task', 'artifact_paths' and optional
+                'description' and 'max_payment'
+
+        Returns:
+            One (score, feedback, payment) tuple per job, in order; failed jobs
+            return their exception instead of aborting the batch
+        """
+        return await asyncio.gather(*(
+            self.aevaluate_artifact(
+                task=job['task'],
+                artifact_paths=job['artifact_paths'],
+                description=job.get('description', ''),
+                max_payment=job.get('max_payment')
+            )
+            for job in jobs
+        ), return_exceptions=True)
+
+    def evaluate_batch(self, jobs: List[Dict[str, Any]]) -> List[Union[Tuple[float, str, float], Exception]]:
+        """Synchronous entry point for evaluate_many (e.g. re-evaluation scripts)"""
+        async def run():
+            try:
+                return await self.evaluate_many(jobs)
+            finally:
+                await self.aclose()
+        return asyncio.run(run())
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client"""
+        client, client_loop = self.async_client, self._loop
+        self.async_client = None
+        self._in_flight = None
+        self._loop = None
+        await self._close_client(client, client_loop)
+
+
 if __name__ == "__main__":
     """Test the LLM evaluator"""
     
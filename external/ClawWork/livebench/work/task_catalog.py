@@ -0,0 +1,167 @@
+"""
+Task Catalog - Indexed task storage for TaskManager
+
+Keeps only the columns needed for lookup and filtering (task_id, sector,
+occupation) in memory, with an id -> row map and per-sector/occupation
+row indexes. Full task dicts are built on demand, so a large parquet
+source costs three columns at startup instead of one dict per task.
+"""
+
+import bisect
+import random
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+INDEX_COLUMNS = ["task_id", "sector", "occupation"]
+
+
+class TaskCatalog:
+    """Row-indexed task catalog with lazily materialized task dicts"""
+
+    def __init__(
+        self,
+        task_ids: List[str],
+        sectors: List[str],
+        occupations: List[str],
+        load_row: Callable[[int], Dict]
+    ):
+        """
+        Args:
+            task_ids: Task id per row
+            sectors: Sector per row
+            occupations: Occupation per row
+            load_row: Builds the full task dict for a row index
+        """
+        self.task_ids = task_ids
+        self.sectors = sectors
+        self.occupations = occupations
+        self._load_row = load_row
+        self._tasks: Dict[int, Dict] = {}  # row -> materialized task
+
+        self.row_by_id: Dict[str, int] = {}  # first row for each id
+        self.duplicate_rows: Dict[str, List[int]] = {}  # every row, only for ids seen twice
+        self.rows_by_sector: Dict[str, List[int]] = {}
+        self.rows_by_occupation: Dict[str, List[int]] = {}
+        for row, (task_id, sector, occupation) in enumerate(zip(task_ids, sectors, occupations)):
+            first = self.row_by_id.setdefault(task_id, row)
+            if first != row:
+                self.duplicate_rows.setdefault(task_id, [first]).append(row)
+            self.rows_by_sector.setdefault(sector, []).append(row)
+            self.rows_by_occupation.setdefault(occupation, []).append(row)
+
+    @classmethod
+    def from_records(cls, records: List[Dict]) -> "TaskCatalog":
+        """Catalog over already-parsed task dicts (jsonl / inline sources)"""
+        return cls(
+            [t['task_id'] for t in records],
+            [t['sector'] for t in records],
+            [t['occupation'] for t in records],
+            records.__getitem__
+        )
+
+    @classmethod
+    def from_parquet(cls, parquet_path: str) -> "TaskCatalog":
+        """Catalog over a parquet file, reading only the index columns up front"""
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(parquet_path, memory_map=True)
+        index = parquet_file.read(columns=INDEX_COLUMNS)
+
+        # First row of each row group, so a row maps to one group to read
+        group_starts = []
+        start = 0
+        for i in range(parquet_file.num_row_groups):
+            group_starts.append(start)
+            start += parquet_file.metadata.row_group(i).num_rows
+        lock = threading.Lock()
+        last_group = [-1, None]  # (group index, table) of the most recent read
+
+        def load_row(row: int) -> Dict:
+            # Only the row group holding the row is read; neighbours reuse it
+            group = bisect.bisect_right(group_starts, row) - 1
+            with lock:
+                if last_group[0] != group:
+                    last_group[:] = [group, parquet_file.read_row_group(group)]
+                table = last_group[1]
+            return table.slice(row - group_starts[group], 1).to_pylist()[0]
+
+        return cls(
+            index.column("task_id").to_pylist(),
+            index.column("sector").to_pylist(),
+            index.column("occupation").to_pylist(),
+            load_row
+        )
+
+    def __len__(self) -> int:
+        return len(self.task_ids)
+
+    def task(self, row: int) -> Dict:
+        """Full task dict for a row (built once, then reused)"""
+        task = self._tasks.get(row)
+        if task is None:
+            task = self._load_row(row)
+            self._tasks[row] = task
+        return task
+
+    def get(self, task_id: str) -> Optional[Dict]:
+        """Full task dict by id, or None if unknown"""
+        row = self.row_by_id.get(task_id)
+        return None if row is None else self.task(row)
+
+    def rows_for_id(self, task_id: str) -> List[int]:
+        """Every row holding task_id (more than one if the source repeats it)"""
+        rows = self.duplicate_rows.get(task_id)
+        if rows is not None:
+            return rows
+        row = self.row_by_id.get(task_id)
+        return [] if row is None else [row]
+
+    def rows_matching(
+        self,
+        sectors: Optional[Iterable[str]] = None,
+        occupations: Optional[Iterable[str]] = None,
+        task_ids: Optional[Iterable[str]] = None
+    ) -> List[int]:
+        """Rows passing every given filter (None means unfiltered), in catalog order"""
+        rows: Optional[Set[int]] = None
+        if sectors is not None:
+            rows = {r for s in set(sectors) for r in self.rows_by_sector.get(s, ())}
+        if occupations is not None:
+            matched = {r for o in set(occupations) for r in self.rows_by_occupation.get(o, ())}
+            rows = matched if rows is None else rows & matched
+        if task_ids is not None:
+            wanted = set(task_ids)
+            matched = {r for r, tid in enumerate(self.task_ids) if tid in wanted} if rows is None \
+                else {r for r in rows if self.task_ids[r] in wanted}
+            rows = matched
+        if rows is None:
+            return list(range(len(self.task_ids)))
+        return sorted(rows)
+
+
+class RowPool:
+    """Set of rows supporting O(1) membership, removal and uniform random sampling"""
+
+    def __init__(self, rows: Iterable[int] = ()):
+        self._rows: List[int] = list(rows)
+        self._pos: Dict[int, int] = {row: i for i, row in enumerate(self._rows)}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, row: int) -> bool:
+        return row in self._pos
+
+    def discard(self, row: int) -> None:
+        """Remove row if present (swap with last element)"""
+        i = self._pos.pop(row, None)
+        if i is None:
+            return
+        last = self._rows.pop()
+        if i < len(self._rows):
+            self._rows[i] = last
+            self._pos[last] = i
+
+    def sample(self) -> int:
+        """Uniformly random row (uses the module-level random state)"""
+        return random.choice(self._rows)
@@ -5,11 +5,12 @@ Task Manager - Loads and manages gdpval work tasks for LiveBench
 import os
 import json
 import random
-import pandas as pd
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 from datetime import datetime
 
+from .task_catalog import TaskCatalog, RowPool
+
 
 class TaskManager:
     """
@@ -78,10 +79,10 @@ class TaskManager:
         self.agent_filters = agent_filters or {}
         self.agent_assignment = agent_assignment
 
-        # Task storage
-        self.tasks_df: Optional[pd.DataFrame] = None
-        self.tasks_list: List[Dict] = []
-        self.filtered_tasks_list: List[Dict] = []  # Tasks after applying filters
+        # Task storage (indexed; full task dicts are built on demand)
+        self.catalog = TaskCatalog([], [], [], lambda row: {})
+        self.filtered_rows: List[int] = []  # Catalog rows after applying filters
+        self.unused_rows = RowPool()  # Filtered rows not yet assigned
 
         # Task value pricing (task_id -> max_payment)
         self.task_values: Dict[str, float] = {}
@@ -138,22 +139,18 @@ class TaskManager:
                 f"Parquet file not found at {parquet_path}"
             )
 
-        # Load parquet file
-        self.tasks_df = pd.read_parquet(parquet_path)
-
-        # Convert to list of dicts for easier access
-        self.tasks_list = self.tasks_df.to_dict('records')
+        # Load only the index columns; task rows are read when selected
+        self.catalog = TaskCatalog.from_parquet(parquet_path)
 
         # Apply filters
         self._apply_filters()
 
-        print(f"✅ Loaded {len(self.tasks_list)} tasks from parquet")
-        print(f"   After filtering: {len(self.filtered_tasks_list)} tasks available")
-        if self.tasks_df is not None:
-            print(f"   Sectors: {self.tasks_df['sector'].nunique()}")
-            print(f"   Occupations: {self.tasks_df['occupation'].nunique()}")
+        print(f"✅ Loaded {len(self.catalog)} tasks from parquet")
+        print(f"   After filtering: {len(self.filtered_rows)} tasks available")
+        print(f"   Sectors: {len(self.catalog.rows_by_sector)}")
+        print(f"   Occupations: {len(self.catalog.rows_by_occupation)}")
 
-        return len(self.filtered_tasks_list)
+        return len(self.filtered_rows)
 
     def _load_jsonl_tasks(self) -> int:
         """Load tasks from JSONL file"""
@@ -166,7 +163,7 @@ class TaskManager:
             )
 
         # Load JSONL
-        self.tasks_list = []
+        tasks_list = []
         with open(self.task_source_path, 'r', encoding='utf-8') as f:
             for line_num, line in enumerate(f, 1):
                 line = line.strip()
@@ -175,36 +172,40 @@ class TaskManager:
                 try:
                     task = json.loads(line)
                     self._validate_task_schema(task, line_num)
-                    self.tasks_list.append(task)
+                    tasks_list.append(task)
                 except json.JSONDecodeError as e:
                     print(f"⚠️ Warning: Invalid JSON on line {line_num}: {e}")
                     continue
 
+        self.catalog = TaskCatalog.from_records(tasks_list)
+
         # Apply filters
         self._apply_filters()
 
-        print(f"✅ Loaded {len(self.tasks_list)} tasks from JSONL")
-        print(f"   After filtering: {len(self.filtered_tasks_list)} tasks available")
+        print(f"✅ Loaded {len(self.catalog)} tasks from JSONL")
+        print(f"   After filtering: {len(self.filtered_rows)} tasks available")
 
-        return len(self.filtered_tasks_list)
+        return len(self.filtered_rows)
 
     def _load_inline_tasks(self) -> int:
         """Load tasks from inline configuration"""
         if not self.inline_tasks:
             raise ValueError("inline_tasks required for inline type")
 
-        self.tasks_list = []
+        tasks_list = []
         for idx, task in enumerate(self.inline_tasks):
             self._validate_task_schema(task, idx)
-            self.tasks_list.append(task)
+            tasks_list.append(task)
+
+        self.catalog = TaskCatalog.from_records(tasks_list)
 
         # Apply filters
         self._apply_filters()
 
-        print(f"✅ Loaded {len(self.tasks_list)} inline tasks")
-        print(f"   After filtering: {len(self.filtered_tasks_list)} tasks available")
+        print(f"✅ Loaded {len(self.catalog)} inline tasks")
+        print(f"   After filtering: {len(self.filtered_rows)} tasks available")
 
-        return len(self.filtered_tasks_list)
+        return len(self.filtered_rows)
 
     def _load_task_values(self) -> None:
         """Load task values from JSONL file"""
@@ -258,46 +259,39 @@ class TaskManager:
             task['reference_files'] = []
 
     def _apply_filters(self) -> None:
-        """Apply agent-specific filters to task list"""
-        # Start with all tasks
-        self.filtered_tasks_list = self.tasks_list.copy()
-
+        """Apply agent-specific filters to the catalog using its indexes"""
         # If explicit assignment configured, filter to only those task IDs
         if self.agent_assignment and 'task_ids' in self.agent_assignment:
             assigned_ids = set(self.agent_assignment['task_ids'])
-            self.filtered_tasks_list = [
-                t for t in self.filtered_tasks_list
-                if t['task_id'] in assigned_ids
-            ]
+            self._set_filtered_rows(self.catalog.rows_matching(task_ids=assigned_ids))
             print(f"   Applied explicit assignment filter: {len(assigned_ids)} task IDs")
             return  # Don't apply other filters if explicit assignment
 
+        sectors = occupations = task_ids = None
+
         # Apply sector filter
         if 'sectors' in self.agent_filters and self.agent_filters['sectors']:
-            allowed_sectors = set(self.agent_filters['sectors'])
-            self.filtered_tasks_list = [
-                t for t in self.filtered_tasks_list
-                if t['sector'] in allowed_sectors
-            ]
-            print(f"   Applied sector filter: {allowed_sectors}")
+            sectors = set(self.agent_filters['sectors'])
+            print(f"   Applied sector filter: {sectors}")
 
         # Apply occupation filter
         if 'occupations' in self.agent_filters and self.agent_filters['occupations']:
-            allowed_occupations = set(self.agent_filters['occupations'])
-            self.filtered_tasks_list = [
-                t for t in self.filtered_tasks_list
-                if t['occupation'] in allowed_occupations
-            ]
-            print(f"   Applied occupation filter: {allowed_occupations}")
+            occupations = set(self.agent_filters['occupations'])
+            print(f"   Applied occupation filter: {occupations}")
 
         # Apply task_id filter
         if 'task_ids' in self.agent_filters and self.agent_filters['task_ids']:
-            allowed_ids = set(self.agent_filters['task_ids'])
-            self.filtered_tasks_list = [
-                t for t in self.filtered_tasks_list
-                if t['task_id'] in allowed_ids
-            ]
-            print(f"   Applied task_id filter: {len(allowed_ids)} IDs")
+            task_ids = set(self.agent_filters['task_ids'])
+            print(f"   Applied task_id filter: {len(task_ids)} IDs")
+
+        self._set_filtered_rows(self.catalog.rows_matching(sectors, occupations, task_ids))
+
+    def _set_filtered_rows(self, rows: List[int]) -> None:
+        """Set the filtered rows and rebuild the unused pool from them"""
+        self.filtered_rows = rows
+        self.unused_rows = RowPool(
+            row for row in rows if self.catalog.task_ids[row] not in self.used_tasks
+        )
 
     def select_daily_task(self, date: str, signature: Optional[str] = None) -> Optional[Dict]:
         """
@@ -314,7 +308,7 @@ class TaskManager:
             ValueError: If invalid assignment configuration
         """
         # Check if tasks loaded
-        if not self.filtered_tasks_list:
+        if not self.filtered_rows:
             print("⚠️  No tasks loaded. Check task source configuration.")
             return None
 
@@ -325,25 +319,21 @@ class TaskManager:
             print(f"📋 Using previously selected task for {date}")
             return task
 
-        # Get available tasks (exclude already used tasks)
-        available_tasks = [
-            task for task in self.filtered_tasks_list
-            if task['task_id'] not in self.used_tasks
-        ]
-
-        # Check if any tasks available
-        if not available_tasks:
+        # Check if any tasks available (unused_rows excludes already used tasks)
+        if not self.unused_rows:
             print(f"⚠️  No more tasks available for {date}")
-            print(f"   Total tasks: {len(self.filtered_tasks_list)}")
+            print(f"   Total tasks: {len(self.filtered_rows)}")
             print(f"   Used tasks: {len(self.used_tasks)}")
             return None
 
         # Select task based on assignment mode
         if self.agent_assignment and 'mode' in self.agent_assignment:
-            task = self._select_assigned_task(date, available_tasks)
+            task = self._select_assigned_task(date)
+            if task is None:
+                return None
         else:
             # Random selection (default behavior)
-            task = random.choice(available_tasks)
+            task = self.catalog.task(self.unused_rows.sample())
 
         # Add max_payment to task based on task values
         task_id = task['task_id']
@@ -357,6 +347,8 @@ class TaskManager:
         # Track selection
         self.daily_tasks[date] = task['task_id']
         self.used_tasks.add(task_id)  # Mark task as used
+        for row in self.catalog.rows_for_id(task_id):
+            self.unused_rows.discard(row)
 
         # Log assignment if signature provided
         if signature:
@@ -367,17 +359,16 @@ class TaskManager:
         print(f"   Sector: {task['sector']}")
         print(f"   Occupation: {task['occupation']}")
         print(f"   Max payment: ${task['max_payment']:.2f}")
-        print(f"   Remaining tasks: {len(available_tasks) - 1}")
+        print(f"   Remaining tasks: {len(self.unused_rows)}")
 
         return task
 
-    def _select_assigned_task(self, date: str, available_tasks: List[Dict]) -> Optional[Dict]:
+    def _select_assigned_task(self, date: str) -> Optional[Dict]:
         """
         Select task based on explicit assignment configuration
 
         Args:
             date: Date string
-            available_tasks: List of tasks that haven't been used yet
 
         Returns:
             Selected task, or None if no available tasks
@@ -449,7 +440,7 @@ class TaskManager:
 
     def _get_task_by_id(self, task_id: str) -> Optional[Dict]:
         """
-        Get task by ID from filtered task list
+        Get task by ID via the catalog's id index
 
         Args:
             task_id: Task identifier
@@ -457,17 +448,7 @@ class TaskManager:
         Returns:
             Task dictionary or None if not found
         """
-        # Search filtered list first
-        for task in self.filtered_tasks_list:
-            if task['task_id'] == task_id:
-                return task
-
-        # Fallback to full task list if not in filtered
-        for task in self.tasks_list:
-            if task['task_id'] == task_id:
-                return task
-
-        return None
+        return self.catalog.get(task_id)
 
     def get_task_prompt(self, task: Dict) -> str:
         """
@@ -591,18 +572,18 @@ class TaskManager:
         Returns:
             Dictionary with statistics
         """
-        if self.tasks_df is None:
+        if not len(self.catalog):
             return {"error": "Tasks not loaded"}
 
         return {
-            "total_tasks": len(self.tasks_list),
+            "total_tasks": len(self.catalog),
             "sectors": {
-                "count": self.tasks_df['sector'].nunique(),
-                "list": self.tasks_df['sector'].unique().tolist()
+                "count": len(self.catalog.rows_by_sector),
+                "list": list(self.catalog.rows_by_sector)
             },
             "occupations": {
-                "count": self.tasks_df['occupation'].nunique(),
-                "list": self.tasks_df['occupation'].unique().tolist()
+                "count": len(self.catalog.rows_by_occupation),
+                "list": list(self.catalog.rows_by_occupation)
             },
             "tasks_assigned": len(self.daily_tasks)
         }
@@ -615,6 +596,6 @@ class TaskManager:
     def __str__(self) -> str:
         return (
             f"TaskManager("
-            f"tasks={len(self.tasks_list)}, "
+            f"tasks={len(self.catalog)}, "
             f"assigned={len(self.daily_tasks)})"
         )
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark the buffered append writer against per-line open/close
+
+Simulates many agents each appending JSONL records (balance, token cost
+and log lines) to their own files, and compares:
+
+- legacy: open(path, "a") + json.dumps(record) + close for every line
+- buffered: AppendWriter with batching, compact JSON, flushed at the end
+
+Usage:
+    python scripts/benchmark_append_writer.py --agents 50 --records 2000
+    python scripts/benchmark_append_writer.py --fsync batch --dir /mnt/shared/tmp
+"""
+
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from livebench.utils.append_writer import AppendWriter
+
+FILES = ["economic/balance.jsonl", "economic/token_costs.jsonl", "logs/debug.jsonl", "terminal_logs/day.log"]
+
+
+def make_record(agent: int, i: int):
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "signature": f"agent-{agent}",
+        "level": "DEBUG",
+        "message": f"Tool executed successfully: search_web ({i})",
+        "context": {"tool": "search_web", "args": "{'query': 'quarterly revenue'}", "duration_seconds": 0.42},
+    }
+
+
+def run_legacy(root: Path, agents: int, records: int) -> float:
+    start = time.perf_counter()
+    for i in range(records):
+        for agent in range(agents):
+            path = root / f"agent-{agent}" / FILES[i % len(FILES)]
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(make_record(agent, i)) + "\n")
+    return time.perf_counter() - start
+
+
+def run_buffered(root: Path, agents: int, records: int, args) -> float:
+    writer = AppendWriter(max_pending=args.max_pending, flush_interval=args.flush_interval, fsync=args.fsync)
+    start = time.perf_counter()
+    for i in range(records):
+        for agent in range(agents):
+            path = root / f"agent-{agent}" / FILES[i % len(FILES)]
+            writer.write_record(str(path), make_record(agent, i))
+    writer.close_all()
+    elapsed = time.perf_counter() - start
+    print(f"   buffered: {writer.lines_written:,} lines in {writer.write_calls:,} write() calls")
+    return elapsed
+
+
+def prepare(root: Path, agents: int) -> None:
+    for agent in range(agents):
+        for name in FILES:
+            (root / f"agent-{agent}" / name).parent.mkdir(parents=True, exist_ok=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark buffered JSONL appends")
+    parser.add_argument("--agents", type=int, default=50)
+    parser.add_argument("--records", type=int, default=2000, help="Records per agent")
+    parser.add_argument("--max-pending", type=int, default=64)
+    parser.add_argument("--flush-interval", type=float, default=1.0)
+    parser.add_argument("--fsync", choices=["never", "flush", "batch"], default="flush")
+    parser.add_argument("--dir", default=None, help="Directory to write in (e.g. on shared storage)")
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(dir=args.dir))
+    try:
+        legacy_root, buffered_root = root / "legacy", root / "buffered"
+        prepare(legacy_root, args.agents)
+        prepare(buffered_root, args.agents)
+        total = args.agents * args.records
+
+        print(f"\nAppend benchmark: {args.agents} agents x {args.records:,} records = {total:,} lines\n")
+        legacy = run_legacy(legacy_root, args.agents, args.records)
+        buffered = run_buffered(buffered_root, args.agents, args.records, args)
+
+        legacy_bytes = sum(p.stat().st_size for p in legacy_root.rglob("*") if p.is_file())
+        buffered_bytes = sum(p.stat().st_size for p in buffered_root.rglob("*") if p.is_file())
+        print(f"   legacy:   {legacy:8.2f}s  {total / legacy:>10,.0f} lines/s  {legacy_bytes / 1e6:6.1f} MB")
+        print(f"   buffered: {buffered:8.2f}s  {total / buffered:>10,.0f} lines/s  {buffered_bytes / 1e6:6.1f} MB")
+        print(f"   speedup:  {legacy / buffered:.1f}x, {1 - buffered_bytes / legacy_bytes:.0%} fewer bytes")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
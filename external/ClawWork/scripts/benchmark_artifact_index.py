@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmark the artifact index against the per-request sandbox walk
+
+Builds a synthetic tenant tree (agents x dates x files per date, with
+code_exec scratch files and non-artifact files mixed in) and compares:
+
+- legacy: walk every sandbox with rglob + stat, then sample (old endpoint)
+- index:  one build, then O(count) samples and incremental refreshes
+
+Usage:
+    python scripts/benchmark_artifact_index.py                 # 500k files
+    python scripts/benchmark_artifact_index.py --files 50000 --agents 20
+    python scripts/benchmark_artifact_index.py --dir /mnt/shared/tmp --memory
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from livebench.api.artifact_index import ArtifactIndex, ARTIFACT_EXTENSIONS, SKIP_DIRS
+
+# Per 10 files in a date directory: 6 artifacts (2 in a subfolder), 2 scratch, 2 other
+LAYOUT = [
+    ("", ".docx"), ("", ".pdf"), ("", ".xlsx"), ("", ".pptx"),
+    ("output", ".pdf"), ("output", ".docx"),
+    ("code_exec", ".pdf"), ("code_exec", ".py"),
+    ("", ".txt"), ("", ".png"),
+]
+
+
+def build_tree(root: Path, agents: int, dates: int, per_date: int) -> int:
+    created = 0
+    for a in range(agents):
+        for d in range(dates):
+            day = root / f"agent-{a:03d}" / "sandbox" / f"2026-{1 + d // 28:02d}-{1 + d % 28:02d}"
+            for sub in ("output", "code_exec"):
+                (day / sub).mkdir(parents=True, exist_ok=True)
+            for i in range(per_date):
+                sub, ext = LAYOUT[i % len(LAYOUT)]
+                fd = os.open(day / sub / f"file-{i:04d}{ext}", os.O_WRONLY | os.O_CREAT, 0o644)
+                os.close(fd)
+                created += 1
+    # Backdate directories so the idle tree is outside the racy window
+    stamp = time.time_ns() - 60 * 10**9
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, ns=(stamp, stamp))
+    return created
+
+
+def legacy_request(data_path: Path, count: int) -> int:
+    """The former get_random_artifacts body"""
+    artifacts = []
+    for agent_dir in data_path.iterdir():
+        if not agent_dir.is_dir():
+            continue
+        sandbox_dir = agent_dir / "sandbox"
+        if not sandbox_dir.exists():
+            continue
+        for date_dir in sandbox_dir.iterdir():
+            if not date_dir.is_dir():
+                continue
+            for file_path in date_dir.rglob("*"):
+                if not file_path.is_file():
+                    continue
+                if any(p in SKIP_DIRS for p in file_path.relative_to(date_dir).parts):
+                    continue
+                ext = file_path.suffix.lower()
+                if ext not in ARTIFACT_EXTENSIONS:
+                    continue
+                artifacts.append({
+                    "agent": agent_dir.name,
+                    "date": date_dir.name,
+                    "filename": file_path.name,
+                    "extension": ext,
+                    "size_bytes": file_path.stat().st_size,
+                    "path": str(file_path.relative_to(data_path)),
+                })
+    if len(artifacts) > count:
+        artifacts = random.sample(artifacts, count)
+    return len(artifacts)
+
+
+def time_samples(index: ArtifactIndex, runs: int, **filters) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        index.sample(30, **filters)
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the artifact index")
+    parser.add_argument("--files", type=int, default=500_000, help="Total files in the synthetic tree")
+    parser.add_argument("--agents", type=int, default=50)
+    parser.add_argument("--dates", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=1000, help="Sample calls per measurement")
+    parser.add_argument("--memory", action="store_true", help="Also measure index memory with tracemalloc")
+    parser.add_argument("--dir", default=None, help="Directory to build the tree in (e.g. on shared storage)")
+    args = parser.parse_args()
+
+    per_date = max(1, args.files // (args.agents * args.dates))
+    root = Path(tempfile.mkdtemp(dir=args.dir))
+    try:
+        data_path = root / "agent_data"
+        print(f"\nBuilding synthetic tree: {args.agents} agents x {args.dates} dates x {per_date} files ...")
+        start = time.perf_counter()
+        created = build_tree(data_path, args.agents, args.dates, per_date)
+        print(f"   {created:,} files in {time.perf_counter() - start:.1f}s\n")
+
+        start = time.perf_counter()
+        legacy_request(data_path, 30)
+        legacy = time.perf_counter() - start
+        print(f"   legacy request (walk + sample):   {legacy * 1000:10.1f} ms")
+
+        index = ArtifactIndex(data_path)
+        start = time.perf_counter()
+        index.refresh()
+        build = time.perf_counter() - start
+        print(f"   index build ({len(index):,} artifacts):  {build * 1000:8.1f} ms  ({index.dirs_scanned:,} dirs)")
+
+        agent = "agent-007"
+        date = index.sample(1)[0]["date"]
+        for label, filters in [
+            ("sample(30)", {}),
+            ("sample(30, agent)", {"agent": agent}),
+            ("sample(30, date)", {"date": date}),
+            ("sample(30, agent, date, .pdf)", {"agent": agent, "date": date, "extension": ".pdf"}),
+        ]:
+            per_call = time_samples(index, args.runs, **filters)
+            print(f"   {label:<34}{per_call * 1e6:10.1f} us   ({legacy / per_call:,.0f}x faster)")
+
+        start = time.perf_counter()
+        index.refresh()
+        idle = time.perf_counter() - start
+        print(f"   idle refresh:                     {idle * 1000:10.1f} ms  ({index.dirs_scanned} dirs listed)")
+
+        for i in range(100):
+            day = data_path / f"agent-{i % args.agents:03d}" / "sandbox"
+            target = next(day.iterdir())
+            (target / f"new-{i}.pdf").touch()
+        start = time.perf_counter()
+        added, _ = index.refresh()
+        incremental = time.perf_counter() - start
+        print(f"   refresh after 100 new files:      {incremental * 1000:10.1f} ms  "
+              f"({added} added, {index.dirs_scanned} dirs listed)")
+
+        if args.memory:
+            tracemalloc.start()
+            measured = ArtifactIndex(data_path)
+            measured.refresh()
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"   index memory:                     {current / 1e6:10.1f} MB  "
+                  f"({current / max(1, len(measured)):.0f} B/artifact)")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark the API live-update pipeline
+
+Creates a synthetic tenants tree with many agents, attaches many fake
+WebSocket clients (a fraction of them deliberately slow), appends balance
+and decision records at a fixed rate and reports:
+
+- event-to-client latency (append -> send_json on a fast client)
+- records delivered / merged / dropped
+- CPU time used by the process during the run
+
+Usage:
+    python scripts/benchmark_live_updates.py --agents 300 --clients 300 --mode inotify
+    python scripts/benchmark_live_updates.py --mode poll --poll-interval 1.0
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from livebench.api.live_updates import ClientChannel, LiveUpdatePipeline
+
+
+class FakeWebSocket:
+    """Records latency of every live-update message it is sent"""
+
+    def __init__(self, send_delay: float = 0.0):
+        self.send_delay = send_delay
+        self.latencies = []
+
+    async def send_json(self, message: dict) -> None:
+        if self.send_delay:
+            await asyncio.sleep(self.send_delay)
+        sent_at = (message.get("data") or {}).get("bench_ts")
+        if sent_at is not None:
+            self.latencies.append(time.time() - sent_at)
+
+
+def build_tree(root: Path, num_tenants: int, num_agents: int) -> list:
+    files = []
+    for i in range(num_agents):
+        agent_dir = root / f"tenant{i % num_tenants}" / "agent_data" / f"agent-{i}"
+        for subdir, filename in (("economic", "balance.jsonl"), ("decisions", "decisions.jsonl")):
+            path = agent_dir / subdir / filename
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Some existing history that must not be re-broadcast
+            with open(path, "w", encoding="utf-8") as f:
+                for day in range(30):
+                    f.write(json.dumps({"date": f"2026-01-{day + 1:02d}", "balance": 10.0}) + "\n")
+            files.append((f"tenant{i % num_tenants}", path))
+    return files
+
+
+async def run_benchmark(args) -> None:
+    root = Path(tempfile.mkdtemp(prefix="livebench_bench_"))
+    try:
+        files = build_tree(root, args.tenants, args.agents)
+
+        channels = []
+
+        def publish(message: dict, tenant_key: str) -> None:
+            for channel in channels:
+                if channel.tenant_key == tenant_key:
+                    channel.offer(message)
+
+        for i in range(args.clients):
+            slow = i < int(args.clients * args.slow_fraction)
+            websocket = FakeWebSocket(send_delay=args.slow_delay if slow else 0.0)
+            channel = ClientChannel(websocket, f"tenant{i % args.tenants}", max_queue=args.queue_size)
+            channel.slow = slow
+            channel.start()
+            channels.append(channel)
+
+        pipeline = LiveUpdatePipeline(root, publish, mode=args.mode, poll_interval=args.poll_interval)
+        watcher = asyncio.create_task(pipeline.run())
+        await asyncio.sleep(0.5)
+
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        interval = 1.0 / args.rate
+        written = 0
+        while time.perf_counter() - wall_start < args.duration:
+            _, path = random.choice(files)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"date": "2026-02-01", "balance": 9.5, "bench_ts": time.time()}) + "\n")
+            written += 1
+            await asyncio.sleep(interval)
+        await asyncio.sleep(max(1.0, args.poll_interval * 2))
+        cpu_used = time.process_time() - cpu_start
+        wall = time.perf_counter() - wall_start
+
+        watcher.cancel()
+        for channel in channels:
+            channel.close()
+
+        fast = [c for c in channels if not c.slow]
+        latencies = sorted(l for c in fast for l in c.websocket.latencies)
+        expected_per_client = written / args.tenants
+
+        print("=" * 60)
+        print(f"Mode: {pipeline.active_mode}  agents={args.agents}  clients={args.clients}  tenants={args.tenants}")
+        print(f"Records appended: {written} over {args.duration:.1f}s")
+        if latencies:
+            p50 = statistics.median(latencies) * 1000
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+            print(f"Fast-client latency: p50={p50:.1f}ms  p99={p99:.1f}ms  max={latencies[-1] * 1000:.1f}ms")
+            delivered = len(latencies) / max(1, len(fast))
+            print(f"Fast-client delivery: {delivered:.0f}/{expected_per_client:.0f} records per client")
+        print(f"Slow clients: merged={sum(c.merged for c in channels)}  dropped={sum(c.dropped for c in channels)}")
+        print(f"CPU: {cpu_used:.2f}s over {wall:.2f}s wall ({cpu_used / wall * 100:.1f}%)")
+        print("=" * 60)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the live-update pipeline")
+    parser.add_argument("--agents", type=int, default=300)
+    parser.add_argument("--clients", type=int, default=300)
+    parser.add_argument("--tenants", type=int, default=3)
+    parser.add_argument("--mode", choices=["auto", "inotify", "poll"], default="auto")
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    parser.add_argument("--rate", type=float, default=200.0, help="Appended records per second")
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--queue-size", type=int, default=256)
+    parser.add_argument("--slow-fraction", type=float, default=0.1)
+    parser.add_argument("--slow-delay", type=float, default=0.05, help="Seconds per send on slow clients")
+    asyncio.run(run_benchmark(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
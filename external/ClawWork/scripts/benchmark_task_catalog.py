@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmark TaskManager task loading and selection
+
+Writes a synthetic catalog (default 100k tasks) and compares the indexed
+TaskManager against the previous list-based approach:
+
+- startup: load the source and apply sector/occupation filters
+- selection: pick one unused random task per simulated day
+- lookup: get_task_by_id for random ids
+
+The "legacy" numbers re-run the previous algorithms inline (to_dict of the
+whole source, one list copy per filter, rebuilding the available list every
+day and scanning lists for id lookups).
+
+Usage:
+    python scripts/benchmark_task_catalog.py --tasks 100000 --days 365
+    python scripts/benchmark_task_catalog.py --source parquet   # needs pandas + pyarrow
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from livebench.work.task_manager import TaskManager
+
+
+def make_tasks(n: int, sectors: int, occupations: int):
+    return [
+        {
+            "task_id": f"task-{i:06d}",
+            "sector": f"sector-{i % sectors}",
+            "occupation": f"occupation-{i % occupations}",
+            "prompt": f"Synthetic task {i}. " + "Produce the deliverable described here. " * 20,
+            "reference_files": [f"reference_files/{i}/input.xlsx"],
+        }
+        for i in range(n)
+    ]
+
+
+def write_source(tasks, root: Path, source: str) -> str:
+    if source == "jsonl":
+        path = root / "tasks.jsonl"
+        with open(path, "w", encoding="utf-8") as f:
+            for task in tasks:
+                f.write(json.dumps(task) + "\n")
+        return str(path)
+    import pandas as pd
+    (root / "data").mkdir()
+    pd.DataFrame(tasks).to_parquet(root / "data/train-00000-of-00001.parquet")
+    return str(root)
+
+
+# ----------------------------------------------------------- legacy baseline
+
+def legacy_load(path: str, source: str, filters):
+    if source == "jsonl":
+        with open(path, encoding="utf-8") as f:
+            tasks_list = [json.loads(line) for line in f if line.strip()]
+        for line_num, task in enumerate(tasks_list, 1):
+            TaskManager._validate_task_schema(None, task, line_num)
+    else:
+        import pandas as pd
+        tasks_list = pd.read_parquet(os.path.join(path, "data/train-00000-of-00001.parquet")).to_dict("records")
+    filtered = tasks_list.copy()
+    if filters.get("sectors"):
+        allowed = set(filters["sectors"])
+        filtered = [t for t in filtered if t["sector"] in allowed]
+    if filters.get("occupations"):
+        allowed = set(filters["occupations"])
+        filtered = [t for t in filtered if t["occupation"] in allowed]
+    return tasks_list, filtered
+
+
+def legacy_select(filtered, used):
+    available = [t for t in filtered if t["task_id"] not in used]
+    if not available:
+        return None
+    task = random.choice(available)
+    used.add(task["task_id"])
+    return task
+
+
+def legacy_lookup(tasks_list, filtered, task_id):
+    for task in filtered:
+        if task["task_id"] == task_id:
+            return task
+    for task in tasks_list:
+        if task["task_id"] == task_id:
+            return task
+    return None
+
+
+# --------------------------------------------------------------------- main
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark TaskManager loading and selection")
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--source", choices=["jsonl", "parquet"], default="jsonl")
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--lookups", type=int, default=1000)
+    parser.add_argument("--sectors", type=int, default=9)
+    parser.add_argument("--occupations", type=int, default=44)
+    args = parser.parse_args()
+
+    filters = {
+        "sectors": [f"sector-{i}" for i in range(0, args.sectors, 2)],
+        "occupations": [f"occupation-{i}" for i in range(0, args.occupations, 2)],
+    }
+    root = Path(tempfile.mkdtemp())
+    try:
+        tasks = make_tasks(args.tasks, args.sectors, args.occupations)
+        path = write_source(tasks, root, args.source)
+        lookup_ids = [f"task-{random.randrange(args.tasks):06d}" for _ in range(args.lookups)]
+        del tasks
+
+        # Legacy
+        random.seed(0)
+        legacy_startup, (tasks_list, filtered) = timed(lambda: legacy_load(path, args.source, filters))
+        used = set()
+        legacy_selection, _ = timed(lambda: [legacy_select(filtered, used) for _ in range(args.days)])
+        legacy_lookups, _ = timed(lambda: [legacy_lookup(tasks_list, filtered, tid) for tid in lookup_ids])
+        del tasks_list, filtered
+
+        # Indexed
+        random.seed(0)
+        tm = TaskManager(
+            task_source_type=args.source,
+            task_source_path=path,
+            task_data_path=str(root / "agent"),
+            agent_filters=filters,
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            startup, loaded = timed(tm.load_tasks)
+            selection, _ = timed(lambda: [tm.select_daily_task(f"day-{d}") for d in range(args.days)])
+        lookups, _ = timed(lambda: [tm.get_task_by_id(tid) for tid in lookup_ids])
+
+        print(f"\nTask catalog benchmark: {args.tasks:,} tasks ({args.source}), "
+              f"{loaded:,} after filters, {args.days} days, {args.lookups} lookups\n")
+        print(f"{'':<22}{'legacy':>12}{'indexed':>12}{'speedup':>10}")
+        for label, old, new in [
+            ("startup", legacy_startup, startup),
+            (f"selection ({args.days} days)", legacy_selection, selection),
+            (f"lookup ({args.lookups})", legacy_lookups, lookups),
+        ]:
+            print(f"{label:<22}{old * 1000:>10.1f}ms{new * 1000:>10.1f}ms{old / max(new, 1e-9):>9.1f}x")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
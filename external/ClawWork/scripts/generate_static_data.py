@@ -3,15 +3,34 @@
 Generate static JSON data files for GitHub Pages deployment.
 Replicates the FastAPI server.py endpoints as static files under frontend/public/data/.
 Run from the repo root before `npm run build`.
+
+Export is incremental and parallel: each agent's files are parsed once, agents
+are exported in a process pool, and a manifest of input mtimes, sizes and
+hashes (livebench/data/cache/static_export_manifest.json) lets unchanged
+agents be skipped. Output JSON is only rewritten when its content changes.
+
+Usage:
+    python scripts/generate_static_data.py              # incremental, all cores
+    python scripts/generate_static_data.py --jobs 1     # serial
+    python scripts/generate_static_data.py --full       # ignore the manifest
 """
+import argparse
+import hashlib
 import json
+import os
 import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 REPO_ROOT        = Path(__file__).parent.parent
 DATA_PATH        = REPO_ROOT / "livebench" / "data" / "agent_data"
 OUT_PATH         = REPO_ROOT / "frontend" / "public" / "data"
 TASK_VALUES_PATH = REPO_ROOT / "scripts" / "task_value_estimates" / "task_values.jsonl"
+MANIFEST_PATH    = REPO_ROOT / "livebench" / "data" / "cache" / "static_export_manifest.json"
+
+# Bump when the output format changes so every agent is re-exported
+EXPORT_VERSION = 1
 
 
 def load_task_values() -> dict:
@@ -42,105 +61,153 @@ def read_jsonl(path: Path) -> list:
     return lines
 
 
-def write_json(path: Path, data):
+def write_json(path: Path, data) -> bool:
+    """Write data as JSON unless the file already holds identical content. Returns True if written."""
+    content = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    try:
+        if path.stat().st_size == len(content) and path.read_bytes() == content:
+            return False
+    except FileNotFoundError:
+        pass
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False)
-    print(f"  wrote {path.relative_to(REPO_ROOT)}")
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(content)
+    os.replace(tmp, path)
+    return True
+
+
+def display_path(path: Path) -> str:
+    try:
+        return str(path.relative_to(REPO_ROOT))
+    except ValueError:
+        return str(path)
+
 
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
 
-def agent_dirs():
-    if not DATA_PATH.exists():
+
+def agent_dirs(data_path: Path = DATA_PATH):
+    if not data_path.exists():
         return []
-    return [d for d in sorted(DATA_PATH.iterdir()) if d.is_dir()]
+    return [d for d in sorted(data_path.iterdir()) if d.is_dir()]
 
 
-# Loaded once at startup
+# Loaded once at startup (and once per worker process)
 TASK_VALUES = load_task_values()
 
 
-# ── /data/agents.json ────────────────────────────────────────────────────────
-def gen_agents():
-    agents = []
-    for agent_dir in agent_dirs():
-        sig = agent_dir.name
-        balance_history = read_jsonl(agent_dir / "economic" / "balance.jsonl")
-        if not balance_history:
-            continue
-        latest = balance_history[-1]
-        decisions = read_jsonl(agent_dir / "decisions" / "decisions.jsonl")
-        last_decision = decisions[-1] if decisions else {}
-        agents.append({
-            "signature": sig,
-            "balance": latest.get("balance", 0),
-            "net_worth": latest.get("net_worth", 0),
-            "survival_status": latest.get("survival_status", "unknown"),
-            "current_activity": last_decision.get("activity"),
-            "current_date": last_decision.get("date"),
-            "total_token_cost": latest.get("total_token_cost", 0),
-        })
-    write_json(OUT_PATH / "agents.json", {"agents": agents})
+# ── Per-agent inputs ─────────────────────────────────────────────────────────
+AGENT_JSONL = {
+    "balance":   "economic/balance.jsonl",
+    "decisions": "decisions/decisions.jsonl",
+    "evals":     "work/evaluations.jsonl",
+    "tasks":     "work/tasks.jsonl",
+    "memory":    "memory/memory.jsonl",
+}
+ARTIFACT_EXTENSIONS = {'.pdf', '.docx', '.xlsx', '.pptx'}
+SKIP_DIRS = {'code_exec', 'videos', 'reference_files'}
 
 
-# ── /data/leaderboard.json ───────────────────────────────────────────────────
-def gen_leaderboard():
-    agents = []
-    for agent_dir in agent_dirs():
-        sig = agent_dir.name
-        balance_history = read_jsonl(agent_dir / "economic" / "balance.jsonl")
-        if not balance_history:
+def scan_artifacts(agent_dir: Path) -> list:
+    """(date, path) for every artifact under sandbox/{date}/, skipping SKIP_DIRS subtrees"""
+    sandbox_dir = agent_dir / "sandbox"
+    if not sandbox_dir.is_dir():
+        return []
+    found = []
+    for date_dir in sorted(sandbox_dir.iterdir()):
+        if not date_dir.is_dir():
             continue
-        latest = balance_history[-1]
-        initial_balance = balance_history[0].get("balance", 0)
-        current_balance = latest.get("balance", 0)
-        pct_change = ((current_balance - initial_balance) / initial_balance * 100) if initial_balance else 0
-
-        evals = read_jsonl(agent_dir / "work" / "evaluations.jsonl")
-        scores = [e.get("evaluation_score") for e in evals if e.get("evaluation_score") is not None]
-        avg_score = (sum(scores) / len(scores)) if scores else None
-
-        stripped_history = [
-            {
-                "date": e.get("date"),
-                "balance": e.get("balance", 0),
-                "task_completion_time_seconds": e.get("task_completion_time_seconds"),
-            }
-            for e in balance_history
-            if e.get("date") != "initialization"
-        ]
-
-        agents.append({
-            "signature": sig,
-            "initial_balance": initial_balance,
-            "current_balance": current_balance,
-            "pct_change": round(pct_change, 1),
-            "total_token_cost": latest.get("total_token_cost", 0),
-            "total_work_income": latest.get("total_work_income", 0),
-            "net_worth": latest.get("net_worth", 0),
-            "survival_status": latest.get("survival_status", "unknown"),
-            "num_tasks": len(scores),
-            "avg_eval_score": avg_score,
-            "balance_history": stripped_history,
-        })
+        for root, dirnames, filenames in os.walk(date_dir):
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+            for name in sorted(filenames):
+                if os.path.splitext(name)[1].lower() in ARTIFACT_EXTENSIONS:
+                    found.append((date_dir.name, Path(root) / name))
+    return found
+
+
+def fingerprint(agent_dir: Path, paths: list, previous: dict) -> dict:
+    """
+    relpath -> [mtime_ns, size, sha256] for each existing input. Files whose
+    mtime and size match the previous manifest keep their recorded hash.
+    """
+    inputs = {}
+    for path in paths:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue
+        rel = path.relative_to(agent_dir).as_posix()
+        old = previous.get(rel)
+        if old and old[0] == st.st_mtime_ns and old[1] == st.st_size:
+            inputs[rel] = old
+        else:
+            inputs[rel] = [st.st_mtime_ns, st.st_size, file_sha256(path)]
+    return inputs
 
-    agents.sort(key=lambda a: a["current_balance"], reverse=True)
-    write_json(OUT_PATH / "leaderboard.json", {"agents": agents})
 
+# ── /data/agents.json + /data/leaderboard.json entries ──────────────────────
+def agent_entry(sig: str, data: dict) -> dict:
+    latest = data["balance"][-1]
+    last_decision = data["decisions"][-1] if data["decisions"] else {}
+    return {
+        "signature": sig,
+        "balance": latest.get("balance", 0),
+        "net_worth": latest.get("net_worth", 0),
+        "survival_status": latest.get("survival_status", "unknown"),
+        "current_activity": last_decision.get("activity"),
+        "current_date": last_decision.get("date"),
+        "total_token_cost": latest.get("total_token_cost", 0),
+    }
 
-# ── /data/agents/{sig}.json ──────────────────────────────────────────────────
-def gen_agent_detail(agent_dir: Path):
-    sig = agent_dir.name
-    balance_history = read_jsonl(agent_dir / "economic" / "balance.jsonl")
-    decisions       = read_jsonl(agent_dir / "decisions" / "decisions.jsonl")
-    evals           = read_jsonl(agent_dir / "work" / "evaluations.jsonl")
 
-    scores = [e.get("evaluation_score") for e in evals if e.get("evaluation_score") is not None]
+def leaderboard_entry(sig: str, data: dict, scores: list) -> dict:
+    balance_history = data["balance"]
+    latest = balance_history[-1]
+    initial_balance = balance_history[0].get("balance", 0)
+    current_balance = latest.get("balance", 0)
+    pct_change = ((current_balance - initial_balance) / initial_balance * 100) if initial_balance else 0
+    avg_score = (sum(scores) / len(scores)) if scores else None
+
+    stripped_history = [
+        {
+            "date": e.get("date"),
+            "balance": e.get("balance", 0),
+            "task_completion_time_seconds": e.get("task_completion_time_seconds"),
+        }
+        for e in balance_history
+        if e.get("date") != "initialization"
+    ]
+
+    return {
+        "signature": sig,
+        "initial_balance": initial_balance,
+        "current_balance": current_balance,
+        "pct_change": round(pct_change, 1),
+        "total_token_cost": latest.get("total_token_cost", 0),
+        "total_work_income": latest.get("total_work_income", 0),
+        "net_worth": latest.get("net_worth", 0),
+        "survival_status": latest.get("survival_status", "unknown"),
+        "num_tasks": len(scores),
+        "avg_eval_score": avg_score,
+        "balance_history": stripped_history,
+    }
+
+
+# ── /data/agents/{sig}.json ──────────────────────────────────────────────────
+def agent_detail(sig: str, data: dict, scores: list) -> dict:
+    balance_history = data["balance"]
+    decisions       = data["decisions"]
     avg_score = (sum(scores) / len(scores)) if scores else None
 
     latest         = balance_history[-1]  if balance_history else {}
     last_decision  = decisions[-1]        if decisions        else {}
 
-    data = {
+    return {
         "signature": sig,
         "current_status": {
             "balance":            latest.get("balance", 0),
@@ -157,18 +224,12 @@ def gen_agent_detail(agent_dir: Path):
         "decisions":       decisions,
         "evaluation_scores": scores,
     }
-    write_json(OUT_PATH / "agents" / f"{sig}.json", data)
 
 
 # ── /data/agents/{sig}/tasks.json ────────────────────────────────────────────
-def gen_agent_tasks(agent_dir: Path):
-    sig   = agent_dir.name
-    tasks = read_jsonl(agent_dir / "work" / "tasks.jsonl")
-    evals = {
-        e["task_id"]: e
-        for e in read_jsonl(agent_dir / "work" / "evaluations.jsonl")
-        if "task_id" in e
-    }
+def agent_tasks(data: dict) -> dict:
+    tasks = data["tasks"]
+    evals = {e["task_id"]: e for e in data["evals"] if "task_id" in e}
     for task in tasks:
         tid = task.get("task_id")
         if tid and tid in TASK_VALUES:
@@ -185,35 +246,29 @@ def gen_agent_tasks(agent_dir: Path):
             task["completed"]        = False
             task["payment"]          = 0
             task["evaluation_score"] = None
-    write_json(OUT_PATH / "agents" / sig / "tasks.json", {"tasks": tasks})
+    return {"tasks": tasks}
 
 
 # ── /data/agents/{sig}/learning.json ────────────────────────────────────────
-def gen_agent_learning(agent_dir: Path):
-    sig     = agent_dir.name
-    entries = []
-    mem     = agent_dir / "memory" / "memory.jsonl"
-    if mem.exists():
-        for raw in read_jsonl(mem):
-            entries.append({
-                "topic":     raw.get("topic", "Unknown"),
-                "timestamp": raw.get("timestamp", ""),
-                "date":      raw.get("date", ""),
-                "content":   raw.get("knowledge", ""),
-            })
+def agent_learning(data: dict) -> dict:
+    entries = [
+        {
+            "topic":     raw.get("topic", "Unknown"),
+            "timestamp": raw.get("timestamp", ""),
+            "date":      raw.get("date", ""),
+            "content":   raw.get("knowledge", ""),
+        }
+        for raw in data["memory"]
+    ]
     memory_content = "\n\n".join(
         f"## {e['topic']} ({e['date']})\n{e['content']}" for e in entries
     )
-    write_json(OUT_PATH / "agents" / sig / "learning.json", {
-        "memory":  memory_content,
-        "entries": entries,
-    })
+    return {"memory": memory_content, "entries": entries}
 
 
 # ── /data/agents/{sig}/economic.json ────────────────────────────────────────
-def gen_agent_economic(agent_dir: Path):
-    sig     = agent_dir.name
-    rows    = read_jsonl(agent_dir / "economic" / "balance.jsonl")
+def agent_economic(data: dict) -> dict:
+    rows = data["balance"]
     dates, balances, costs, income = [], [], [], []
     for row in rows:
         dates.append(row.get("date", ""))
@@ -221,7 +276,7 @@ def gen_agent_economic(agent_dir: Path):
         costs.append(row.get("daily_token_cost", 0))
         income.append(row.get("work_income_delta", 0))
     latest = rows[-1] if rows else {}
-    write_json(OUT_PATH / "agents" / sig / "economic.json", {
+    return {
         "balance":           latest.get("balance", 0),
         "total_token_cost":  latest.get("total_token_cost", 0),
         "total_work_income": latest.get("total_work_income", 0),
@@ -231,81 +286,106 @@ def gen_agent_economic(agent_dir: Path):
         "balance_history":   balances,
         "token_costs":       costs,
         "work_income":       income,
-    })
-
-
-# ── /data/artifacts.json + /data/files/{path} ───────────────────────────────
-ARTIFACT_EXTENSIONS = {'.pdf', '.docx', '.xlsx', '.pptx'}
-SKIP_DIRS = {'code_exec', 'videos', 'reference_files'}
+    }
 
-def gen_artifacts():
-    artifacts = []
-    files_root = OUT_PATH / "files"
 
-    for agent_dir in agent_dirs():
-        sig = agent_dir.name
-        sandbox_dir = agent_dir / "sandbox"
-        if not sandbox_dir.exists():
-            continue
-        for date_dir in sorted(sandbox_dir.iterdir()):
-            if not date_dir.is_dir():
-                continue
-            for file_path in date_dir.rglob("*"):
-                if not file_path.is_file():
-                    continue
-                rel_parts = file_path.relative_to(date_dir).parts
-                if any(p in SKIP_DIRS for p in rel_parts):
-                    continue
-                if file_path.suffix.lower() not in ARTIFACT_EXTENSIONS:
-                    continue
-
-                rel_path = str(file_path.relative_to(DATA_PATH))  # e.g. sig/sandbox/date/file.pdf
-                artifacts.append({
-                    "agent":      sig,
-                    "date":       date_dir.name,
-                    "filename":   file_path.name,
-                    "extension":  file_path.suffix.lower(),
-                    "size_bytes": file_path.stat().st_size,
-                    "path":       rel_path,
-                })
-
-                # Copy the actual file so it can be served statically
-                dest = files_root / rel_path
-                dest.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(file_path, dest)
-
-    write_json(OUT_PATH / "artifacts.json", {"artifacts": artifacts})
-    print(f"  copied {len(artifacts)} artifact file(s)")
-
-
-# ── /data/agents/{sig}/terminal-logs/{date}.json ────────────────────────────
-def gen_terminal_logs(agent_dir: Path):
+# ── Export one agent (runs in a worker process) ─────────────────────────────
+def export_agent(job: dict) -> dict:
+    """
+    Export every per-agent file for one agent directory. Skips all parsing and
+    writing when the inputs match the previous manifest entry and its outputs
+    still exist. Returns the new manifest entry plus what was written.
+    """
+    agent_dir = Path(job["agent_dir"])
+    data_path, out_path = Path(job["data_path"]), Path(job["out_path"])
+    previous = job["previous"] or {}
     sig = agent_dir.name
+
+    artifacts = scan_artifacts(agent_dir)
     logs_dir = agent_dir / "terminal_logs"
-    if not logs_dir.exists():
-        return
-    count = 0
-    for log_file in logs_dir.glob("*.log"):
-        date = log_file.stem  # e.g. "2026-01-01"
-        content = log_file.read_text(encoding="utf-8", errors="replace")
-        write_json(
-            OUT_PATH / "agents" / sig / "terminal-logs" / f"{date}.json",
-            {"date": date, "content": content},
-        )
-        count += 1
-    if count:
-        print(f"    terminal logs: {count}")
+    log_files = sorted(logs_dir.glob("*.log")) if logs_dir.is_dir() else []
+    paths = [agent_dir / rel for rel in AGENT_JSONL.values()] + log_files + [p for _, p in artifacts]
+    old_inputs = previous.get("inputs", {}) if previous.get("version") == EXPORT_VERSION else {}
+    inputs = fingerprint(agent_dir, paths, old_inputs)
+
+    entry = {"version": EXPORT_VERSION, "task_values": job["task_values"], "inputs": inputs}
+    unchanged = (
+        not job["full"]
+        and previous.get("version") == EXPORT_VERSION
+        and previous.get("task_values") == job["task_values"]
+        and {k: v[2] for k, v in old_inputs.items()} == {k: v[2] for k, v in inputs.items()}
+        and all((out_path / rel).exists() for rel in previous.get("outputs", []))
+    )
+    if unchanged:
+        entry.update(outputs=previous["outputs"], summary=previous["summary"])
+        return {"signature": sig, "entry": entry, "written": [], "copied": 0, "skipped": True}
+
+    def changed(rel: str) -> bool:
+        return job["full"] or rel not in old_inputs or old_inputs[rel][2] != inputs[rel][2]
+
+    written, outputs, copied = [], [], 0
+
+    def emit(rel: str, payload) -> None:
+        outputs.append(rel)
+        if write_json(out_path / rel, payload):
+            written.append(rel)
+
+    # Artifacts: listed for /data/artifacts.json, copied only when new or changed
+    artifact_entries = []
+    for date, file_path in artifacts:
+        rel_path = file_path.relative_to(data_path).as_posix()  # e.g. sig/sandbox/date/file.pdf
+        artifact_entries.append({
+            "agent":      sig,
+            "date":       date,
+            "filename":   file_path.name,
+            "extension":  file_path.suffix.lower(),
+            "size_bytes": inputs[file_path.relative_to(agent_dir).as_posix()][1],
+            "path":       rel_path,
+        })
+        outputs.append(f"files/{rel_path}")
+        dest = out_path / "files" / rel_path
+        if changed(file_path.relative_to(agent_dir).as_posix()) or not dest.exists():
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(file_path, dest)
+            copied += 1
+
+    summary = {"agent": None, "leaderboard": None, "artifacts": artifact_entries}
+    data = {key: read_jsonl(agent_dir / rel) for key, rel in AGENT_JSONL.items()}
+    if data["balance"]:
+        scores = [e.get("evaluation_score") for e in data["evals"] if e.get("evaluation_score") is not None]
+        summary["agent"] = agent_entry(sig, data)
+        summary["leaderboard"] = leaderboard_entry(sig, data, scores)
+
+        emit(f"agents/{sig}.json", agent_detail(sig, data, scores))
+        emit(f"agents/{sig}/learning.json", agent_learning(data))
+        emit(f"agents/{sig}/economic.json", agent_economic(data))
+        emit(f"agents/{sig}/tasks.json", agent_tasks(data))
+
+        # ── /data/agents/{sig}/terminal-logs/{date}.json ──
+        for log_file in log_files:
+            date = log_file.stem  # e.g. "2026-01-01"
+            rel = f"agents/{sig}/terminal-logs/{date}.json"
+            if not changed(log_file.relative_to(agent_dir).as_posix()) and (out_path / rel).exists():
+                outputs.append(rel)
+                continue
+            content = log_file.read_text(encoding="utf-8", errors="replace")
+            emit(rel, {"date": date, "content": content})
+
+    entry.update(outputs=outputs, summary=summary)
+    return {"signature": sig, "entry": entry, "written": written, "copied": copied, "skipped": False}
 
 
 # ── /data/settings/hidden-agents.json + displaying-names.json ───────────────
-def gen_settings():
+def gen_settings(out_path: Path) -> list:
+    written = []
     # Hidden agents
     hidden_file = REPO_ROOT / "livebench" / "data" / "hidden_agents.json"
     hidden = []
     if hidden_file.exists():
         with open(hidden_file) as f:
             hidden = json.load(f)
-    write_json(OUT_PATH / "settings" / "hidden-agents.json", {"hidden": hidden})
+    if write_json(out_path / "settings" / "hidden-agents.json", {"hidden": hidden}):
+        written.append(out_path / "settings" / "hidden-agents.json")
 
     # Displaying names
     names_file = REPO_ROOT / "livebench" / "data" / "displaying_names.json"
@@ -313,29 +393,101 @@ def gen_settings():
     if names_file.exists():
         with open(names_file, encoding="utf-8") as f:
             names = json.load(f)
-    write_json(OUT_PATH / "settings" / "displaying-names.json", names)
+    if write_json(out_path / "settings" / "displaying-names.json", names):
+        written.append(out_path / "settings" / "displaying-names.json")
+    return written
+
+
+def load_manifest(manifest_path: Path) -> dict:
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return manifest.get("agents", {}) if isinstance(manifest, dict) else {}
+
+
+def export(
+    data_path: Path = DATA_PATH,
+    out_path: Path = OUT_PATH,
+    manifest_path: Path = MANIFEST_PATH,
+    jobs: int = 0,
+    full: bool = False
+) -> dict:
+    """
+    Export every agent plus the aggregate files. jobs=0 uses all cores,
+    jobs=1 runs serially in this process. Returns run statistics.
+    """
+    previous = load_manifest(manifest_path)
+    task_values = file_sha256(TASK_VALUES_PATH) if TASK_VALUES_PATH.exists() else None
+    work = [
+        {
+            "agent_dir": str(agent_dir),
+            "data_path": str(data_path),
+            "out_path": str(out_path),
+            "previous": previous.get(agent_dir.name),
+            "task_values": task_values,
+            "full": full,
+        }
+        for agent_dir in agent_dirs(data_path)
+    ]
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(work) <= 1:
+        results = [export_agent(job) for job in work]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(work))) as pool:
+            results = list(pool.map(export_agent, work, chunksize=max(1, len(work) // (jobs * 4))))
+
+    for result in results:
+        if result["written"] or result["copied"]:
+            print(f"  agent: {result['signature']} "
+                  f"({len(result['written'])} file(s) updated, {result['copied']} artifact(s) copied)")
+
+    # Aggregates are rebuilt from per-agent summaries (cheap; no inputs re-read)
+    summaries = [r["entry"]["summary"] for r in results]
+    agents = [s["agent"] for s in summaries if s["agent"]]
+    leaderboard = sorted((s["leaderboard"] for s in summaries if s["leaderboard"]),
+                         key=lambda a: a["current_balance"], reverse=True)
+    artifacts = [a for s in summaries for a in s["artifacts"]]
+
+    aggregates = [
+        (out_path / "agents.json", {"agents": agents}),
+        (out_path / "leaderboard.json", {"agents": leaderboard}),
+        (out_path / "artifacts.json", {"artifacts": artifacts}),
+    ]
+    written = [path for path, payload in aggregates if write_json(path, payload)]
+    written += gen_settings(out_path)
+    for path in written:
+        print(f"  wrote {display_path(path)}")
+
+    write_json(manifest_path, {"agents": {r["signature"]: r["entry"] for r in results}})
+
+    return {
+        "agents": len(results),
+        "skipped": sum(1 for r in results if r["skipped"]),
+        "files_written": sum(len(r["written"]) for r in results) + len(written),
+        "artifacts_copied": sum(r["copied"] for r in results),
+        "artifacts": len(artifacts),
+    }
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate static JSON data for GitHub Pages")
+    parser.add_argument("--jobs", type=int, default=0, help="Worker processes (0 = all cores, 1 = serial)")
+    parser.add_argument("--full", action="store_true", help="Ignore the manifest and re-export every agent")
+    args = parser.parse_args()
+
     print(f"Generating static data from {DATA_PATH}")
     print(f"Output: {OUT_PATH}\n")
 
-    gen_agents()
-    gen_leaderboard()
-    gen_artifacts()
-    gen_settings()
+    start = time.perf_counter()
+    stats = export(jobs=args.jobs, full=args.full)
 
-    for agent_dir in agent_dirs():
-        if not read_jsonl(agent_dir / "economic" / "balance.jsonl"):
-            continue
-        print(f"  agent: {agent_dir.name}")
-        gen_agent_detail(agent_dir)
-        gen_agent_tasks(agent_dir)
-        gen_agent_learning(agent_dir)
-        gen_agent_economic(agent_dir)
-        gen_terminal_logs(agent_dir)
-
-    print("\nDone.")
+    print(f"\n  {stats['agents']} agent(s), {stats['skipped']} unchanged, "
+          f"{stats['files_written']} file(s) written, "
+          f"{stats['artifacts_copied']}/{stats['artifacts']} artifact(s) copied")
+    print(f"\nDone in {time.perf_counter() - start:.1f}s.")
 
 
 if __name__ == "__main__":
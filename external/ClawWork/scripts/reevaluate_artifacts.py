@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Re-evaluate stored work artifacts for an agent in one concurrent batch
+
+Joins work/tasks.jsonl (task details) with work/evaluations.jsonl (submitted
+artifact paths) and runs every evaluation through AsyncLLMEvaluator. Results
+for unchanged artifacts and rubrics come from the evaluation result cache,
+so re-running costs nothing. Logs are not modified; old and new scores are
+printed side by side.
+
+Usage:
+    python scripts/reevaluate_artifacts.py <agent_data_dir> [--max-in-flight 8]
+
+Example:
+    python scripts/reevaluate_artifacts.py livebench/data/agent_data/GLM-4.7-test-openrouter-10dollar-1
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from livebench.work.llm_evaluator import AsyncLLMEvaluator
+
+
+def load_jsonl(path: Path):
+    if not path.exists():
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-evaluate an agent's stored artifacts")
+    parser.add_argument("agent_data_dir")
+    parser.add_argument("--meta-prompts-dir", default="./eval/meta_prompts")
+    parser.add_argument("--max-in-flight", type=int, default=8)
+    args = parser.parse_args()
+
+    work_dir = Path(args.agent_data_dir) / "work"
+    tasks = {t["task_id"]: t for t in load_jsonl(work_dir / "tasks.jsonl")}
+    evaluations = load_jsonl(work_dir / "evaluations.jsonl")
+
+    jobs, previous = [], []
+    for evaluation in evaluations:
+        task = tasks.get(evaluation.get("task_id"))
+        paths = evaluation.get("artifact_paths") or [evaluation.get("artifact_path")]
+        if not task or not paths or not paths[0]:
+            continue
+        jobs.append({"task": task, "artifact_paths": paths, "max_payment": task.get("max_payment")})
+        previous.append(evaluation.get("evaluation_score"))
+
+    if not jobs:
+        print(f"⚠️  No evaluations with matching tasks found in {work_dir}")
+        return
+
+    print(f"🔁 Re-evaluating {len(jobs)} submissions (max {args.max_in_flight} in flight)")
+    evaluator = AsyncLLMEvaluator(meta_prompts_dir=args.meta_prompts_dir, max_in_flight=args.max_in_flight)
+    results = evaluator.evaluate_batch(jobs)
+
+    failed = 0
+    for job, old_score, result in zip(jobs, previous, results):
+        task_id = job["task"]["task_id"]
+        if isinstance(result, Exception):
+            failed += 1
+            print(f"   ❌ {task_id}: {result}")
+            continue
+        score, _, payment = result
+        old = f"{old_score:.2f}" if isinstance(old_score, (int, float)) else "n/a"
+        print(f"   {task_id}: {old} -> {score:.2f} (${payment:.2f})")
+
+    stats = evaluator.result_cache.stats()["by_kind"].get("evaluation", {})
+    print(f"\n✅ Done: {len(jobs) - failed} evaluated, {failed} failed, "
+          f"{stats.get('hits', 0)} served from cache")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Test script for the concurrent agent scheduler
+
+Uses stub agents whose "LLM calls" are asyncio sleeps, so no API keys are
+needed. This script validates:
+1. The concurrency limit is respected and wall-clock time improves
+2. A failing agent does not affect the others
+3. The context-local logger stays isolated per agent
+4. Tool state and the per-signature code sandbox stay isolated per agent,
+   across awaits and inside tools run on the executor via copy_context()
+"""
+
+import sys
+import time
+import asyncio
+import contextvars
+import tempfile
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from livebench.scheduler import AgentScheduler
+from livebench.utils.logger import LiveBenchLogger, get_logger, set_global_logger
+from livebench.tools.direct_tools import _global_state, set_global_state
+from livebench.tools.productivity.code_execution_sandbox import SessionSandbox
+
+
+class StubAgent:
+    """Mimics LiveAgent.initialize/run_date_range with a fake LLM latency"""
+
+    def __init__(self, signature: str, data_path: str, llm_latency: float, days: int = 3, fail: bool = False):
+        self.signature = signature
+        self.logger = LiveBenchLogger(signature=signature, data_path=data_path)
+        self.llm_latency = llm_latency
+        self.days = days
+        self.fail = fail
+        self.seen_loggers = []
+
+    async def initialize(self):
+        set_global_logger(self.logger)
+
+    async def run_date_range(self, init_date: str, end_date: str):
+        for _ in range(self.days):
+            await asyncio.sleep(self.llm_latency)  # stub LLM round trip
+            self.seen_loggers.append(get_logger())
+            if self.fail:
+                raise RuntimeError("stub LLM failure")
+
+
+def _tool_view():
+    """What a tool body sees: the current agent's state and sandbox"""
+    return _global_state.get("signature"), _global_state.get("data_path"), SessionSandbox.get_instance()
+
+
+class ToolStateAgent(StubAgent):
+    """Sets its tool state like LiveAgent and reads it back from tools"""
+
+    def __init__(self, signature: str, data_path: str, executor: ThreadPoolExecutor):
+        super().__init__(signature, data_path, llm_latency=0.01, days=5)
+        self.data_path = data_path
+        self.executor = executor
+        self.seen = []
+
+    async def run_date_range(self, init_date: str, end_date: str):
+        loop = asyncio.get_running_loop()
+        for day in range(self.days):
+            set_global_state(
+                signature=self.signature, economic_tracker=None, task_manager=None, evaluator=None,
+                current_date=f"2026-01-0{day + 1}", current_task={}, data_path=self.data_path
+            )
+            await asyncio.sleep(self.llm_latency)  # the other agent runs here
+            self.seen.append(_tool_view())
+            # Same dispatch as LiveAgent._invoke_tool for sync tools
+            context = contextvars.copy_context()
+            self.seen.append(await loop.run_in_executor(self.executor, context.run, _tool_view))
+
+
+def _jobs(agents, in_flight, peak):
+    def make_job(agent):
+        async def job():
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            try:
+                await agent.initialize()
+                await agent.run_date_range("2026-01-01", "2026-01-03")
+                return True
+            finally:
+                in_flight[0] -= 1
+        return agent.signature, job
+    return [make_job(agent) for agent in agents]
+
+
+def test_concurrency_limit_and_speedup():
+    """Test bounded concurrency and wall-clock improvement"""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        def run(max_concurrency):
+            agents = [StubAgent(f"agent-{i}", f"{temp_dir}/agent-{i}", llm_latency=0.05) for i in range(6)]
+            in_flight, peak = [0], [0]
+            start = time.perf_counter()
+            results = asyncio.run(AgentScheduler(max_concurrency).run(_jobs(agents, in_flight, peak)))
+            return time.perf_counter() - start, peak[0], results
+
+        sequential, seq_peak, _ = run(1)
+        concurrent, conc_peak, results = run(3)
+        assert seq_peak == 1 and conc_peak == 3
+        assert [r["signature"] for r in results] == [f"agent-{i}" for i in range(6)]
+        assert all(r["success"] for r in results)
+        assert concurrent < sequential * 0.6, (sequential, concurrent)
+        print(f"✓ Sequential {sequential:.2f}s vs concurrent(3) {concurrent:.2f}s")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_failure_isolation_and_context_state():
+    """Test per-agent failure handling and context-local logger"""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        agents = [
+            StubAgent("ok-a", f"{temp_dir}/ok-a", llm_latency=0.01),
+            StubAgent("bad", f"{temp_dir}/bad", llm_latency=0.01, fail=True),
+            StubAgent("ok-b", f"{temp_dir}/ok-b", llm_latency=0.01),
+        ]
+        results = asyncio.run(AgentScheduler(3).run(_jobs(agents, [0], [0])))
+        assert [r["success"] for r in results] == [True, False, True]
+        assert results[1]["error"] == "stub LLM failure"
+        for agent in (agents[0], agents[2]):
+            assert agent.seen_loggers and all(l is agent.logger for l in agent.seen_loggers)
+        print("✓ Failures are isolated and each agent sees only its own logger")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_tool_state_and_sandbox_isolation():
+    """Test that concurrent agents each see only their own tool state and sandbox"""
+    temp_dir = tempfile.mkdtemp()
+    executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        agents = [ToolStateAgent(sig, f"{temp_dir}/{sig}", executor) for sig in ("agent-a", "agent-b")]
+        in_flight, peak = [0], [0]
+        results = asyncio.run(AgentScheduler(2).run(_jobs(agents, in_flight, peak)))
+        assert all(r["success"] for r in results) and peak[0] == 2
+
+        sandboxes = []
+        for agent in agents:
+            assert len(agent.seen) == 2 * agent.days
+            assert {(sig, path) for sig, path, _ in agent.seen} == {(agent.signature, agent.data_path)}
+            own = {id(sandbox) for _, _, sandbox in agent.seen}
+            assert len(own) == 1, "sandbox must be stable per agent"
+            sandboxes.append(agent.seen[0][2])
+        assert sandboxes[0] is not sandboxes[1]
+        assert SessionSandbox._instances["agent-a"] is sandboxes[0]
+        assert SessionSandbox._instances["agent-b"] is sandboxes[1]
+        print("✓ Tool state and sandboxes are isolated per agent, in tasks and executor threads")
+    finally:
+        executor.shutdown()
+        for sig in ("agent-a", "agent-b"):
+            SessionSandbox._instances.pop(sig, None)
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    print("\n" + "="*60)
+    print("AGENT SCHEDULER TEST SUITE")
+    print("="*60)
+
+    try:
+        test_concurrency_limit_and_speedup()
+        test_failure_isolation_and_context_state()
+        test_tool_state_and_sandbox_isolation()
+        print("\n🎉 ALL TESTS PASSED!")
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
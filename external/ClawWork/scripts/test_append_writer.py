@@ -0,0 +1,241 @@
+"""
+Test script for the buffered append writer
+
+This script validates:
+1. Lines are batched by count and by age, and flush() forces them out
+2. A failed flush keeps its lines queued, the flusher retries and no directory is recreated
+3. flush() fsyncs batches already written by the count and age triggers
+4. Queued lines reach disk when the process is stopped with SIGTERM
+5. A concurrent tailer only ever sees complete JSON lines
+6. EconomicTracker records reach disk on end_task and save_daily_state
+"""
+
+import os
+import sys
+import json
+import signal
+import subprocess
+import time
+import tempfile
+import shutil
+import threading
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from livebench.utils.append_writer import AppendWriter, get_append_writer
+from livebench.agent.economic_tracker import EconomicTracker
+
+
+def _lines(path: Path):
+    return path.read_text().splitlines() if path.exists() else []
+
+
+def test_batching_by_count_and_age():
+    """Test count-, time- and explicit flushing"""
+    temp_dir = Path(tempfile.mkdtemp())
+    writer = AppendWriter(max_pending=3, flush_interval=0.2, fsync="never")
+    try:
+        path = temp_dir / "nested" / "log.jsonl"
+        path.parent.mkdir()
+        writer.write_record(str(path), {"n": 1})
+        writer.write_record(str(path), {"n": 2})
+        assert _lines(path) == []
+        writer.write_record(str(path), {"n": 3})  # third line triggers a batch
+        assert _lines(path) == ['{"n":1}', '{"n":2}', '{"n":3}']
+        assert writer.write_calls == 1
+
+        writer.write_record(str(path), {"n": 4})
+        time.sleep(0.5)  # flushed by age
+        assert len(_lines(path)) == 4
+
+        writer.write_line(str(path), "plain text")
+        writer.flush(str(path))
+        assert _lines(path)[-1] == "plain text"
+        print(f"✓ {writer.lines_written} lines in {writer.write_calls} writes")
+    finally:
+        writer.close_all()
+        shutil.rmtree(temp_dir)
+
+
+def test_failed_flush_keeps_lines_and_directories_stay_removed():
+    """Test that write errors keep lines queued and the flusher survives them"""
+    temp_dir = Path(tempfile.mkdtemp())
+    writer = AppendWriter(max_pending=100, flush_interval=0.1, fsync="never")
+    try:
+        log_dir = temp_dir / "logs"
+        path = log_dir / "log.jsonl"
+        writer.write_record(str(path), {"n": 1})
+        time.sleep(0.3)  # timed flush fails: the directory does not exist
+        assert not log_dir.exists(), "writer must not recreate directories"
+        assert writer._flusher.is_alive() and writer.lines_written == 0
+
+        writer.write_record(str(path), {"n": 2})
+        try:
+            writer.flush(str(path))
+            raise AssertionError("explicit flush should surface the error")
+        except FileNotFoundError:
+            pass
+
+        log_dir.mkdir()
+        time.sleep(0.3)  # the same flusher thread retries and succeeds
+        assert _lines(path) == ['{"n":1}', '{"n":2}']
+        assert writer.lines_written == 2
+        print("✓ Failed flushes keep lines queued and retry without recreating directories")
+    finally:
+        writer.close_all()
+        shutil.rmtree(temp_dir)
+
+
+def test_flush_syncs_batches_already_written():
+    """Test that the "flush" policy fsyncs data written by automatic batches"""
+    temp_dir = Path(tempfile.mkdtemp())
+    writer = AppendWriter(max_pending=2, flush_interval=0.2, fsync="flush")
+    synced = []
+    real_fsync = os.fsync
+    os.fsync = lambda fd: synced.append(fd) or real_fsync(fd)
+    try:
+        path = temp_dir / "balance.jsonl"
+        writer.write_record(str(path), {"n": 1})
+        writer.write_record(str(path), {"n": 2})  # count trigger writes without fsync
+        writer.write_record(str(path), {"n": 3})
+        time.sleep(0.5)  # age trigger writes without fsync
+        assert len(_lines(path)) == 3 and synced == []
+
+        writer.flush()
+        assert len(synced) == 1
+        writer.flush()
+        assert len(synced) == 1  # nothing written since
+        writer.write_record(str(path), {"n": 4})
+        writer.write_record(str(path), {"n": 5})
+        writer.close_all()
+        assert len(synced) == 2
+        print("✓ flush()/close_all() fsync batches written by the count and age triggers")
+    finally:
+        os.fsync = real_fsync
+        writer.close_all()
+        shutil.rmtree(temp_dir)
+
+
+def test_sigterm_flushes_queued_lines():
+    """Test that a SIGTERMed process still writes every queued line"""
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        path = temp_dir / "balance.jsonl"
+        child = (
+            "import sys, time\n"
+            f"sys.path.insert(0, {str(Path(__file__).parent.parent)!r})\n"
+            "from livebench.utils.append_writer import get_append_writer, install_exit_flush\n"
+            "install_exit_flush()\n"
+            "writer = get_append_writer()\n"
+            f"for i in range(500):\n    writer.write_record({str(path)!r}, {{'i': i}})\n"
+            "print('ready', flush=True)\n"
+            "time.sleep(60)\n"
+        )
+        env = dict(os.environ, LIVEBENCH_APPEND_MAX_PENDING="1000", LIVEBENCH_APPEND_FLUSH_INTERVAL_SEC="60")
+        proc = subprocess.Popen([sys.executable, "-c", child], env=env, stdout=subprocess.PIPE, text=True)
+        try:
+            assert proc.stdout.readline().strip() == "ready"
+            assert _lines(path) == []  # everything is still queued
+            proc.send_signal(signal.SIGTERM)
+            assert proc.wait(timeout=10) == 128 + signal.SIGTERM
+        finally:
+            proc.kill()
+            proc.stdout.close()
+        assert [json.loads(l)["i"] for l in _lines(path)] == list(range(500))
+        print("✓ SIGTERM flushes all 500 queued lines before exiting")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_tailer_never_sees_partial_lines():
+    """Test that concurrent writers and a tailing reader agree on whole records"""
+    temp_dir = Path(tempfile.mkdtemp())
+    writer = AppendWriter(max_pending=50, flush_interval=0.01, fsync="never")
+    path = temp_dir / "balance.jsonl"
+    path.touch()
+    seen, done = [], threading.Event()
+
+    def tail():
+        offset, buffer = 0, b""
+        while True:
+            finished = done.is_set()
+            with open(path, "rb") as f:
+                f.seek(offset)
+                chunk = f.read()
+            offset += len(chunk)
+            buffer += chunk
+            *complete, buffer = buffer.split(b"\n")
+            seen.extend(json.loads(line) for line in complete)
+            if finished:
+                return
+
+    def produce(agent):
+        for i in range(2000):
+            writer.write_record(str(path), {"agent": agent, "i": i, "pad": "x" * (i % 300)})
+
+    try:
+        reader = threading.Thread(target=tail)
+        reader.start()
+        producers = [threading.Thread(target=produce, args=(a,)) for a in range(4)]
+        for t in producers:
+            t.start()
+        for t in producers:
+            t.join()
+        writer.flush()
+        done.set()
+        reader.join()
+        assert len(seen) == 8000
+        for agent in range(4):
+            assert [r["i"] for r in seen if r["agent"] == agent] == list(range(2000))
+        print(f"✓ Tailer parsed {len(seen)} complete records in order")
+    finally:
+        writer.close_all()
+        shutil.rmtree(temp_dir)
+
+
+def test_tracker_flushes_on_task_and_day_end():
+    """Test EconomicTracker durability points"""
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        tracker = EconomicTracker("writer-test", data_path=str(temp_dir), max_call_details=2)
+        tracker.initialize()
+        assert len(_lines(temp_dir / "balance.jsonl")) == 1
+
+        tracker.start_task("task-1", date="2026-01-01")
+        for _ in range(5):
+            tracker.track_tokens(1000, 500)
+        tracker.end_task()
+        records = [json.loads(l) for l in _lines(temp_dir / "token_costs.jsonl")]
+        assert len(records) == 1
+        usage = records[0]["llm_usage"]
+        assert usage["total_calls"] == 5 and usage["total_input_tokens"] == 5000
+        assert len(usage["calls_detail"]) == 2 and usage["calls_detail_omitted"] == 3
+
+        tracker.save_daily_state("2026-01-01")
+        assert json.loads(_lines(temp_dir / "balance.jsonl")[-1])["date"] == "2026-01-01"
+        print("✓ Task and daily records are on disk after end_task/save_daily_state")
+    finally:
+        get_append_writer().close_all()
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    print("\n" + "="*60)
+    print("APPEND WRITER TEST SUITE")
+    print("="*60)
+
+    try:
+        test_batching_by_count_and_age()
+        test_failed_flush_keeps_lines_and_directories_stay_removed()
+        test_flush_syncs_batches_already_written()
+        test_sigterm_flushes_queued_lines()
+        test_tailer_never_sees_partial_lines()
+        test_tracker_flushes_on_task_and_day_end()
+        print("\n🎉 ALL TESTS PASSED!")
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
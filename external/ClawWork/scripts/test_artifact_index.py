@@ -0,0 +1,224 @@
+"""
+Test script for the artifact index used by the API server
+
+This script validates:
+1. The index finds the same artifacts as a full sandbox walk
+2. Filtered sampling returns distinct artifacts matching every filter
+3. Refresh only lists changed directories and tracks adds, removals and moves
+4. Range headers are parsed per RFC 9110
+5. File responses never send a body shorter than their content-length
+"""
+
+import os
+import sys
+import asyncio
+import time
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from livebench.api.artifact_index import ArtifactIndex, SKIP_DIRS, ARTIFACT_EXTENSIONS, parse_byte_range
+from livebench.api.file_serving import ArtifactFileResponse
+
+
+def _touch(path: Path, size: int = 10) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+
+
+def _legacy_scan(data_path: Path) -> set:
+    """The former per-request walk in get_random_artifacts"""
+    found = set()
+    for agent_dir in data_path.iterdir():
+        sandbox_dir = agent_dir / "sandbox"
+        if not sandbox_dir.exists():
+            continue
+        for date_dir in sandbox_dir.iterdir():
+            if not date_dir.is_dir():
+                continue
+            for file_path in date_dir.rglob("*"):
+                if not file_path.is_file():
+                    continue
+                if any(p in SKIP_DIRS for p in file_path.relative_to(date_dir).parts):
+                    continue
+                if file_path.suffix.lower() in ARTIFACT_EXTENSIONS:
+                    found.add(str(file_path.relative_to(data_path)))
+    return found
+
+
+def _make_tree(data_path: Path) -> None:
+    for agent in ("agent-a", "agent-b"):
+        for date in ("2026-01-01", "2026-01-02"):
+            day = data_path / agent / "sandbox" / date
+            _touch(day / "report.docx")
+            _touch(day / "model.XLSX", size=25)
+            _touch(day / "out" / "deck.pptx")
+            _touch(day / "notes.txt")
+            _touch(day / "code_exec" / "scratch.pdf")
+            _touch(day / "reference_files" / "brief.pdf")
+        _touch(data_path / agent / "sandbox" / "stray.pdf")  # not in a date dir
+        _touch(data_path / agent / "work" / "summary.pdf")   # outside the sandbox
+
+
+def _age_tree(root: Path, seconds: float = 60) -> None:
+    """Backdate directory mtimes so they are outside the racy window"""
+    stamp = time.time_ns() - int(seconds * 1e9)
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, ns=(stamp, stamp))
+
+
+def test_matches_full_walk_and_filters():
+    """Test index contents and filtered sampling"""
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        data_path = temp_dir / "agent_data"
+        _make_tree(data_path)
+        index = ArtifactIndex(data_path)
+        index.refresh()
+
+        everything = {a["path"] for a in index.sample(100)}
+        assert everything == _legacy_scan(data_path) and len(everything) == 12
+        entry = index.lookup("agent-a/sandbox/2026-01-01/model.XLSX")
+        assert entry == {
+            "agent": "agent-a", "date": "2026-01-01", "filename": "model.XLSX",
+            "extension": ".xlsx", "size_bytes": 25, "path": "agent-a/sandbox/2026-01-01/model.XLSX",
+        }
+
+        sample = index.sample(3)
+        assert len(sample) == 3 and len({a["path"] for a in sample}) == 3
+        by_agent = index.sample(100, agent="agent-b")
+        assert len(by_agent) == 6 and all(a["agent"] == "agent-b" for a in by_agent)
+        combined = index.sample(100, agent="agent-a", date="2026-01-02", extension=".pptx")
+        assert [a["path"] for a in combined] == ["agent-a/sandbox/2026-01-02/out/deck.pptx"]
+        assert index.sample(5, agent="unknown") == []
+        assert index.sample(5, date="2030-01-01", extension=".pdf") == []
+        print(f"✓ Index matches the full walk ({len(everything)} artifacts); filters applied")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_incremental_refresh():
+    """Test that unchanged directories are skipped and changes are picked up"""
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        data_path = temp_dir / "agent_data"
+        _make_tree(data_path)
+        _age_tree(data_path)
+        index = ArtifactIndex(data_path)
+        assert index.refresh() == (12, 0)
+        assert index.refresh() == (0, 0) and index.dirs_scanned == 0
+
+        # New file in one date dir: only that directory is listed
+        _touch(data_path / "agent-a" / "sandbox" / "2026-01-01" / "extra.pdf")
+        assert index.refresh() == (1, 0) and index.dirs_scanned == 1
+
+        # Deleted file, removed date dir, new agent and an index-only record
+        (data_path / "agent-b" / "sandbox" / "2026-01-01" / "report.docx").unlink()
+        shutil.rmtree(data_path / "agent-b" / "sandbox" / "2026-01-02")
+        _touch(data_path / "agent-c" / "sandbox" / "2026-02-01" / "new.pdf")
+        added, removed = index.refresh()
+        assert (added, removed) == (1, 4), (added, removed)
+        paths = {a["path"] for a in index.sample(100)}
+        assert paths == _legacy_scan(data_path) and len(index) == 10
+
+        index.discard("agent-c/sandbox/2026-02-01/new.pdf")
+        assert index.lookup("agent-c/sandbox/2026-02-01/new.pdf") is None
+        index.record("agent-c/sandbox/2026-02-01/new.pdf", 99)
+        index.record("agent-c/work/ignored.pdf", 1)
+        assert index.lookup("agent-c/sandbox/2026-02-01/new.pdf")["size_bytes"] == 99
+        assert len(index) == 10
+        assert {a["path"] for a in index.sample(100)} == paths
+        print("✓ Refresh lists only changed directories and tracks adds/removals")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_parse_byte_range():
+    """Test single-range parsing and unsatisfiable ranges"""
+    assert parse_byte_range(None, 100) is None
+    assert parse_byte_range("bytes=0-9", 100) == (0, 9)
+    assert parse_byte_range("bytes=90-", 100) == (90, 99)
+    assert parse_byte_range("bytes=-10", 100) == (90, 99)
+    assert parse_byte_range("bytes=-500", 100) == (0, 99)
+    assert parse_byte_range("bytes=50-1000", 100) == (50, 99)
+    for ignored in ("bytes=0-1,5-6", "items=0-1", "bytes=abc", "bytes=9-1", "bytes=-"):
+        assert parse_byte_range(ignored, 100) is None, ignored
+    for unsatisfiable in ("bytes=100-", "bytes=-0"):
+        try:
+            parse_byte_range(unsatisfiable, 100)
+            raise AssertionError(f"{unsatisfiable} should be unsatisfiable")
+        except ValueError:
+            pass
+    print("✓ Range headers parsed")
+
+
+def _serve(response: ArtifactFileResponse, on_body=None):
+    """Drive the ASGI response; returns (status, headers, body)"""
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+        if on_body and message["type"] == "http.response.body":
+            on_body()
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    asyncio.run(response({"type": "http", "method": "GET", "headers": []}, receive, send))
+    start = messages[0]
+    headers = {k.decode(): v.decode() for k, v in start["headers"]}
+    return start["status"], headers, b"".join(m.get("body", b"") for m in messages[1:])
+
+
+def test_file_response_matches_file_on_disk():
+    """Test that headers follow the opened file and short bodies are never sent"""
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        path = temp_dir / "report.pdf"
+        path.write_bytes(b"a" * 1000)
+        status, headers, body = _serve(ArtifactFileResponse(str(path), os.stat(path), "application/pdf"))
+        assert status == 200 and headers["content-length"] == "1000" and len(body) == 1000
+
+        # Shrunk between the caller's stat and the open: headers are rebuilt
+        stale = os.stat(path)
+        path.write_bytes(b"b" * 300)
+        status, headers, body = _serve(ArtifactFileResponse(str(path), stale, "application/pdf"))
+        assert status == 200 and headers["content-length"] == "300" and body == b"b" * 300
+        status, headers, body = _serve(
+            ArtifactFileResponse(str(path), stale, "application/pdf", range_header="bytes=500-")
+        )
+        assert status == 416 and headers["content-range"] == "bytes */300" and body == b""
+
+        # Shrunk mid-response: the response aborts instead of ending short
+        path.write_bytes(b"c" * 1000)
+        response = ArtifactFileResponse(str(path), os.stat(path), "application/pdf")
+        response.chunk_size = 100
+        try:
+            _serve(response, on_body=lambda: os.truncate(path, 150))
+            raise AssertionError("a shrinking file must abort the response")
+        except RuntimeError as e:
+            assert "shrank" in str(e)
+        print("✓ File responses follow the opened file and never end short")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    print("\n" + "="*60)
+    print("ARTIFACT INDEX TEST SUITE")
+    print("="*60)
+
+    try:
+        test_matches_full_walk_and_filters()
+        test_incremental_refresh()
+        test_parse_byte_range()
+        test_file_response_matches_file_on_disk()
+        print("\n🎉 ALL TESTS PASSED!")
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,146 @@
+"""
+Test script for the async pooled LLM evaluator
+
+Swaps the OpenAI clients for in-process stubs, so neither an API key nor
+the openai SDK is needed. This script validates:
+1. Batch evaluation returns results in order and respects max_in_flight
+2. Re-running on unchanged artifacts is served from the result cache
+3. Changing an artifact or the rubric triggers a new evaluation
+4. Rebinding to a new event loop closes the previous pooled client
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import tempfile
+import shutil
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+class StubAsyncClient:
+    """Mimics AsyncOpenAI.chat.completions.create with a fixed score"""
+
+    requests = 0
+    in_flight = 0
+    peak_in_flight = 0
+
+    def __init__(self):
+        self.closed = False
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, model, messages):
+        cls = type(self)
+        cls.requests += 1
+        cls.in_flight += 1
+        cls.peak_in_flight = max(cls.peak_in_flight, cls.in_flight)
+        try:
+            await asyncio.sleep(0.05)  # stub model latency
+        finally:
+            cls.in_flight -= 1
+        message = SimpleNamespace(content="**OVERALL SCORE:** 8\n\n**FEEDBACK:** Solid work.")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    async def close(self):
+        self.closed = True
+
+
+def test_batch_concurrency_and_result_cache():
+    """Test in-flight cap, ordering, result caching and client cleanup"""
+    temp_dir = Path(tempfile.mkdtemp())
+    saved_env = {k: os.environ.get(k) for k in ("EVALUATION_API_KEY", "EVALUATION_API_BASE", "EVALUATION_MODEL", "LIVEBENCH_EVALUATION_CACHE_DIR")}
+    try:
+        os.environ["EVALUATION_API_KEY"] = "stub-key"
+        os.environ.pop("EVALUATION_API_BASE", None)
+        os.environ.pop("EVALUATION_MODEL", None)
+        os.environ["LIVEBENCH_EVALUATION_CACHE_DIR"] = str(temp_dir / "eval_cache")
+
+        from livebench.work import llm_evaluator
+        llm_evaluator._result_cache = None
+        from livebench.work.llm_evaluator import AsyncLLMEvaluator
+
+        class StubEvaluator(AsyncLLMEvaluator):
+            def _create_client(self):
+                return None  # the sync path is not exercised
+
+            def _create_async_client(self):
+                client = StubAsyncClient()
+                self.clients.append(client)
+                return client
+
+        meta_dir = temp_dir / "meta_prompts"
+        meta_dir.mkdir()
+        rubric = meta_dir / "Test_Occupation.json"
+        rubric.write_text(json.dumps({"category": "Test", "evaluation_prompt": "Grade it."}))
+
+        jobs = []
+        for i in range(12):
+            artifact = temp_dir / f"report-{i}.md"
+            artifact.write_text(f"# Report {i}\n")
+            jobs.append({
+                "task": {"task_id": f"task-{i}", "occupation": "Test Occupation", "prompt": f"Write report {i}"},
+                "artifact_paths": [str(artifact)],
+                "max_payment": 100.0
+            })
+
+        evaluator = StubEvaluator(meta_prompts_dir=str(meta_dir), max_in_flight=3)
+        evaluator.clients = []
+        results = evaluator.evaluate_batch(jobs)
+        assert all(not isinstance(r, Exception) for r in results), results
+        assert [r[0] for r in results] == [0.8] * 12 and results[0][2] == 80.0
+        assert StubAsyncClient.requests == 12
+        assert StubAsyncClient.peak_in_flight == 3
+
+        # Unchanged artifacts and rubric: served from cache, no requests
+        results = evaluator.evaluate_batch(jobs)
+        assert StubAsyncClient.requests == 12 and results[5][0] == 0.8
+
+        # One changed artifact -> one request; rubric change -> all re-evaluated
+        Path(jobs[0]["artifact_paths"][0]).write_text("# Report 0, revised\n")
+        evaluator.evaluate_batch(jobs)
+        assert StubAsyncClient.requests == 13
+        rubric.write_text(json.dumps({"category": "Test", "evaluation_prompt": "Grade it strictly.", "version": "2"}))
+        os.utime(rubric, ns=(time.time_ns() + 10**9,) * 2)
+        evaluator.evaluate_batch(jobs)
+        assert StubAsyncClient.requests == 25
+        assert all(client.closed for client in evaluator.clients)
+
+        # evaluate_many on successive loops without aclose(): rebinding closes
+        # the previous loop's client instead of leaking its pool
+        Path(jobs[1]["artifact_paths"][0]).write_text("# Report 1, revised\n")
+        asyncio.run(evaluator.evaluate_many(jobs[:2]))
+        first = evaluator.async_client
+        Path(jobs[2]["artifact_paths"][0]).write_text("# Report 2, revised\n")
+        asyncio.run(evaluator.evaluate_many(jobs[:3]))
+        assert first.closed and evaluator.async_client is not first and not evaluator.async_client.closed
+        asyncio.run(evaluator.aclose())
+        assert all(client.closed for client in evaluator.clients) and len(evaluator.clients) == 6
+        print(f"✓ {StubAsyncClient.requests} stub requests, peak in flight {StubAsyncClient.peak_in_flight}, "
+              f"{len(evaluator.clients)} clients all closed")
+    finally:
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    print("\n" + "="*60)
+    print("ASYNC EVALUATOR TEST SUITE")
+    print("="*60)
+
+    try:
+        test_batch_concurrency_and_result_cache()
+        print("\n🎉 ALL TESTS PASSED!")
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
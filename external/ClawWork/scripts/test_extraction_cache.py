@@ -0,0 +1,99 @@
+"""
+Test script for the content-addressed extraction cache
+
+This script validates:
+1. Hits are keyed by file content and parameters, not by path
+2. Image lists round-trip and the cache is reloaded from disk
+3. LRU eviction keeps the cache under its size limit
+"""
+
+import sys
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from livebench.utils.extraction_cache import ExtractionCache
+
+
+def test_content_addressed_hits():
+    """Test that copies of a file share entries and params split them"""
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        cache = ExtractionCache(temp_dir / "cache")
+        a = temp_dir / "a.docx"
+        b = temp_dir / "copy-of-a.docx"
+        a.write_bytes(b"same bytes")
+        b.write_bytes(b"same bytes")
+        calls = []
+
+        def extract():
+            calls.append(1)
+            return "extracted text"
+
+        assert cache.get_or_compute(a, "docx_text", extract) == "extracted text"
+        assert cache.get_or_compute(b, "docx_text", extract) == "extracted text"
+        assert len(calls) == 1
+        cache.get_or_compute(a, "docx_text", extract, params={"dpi": 150})
+        assert len(calls) == 2
+
+        # Changed content is a new key; failures (None) are not cached
+        a.write_bytes(b"different bytes")
+        assert cache.get_or_compute(a, "docx_text", lambda: None) is None
+        assert cache.get_or_compute(a, "docx_text", lambda: None) is None
+
+        stats = cache.stats()
+        assert stats["by_kind"]["docx_text"] == {"hits": 1, "misses": 4}
+        print(f"✓ Content-addressed hits: {stats['hits']} hits / {stats['misses']} misses")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_images_roundtrip_and_lru_eviction():
+    """Test image codec, reload from disk and size-bounded eviction"""
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        cache_dir = temp_dir / "cache"
+        cache = ExtractionCache(cache_dir, max_bytes=3000)
+        sources = []
+        for i in range(4):
+            source = temp_dir / f"doc-{i}.pdf"
+            source.write_bytes(f"pdf {i}".encode())
+            sources.append(source)
+
+        pages = [b"\x89PNG" + bytes([i]) * 500 for i in range(2)]
+        keys = [cache.make_key(source, "pdf_images") for source in sources]
+        cache.put(keys[0], pages, codec="images")
+        cache.put(keys[1], pages, codec="images")
+        assert cache.get(keys[0], codec="images") == pages  # 0 is now most recent
+        cache.put(keys[2], pages, codec="images")
+
+        assert cache.stats()["size_bytes"] <= 3000
+        assert cache.get(keys[1], codec="images") is None  # least recently used
+        assert cache.get(keys[0], codec="images") == pages
+        assert cache.stats()["evictions"] == 1
+
+        reloaded = ExtractionCache(cache_dir, max_bytes=3000)
+        assert reloaded.stats()["entries"] == 2
+        assert reloaded.get(keys[2], codec="images") == pages
+        print("✓ Image entries round-trip and LRU eviction respects the size limit")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    print("\n" + "="*60)
+    print("EXTRACTION CACHE TEST SUITE")
+    print("="*60)
+
+    try:
+        test_content_addressed_hits()
+        test_images_roundtrip_and_lru_eviction()
+        print("\n🎉 ALL TESTS PASSED!")
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
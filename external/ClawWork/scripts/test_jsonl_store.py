@@ -0,0 +1,209 @@
+"""
+Test script for the incremental JSONL store used by the API server
+
+This script validates:
+1. Only newly appended lines are parsed on refresh
+2. Partially written lines are deferred until their newline lands, and an
+   unterminated final record is returned once the file stops changing
+3. In-place rewrites that keep the inode and the first bytes are detected
+4. Running aggregates (latest balance, evaluation average, spend) stay correct
+5. Full histories come from a bounded LRU and rebuild on truncation / rewrite
+6. Repeat leaderboards for more agents than the LRU holds parse no lines
+"""
+
+import os
+import sys
+import json
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from livebench.api import jsonl_store
+from livebench.api.jsonl_store import JsonlTail, HistoryCache, get_tenant_store
+
+
+def _append(path: Path, *records: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def test_tail_reads_only_appended_lines():
+    """Test offset tracking and partial-line handling"""
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        path = temp_dir / "balance.jsonl"
+        tail = JsonlTail(path)
+        assert tail.read_new() == (False, [])
+
+        _append(path, {"n": 1}, {"n": 2})
+        reset, records = tail.read_new()
+        assert not reset and [r["n"] for r in records] == [1, 2]
+        assert tail.read_new() == (False, [])
+
+        # Half-written record is not returned until completed
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"n": 3')
+        assert tail.read_new() == (False, [])
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("}\n")
+        reset, records = tail.read_new()
+        assert not reset and [r["n"] for r in records] == [3]
+
+        # A final record without a newline is returned once the file is stable
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"n": 4}')
+        assert tail.read_new() == (False, [])
+        reset, records = tail.read_new()
+        assert not reset and [r["n"] for r in records] == [4]
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('\n{"n": 5}\n')
+        reset, records = tail.read_new()
+        assert not reset and [r["n"] for r in records] == [5]
+        print("✓ Tail parses only appended, complete lines")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_tail_detects_in_place_rewrites():
+    """Test rewrites that keep the inode and the head of the file"""
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        path = temp_dir / "balance.jsonl"
+        records = [{"date": f"2026-01-{d:02d}", "balance": 10.0, "pad": "x" * 200} for d in range(1, 6)]
+        _append(path, *records)
+        tail = JsonlTail(path)
+        assert len(tail.read_new()[1]) == 5
+
+        def rewrite(new_records):
+            # Like the backfill scripts: same inode, unchanged first records
+            with open(path, "w", encoding="utf-8") as f:
+                for record in new_records:
+                    f.write(json.dumps(record) + "\n")
+
+        # Last record changed and a new one appended: the file grew
+        rewrite(records[:4] + [dict(records[4], balance=11.0), {"date": "2026-01-06", "balance": 12.0}])
+        reset, new = tail.read_new()
+        assert reset and [r["balance"] for r in new][-2:] == [11.0, 12.0] and len(new) == 6
+
+        # Same size, new content: caught by size + mtime
+        current = [json.loads(l) for l in path.read_text().splitlines()]
+        st = os.stat(path)
+        rewrite(current[:-1] + [dict(current[-1], balance=13.0)])
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert os.stat(path).st_size == st.st_size
+        reset, new = tail.read_new()
+        assert reset and len(new) == 6 and new[-1]["balance"] == 13.0
+        assert tail.read_new() == (False, [])
+        print("✓ In-place rewrites trigger a rebuild")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_agent_aggregates_and_rebuild():
+    """Test running aggregates and rebuild after truncation"""
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        agent_dir = temp_dir / "agent-a"
+        balance_file = agent_dir / "economic" / "balance.jsonl"
+        _append(balance_file,
+                {"date": "initialization", "balance": 10.0},
+                {"date": "2026-01-01", "balance": 12.0})
+        _append(agent_dir / "work" / "evaluations.jsonl",
+                {"task_id": "t1", "evaluation_score": 0.5},
+                {"task_id": "t2", "evaluation_score": 1.0})
+        _append(agent_dir / "economic" / "token_costs.jsonl",
+                {"date": "2026-01-01", "cost_summary": {"total_cost": 1.5}},
+                {"date": "2026-01-02", "cost_summary": {"total_cost": 2.0}})
+
+        tenant = get_tenant_store(temp_dir)
+        store = tenant.agent("agent-a")
+        assert store.latest_balance["balance"] == 12.0
+        assert store.initial_balance["balance"] == 10.0
+        assert len(store.leaderboard_points) == 1
+        assert store.history("evaluation_scores") == [0.5, 1.0]
+        assert store.avg_evaluation_score == 0.75
+        assert store.spend_usage("2026-01-02") == (2.0, 3.5)
+
+        _append(balance_file, {"date": "2026-01-02", "balance": 15.0})
+        store = tenant.agent("agent-a")
+        assert len(store.history("balance")) == 3
+        assert store.latest_balance["balance"] == 15.0
+        assert not hasattr(store, "balance_history")  # only aggregates are kept
+
+        # Rewrite the file with fewer records: aggregates are rebuilt
+        os.remove(balance_file)
+        _append(balance_file, {"date": "initialization", "balance": 99.0})
+        store = tenant.agent("agent-a")
+        assert [r["balance"] for r in store.history("balance")] == [99.0]
+        assert store.leaderboard_points == []
+        assert store.initial_balance["balance"] == 99.0
+
+        # Views are evicted least recently used first
+        cache = HistoryCache(max_views=2)
+        cache.get(agent_dir, "balance")
+        cache.get(agent_dir, "evaluations")
+        cache.get(agent_dir, "balance")
+        cache.get(agent_dir, "decisions")
+        assert [name for _, name in cache._views] == ["balance", "decisions"]
+
+        assert [s.agent_dir.name for s in tenant.agents()] == ["agent-a"]
+        print("✓ Aggregates update incrementally and rebuild on rewrite")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_leaderboard_reads_nothing_when_unchanged():
+    """Test that leaderboard rows come from aggregates, not the history LRU"""
+    temp_dir = Path(tempfile.mkdtemp())
+    parsed = []
+    parse_record = jsonl_store._parse_record
+
+    def counting_parse(raw_line):
+        if raw_line.strip():
+            parsed.append(raw_line)
+        return parse_record(raw_line)
+
+    try:
+        agents = jsonl_store.get_history_cache().max_views + 10
+        for a in range(agents):
+            _append(temp_dir / f"agent-{a:03d}" / "economic" / "balance.jsonl",
+                    {"date": "initialization", "balance": 10.0},
+                    *({"date": f"2026-01-{d:02d}", "balance": 10.0 + d} for d in range(1, 21)))
+        tenant = get_tenant_store(temp_dir)
+        jsonl_store._parse_record = counting_parse
+
+        first = [s.leaderboard_entry() for s in tenant.agents()]
+        assert len(first) == agents and len(parsed) == agents * 21
+        assert all(len(e["balance_history"]) == 20 and e["pct_change"] == 200.0 for e in first)
+
+        parsed.clear()
+        second = [s.leaderboard_entry() for s in tenant.agents()]
+        assert len(parsed) == 0, f"{len(parsed)} lines re-parsed"
+        assert second == first
+        print(f"✓ Repeat leaderboard over {agents} agents parsed 0 lines")
+    finally:
+        jsonl_store._parse_record = parse_record
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    print("\n" + "="*60)
+    print("JSONL STORE TEST SUITE")
+    print("="*60)
+
+    try:
+        test_tail_reads_only_appended_lines()
+        test_tail_detects_in_place_rewrites()
+        test_agent_aggregates_and_rebuild()
+        test_leaderboard_reads_nothing_when_unchanged()
+        print("\n🎉 ALL TESTS PASSED!")
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,121 @@
+"""
+Test script for the API live-update pipeline
+
+This script validates:
+1. Existing history is not re-broadcast; every appended record is
+2. Bounded client queues merge same-agent updates, then drop the oldest
+3. The inotify watcher picks up agents created after startup
+"""
+
+import sys
+import json
+import asyncio
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from livebench.api.live_updates import ClientChannel, LiveUpdatePipeline
+
+
+def _append(path: Path, *records: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def test_poll_publishes_every_appended_record():
+    """Test offset-based tailing in polling mode"""
+    root = Path(tempfile.mkdtemp())
+    try:
+        balance = root / "t1" / "agent_data" / "agent-a" / "economic" / "balance.jsonl"
+        _append(balance, {"balance": 1}, {"balance": 2})
+
+        published = []
+        pipeline = LiveUpdatePipeline(root, lambda msg, tenant: published.append((tenant, msg)), mode="poll")
+        pipeline.prime()
+        assert pipeline.poll_once() == 0
+
+        _append(balance, {"balance": 3}, {"balance": 4})
+        decisions = root / "t1" / "agent_data" / "agent-a" / "decisions" / "decisions.jsonl"
+        _append(decisions, {"activity": "work"})
+        assert pipeline.poll_once() == 3
+
+        balances = [m["data"]["balance"] for t, m in published if m["type"] == "balance_update"]
+        assert balances == [3, 4]
+        assert all(t == "t1" and m["signature"] == "agent-a" for t, m in published)
+        assert any(m["type"] == "activity_update" for _, m in published)
+        print("✓ Polling publishes every appended record once")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_client_channel_merge_and_drop():
+    """Test bounded queue behaviour when a client falls behind"""
+
+    async def scenario():
+        channel = ClientChannel(websocket=None, tenant_key="t1", max_queue=2)
+        channel.offer({"type": "balance_update", "signature": "a", "data": 1})
+        channel.offer({"type": "echo", "data": "x"})
+        channel.offer({"type": "balance_update", "signature": "a", "data": 2})
+        assert channel.merged == 1 and channel.dropped == 0
+        assert [m.get("data") for m in channel._queue] == ["x", 2]
+
+        channel.offer({"type": "echo", "data": "y"})
+        assert channel.dropped == 1
+        assert [m.get("data") for m in channel._queue] == [2, "y"]
+
+    asyncio.run(scenario())
+    print("✓ Full queues merge same-agent updates before dropping")
+
+
+def test_inotify_discovers_new_agents():
+    """Test event-driven delivery for agents created after startup"""
+    if not sys.platform.startswith("linux"):
+        print("- Skipped (inotify is Linux-only)")
+        return
+
+    async def scenario(root: Path):
+        received = asyncio.Queue()
+        pipeline = LiveUpdatePipeline(root, lambda msg, tenant: received.put_nowait(msg), mode="inotify")
+        watcher = asyncio.create_task(pipeline.run())
+        try:
+            await asyncio.sleep(0.1)
+            if pipeline.active_mode != "inotify":
+                return
+            balance = root / "t1" / "agent_data" / "new-agent" / "economic" / "balance.jsonl"
+            _append(balance, {"balance": 7})
+            msg = await asyncio.wait_for(received.get(), timeout=2.0)
+            assert msg["signature"] == "new-agent" and msg["data"]["balance"] == 7
+            _append(balance, {"balance": 8})
+            msg = await asyncio.wait_for(received.get(), timeout=2.0)
+            assert msg["data"]["balance"] == 8
+        finally:
+            watcher.cancel()
+
+    root = Path(tempfile.mkdtemp())
+    try:
+        asyncio.run(scenario(root))
+        print("✓ inotify picks up newly created agents and appends")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    print("\n" + "="*60)
+    print("LIVE UPDATE PIPELINE TEST SUITE")
+    print("="*60)
+
+    try:
+        test_poll_publishes_every_appended_record()
+        test_client_channel_merge_and_drop()
+        test_inotify_discovers_new_agents()
+        print("\n🎉 ALL TESTS PASSED!")
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,146 @@
+"""
+Test script for the incremental static data export
+
+This script validates:
+1. Parallel and serial exports produce identical output with the expected content
+2. Re-running skips unchanged agents and rewrites nothing
+3. Changing one agent's inputs re-exports only that agent's changed files
+"""
+
+import sys
+import json
+import os
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.generate_static_data import export
+
+
+def _append(path: Path, *records):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def _make_agent(data_path: Path, sig: str, final_balance: float):
+    agent_dir = data_path / sig
+    _append(agent_dir / "economic" / "balance.jsonl",
+            {"date": "initialization", "balance": 10.0},
+            {"date": "2026-01-01", "balance": final_balance, "daily_token_cost": 0.5})
+    _append(agent_dir / "decisions" / "decisions.jsonl", {"date": "2026-01-01", "activity": "work"})
+    _append(agent_dir / "work" / "tasks.jsonl", {"task_id": "t1"}, {"task_id": "t2"})
+    _append(agent_dir / "work" / "evaluations.jsonl", {"task_id": "t1", "evaluation_score": 0.8, "payment": 40.0})
+    _append(agent_dir / "memory" / "memory.jsonl", {"topic": "Excel", "date": "2026-01-01", "knowledge": "Use formulas"})
+    (agent_dir / "terminal_logs").mkdir()
+    (agent_dir / "terminal_logs" / "2026-01-01.log").write_text("started\n")
+    sandbox = agent_dir / "sandbox" / "2026-01-01"
+    (sandbox / "code_exec").mkdir(parents=True)
+    (sandbox / "report.docx").write_bytes(b"docx bytes")
+    (sandbox / "notes.txt").write_text("ignored")
+    (sandbox / "code_exec" / "scratch.pdf").write_bytes(b"ignored")
+
+
+def _snapshot(out_path: Path) -> dict:
+    return {
+        str(p.relative_to(out_path)): p.read_bytes()
+        for p in out_path.rglob("*") if p.is_file()
+    }
+
+
+def _setup(temp_dir: Path) -> Path:
+    data_path = temp_dir / "agent_data"
+    for i, balance in enumerate([5.0, 120.0, 60.0]):
+        _make_agent(data_path, f"agent-{i}", balance)
+    # Agent without a balance history still contributes artifacts
+    (data_path / "agent-x" / "sandbox" / "2026-01-02").mkdir(parents=True)
+    (data_path / "agent-x" / "sandbox" / "2026-01-02" / "deck.pptx").write_bytes(b"pptx")
+    return data_path
+
+
+def test_parallel_matches_serial():
+    """Test output content and that the process pool changes nothing"""
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        data_path = _setup(temp_dir)
+        serial, parallel = temp_dir / "serial", temp_dir / "parallel"
+        export(data_path, serial, temp_dir / "serial.json", jobs=1)
+        stats = export(data_path, parallel, temp_dir / "parallel.json", jobs=3)
+        assert _snapshot(serial) == _snapshot(parallel)
+        assert stats["agents"] == 4 and stats["artifacts"] == 4
+
+        leaderboard = json.loads((parallel / "leaderboard.json").read_text())["agents"]
+        assert [a["signature"] for a in leaderboard] == ["agent-1", "agent-2", "agent-0"]
+        assert leaderboard[0]["avg_eval_score"] == 0.8 and leaderboard[0]["pct_change"] == 1100.0
+
+        tasks = json.loads((parallel / "agents" / "agent-1" / "tasks.json").read_text())["tasks"]
+        assert tasks[0]["completed"] and tasks[0]["payment"] == 40.0 and not tasks[1]["completed"]
+
+        artifacts = json.loads((parallel / "artifacts.json").read_text())["artifacts"]
+        assert sorted(a["filename"] for a in artifacts) == ["deck.pptx"] + ["report.docx"] * 3
+        assert (parallel / "files" / "agent-x" / "sandbox" / "2026-01-02" / "deck.pptx").read_bytes() == b"pptx"
+        assert not (parallel / "agents" / "agent-x.json").exists()
+        log = json.loads((parallel / "agents" / "agent-0" / "terminal-logs" / "2026-01-01.json").read_text())
+        assert log == {"date": "2026-01-01", "content": "started\n"}
+        print(f"✓ {len(_snapshot(parallel))} files identical between serial and parallel export")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_incremental_rerun():
+    """Test manifest-based skipping and change detection"""
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        data_path = _setup(temp_dir)
+        out_path, manifest = temp_dir / "out", temp_dir / "manifest.json"
+        export(data_path, out_path, manifest, jobs=2)
+        before = {p: p.stat().st_mtime_ns for p in out_path.rglob("*") if p.is_file()}
+
+        stats = export(data_path, out_path, manifest, jobs=2)
+        assert stats["skipped"] == 4 and stats["files_written"] == 0 and stats["artifacts_copied"] == 0
+
+        # Touching a file without changing it is not a change
+        balance = data_path / "agent-0" / "economic" / "balance.jsonl"
+        os.utime(balance, ns=(balance.stat().st_mtime_ns + 10**9,) * 2)
+        stats = export(data_path, out_path, manifest, jobs=2)
+        assert stats["skipped"] == 4 and stats["files_written"] == 0
+
+        # New balance row for agent-0: its detail/economic files plus the aggregates change
+        _append(balance, {"date": "2026-01-02", "balance": 500.0})
+        stats = export(data_path, out_path, manifest, jobs=2)
+        assert stats["skipped"] == 3 and stats["artifacts_copied"] == 0
+        after = {p: p.stat().st_mtime_ns for p in out_path.rglob("*") if p.is_file()}
+        rewritten = sorted(str(p.relative_to(out_path)) for p in after if after[p] != before[p])
+        assert rewritten == ["agents.json", "agents/agent-0.json", "agents/agent-0/economic.json", "leaderboard.json"], rewritten
+        leaderboard = json.loads((out_path / "leaderboard.json").read_text())["agents"]
+        assert leaderboard[0]["signature"] == "agent-0"
+
+        # Deleted outputs are regenerated; --full re-exports everything
+        shutil.rmtree(out_path / "files")
+        stats = export(data_path, out_path, manifest, jobs=2)
+        assert stats["artifacts_copied"] == 4
+        stats = export(data_path, out_path, manifest, jobs=2, full=True)
+        assert stats["skipped"] == 0 and stats["files_written"] == 0
+        print("✓ Unchanged agents skipped; only changed outputs rewritten")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    print("\n" + "="*60)
+    print("STATIC EXPORT TEST SUITE")
+    print("="*60)
+
+    try:
+        test_parallel_matches_serial()
+        test_incremental_rerun()
+        print("\n🎉 ALL TESTS PASSED!")
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
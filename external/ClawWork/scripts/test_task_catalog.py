@@ -0,0 +1,147 @@
+"""
+Test script for the indexed task catalog
+
+This script validates:
+1. Sector/occupation/task_id filters match the index-free semantics
+2. Random selection never repeats a task and exhausts cleanly
+3. Row pool removal and sampling stay consistent
+4. A task id repeated on several rows is only ever assigned once
+5. Parquet catalogs read single row groups and return the right row
+   across group boundaries
+"""
+
+import sys
+import random
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from livebench.work.task_catalog import RowPool
+from livebench.work.task_manager import TaskManager
+
+
+def _tasks(n: int):
+    return [
+        {
+            "task_id": f"task-{i}",
+            "sector": f"sector-{i % 3}",
+            "occupation": f"occupation-{i % 4}",
+            "prompt": f"Prompt {i}",
+        }
+        for i in range(n)
+    ]
+
+
+def test_filters_and_lookup():
+    """Test index-based filters against a linear reference"""
+    tasks = _tasks(60)
+    filters = {"sectors": ["sector-1"], "occupations": ["occupation-2", "occupation-3"], "task_ids": []}
+    tm = TaskManager(task_source_type="inline", inline_tasks=tasks, agent_filters=filters)
+    assert tm.load_tasks() == len(tm.filtered_rows)
+
+    expected = [
+        t["task_id"] for t in tasks
+        if t["sector"] == "sector-1" and t["occupation"] in ("occupation-2", "occupation-3")
+    ]
+    assert [tm.catalog.task_ids[r] for r in tm.filtered_rows] == expected
+    assert tm.get_task_by_id("task-7")["prompt"] == "Prompt 7"  # outside filter, still found
+    assert tm.get_task_by_id("missing") is None
+
+    assigned = TaskManager(
+        task_source_type="inline",
+        inline_tasks=_tasks(10),
+        agent_assignment={"mode": "cycle", "task_ids": ["task-5", "task-2"]}
+    )
+    assigned.load_tasks()
+    picked = [assigned.select_daily_task(f"2026-01-0{d}")["task_id"] for d in (1, 2)]
+    assert picked == ["task-5", "task-2"]
+    assert assigned.select_daily_task("2026-01-03") is None
+    print(f"✓ Filters matched {len(expected)} tasks; explicit assignment order kept")
+
+
+def test_random_selection_exhausts_without_repeats():
+    """Test O(1) unused-task sampling"""
+    random.seed(7)
+    tm = TaskManager(task_source_type="inline", inline_tasks=_tasks(25))
+    tm.load_tasks()
+    seen = []
+    for day in range(30):
+        task = tm.select_daily_task(f"day-{day}")
+        if task is None:
+            break
+        seen.append(task["task_id"])
+    assert len(seen) == 25 and len(set(seen)) == 25
+    assert tm.select_daily_task("day-0")["task_id"] == seen[0]  # same date reuses its task
+
+    pool = RowPool(range(5))
+    for row in (4, 0, 0, 2):
+        pool.discard(row)
+    assert len(pool) == 2 and 1 in pool and 3 in pool and 0 not in pool
+    assert {pool.sample() for _ in range(50)} == {1, 3}
+    print("✓ Random selection visited every task exactly once")
+
+
+def test_duplicate_task_ids_assigned_once():
+    """Test that every row of a repeated task id leaves the unused pool"""
+    tasks = _tasks(6)
+    tasks.insert(4, dict(tasks[1], prompt="Prompt 1 (again)"))
+    tasks.append(dict(tasks[1], prompt="Prompt 1 (third)"))
+    for seed in range(20):
+        random.seed(seed)
+        tm = TaskManager(task_source_type="inline", inline_tasks=tasks)
+        tm.load_tasks()
+        assert tm.catalog.rows_for_id("task-1") == [1, 4, 7]
+        assert tm.get_task_by_id("task-1")["prompt"] == "Prompt 1"  # first row wins
+        seen = []
+        for day in range(10):
+            task = tm.select_daily_task(f"day-{day}")
+            if task is None:
+                break
+            seen.append(task["task_id"])
+        assert sorted(seen) == [f"task-{i}" for i in range(6)], seen
+    print("✓ Repeated task ids are assigned once")
+
+
+def test_parquet_reads_row_groups():
+    """Test row-group reads and lookups across group boundaries"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        tasks = _tasks(10)
+        parquet_path = temp_dir / "data" / "train-00000-of-00001.parquet"
+        parquet_path.parent.mkdir()
+        pq.write_table(pa.Table.from_pylist(tasks), parquet_path, row_group_size=4)
+        assert pq.ParquetFile(parquet_path).num_row_groups == 3
+
+        tm = TaskManager(task_source_type="parquet", task_source_path=str(temp_dir))
+        assert tm.load_tasks() == 10
+        # Jump back and forth between groups and across their edges
+        for i in (9, 0, 3, 4, 8, 7, 1, 5, 2, 6):
+            assert tm.get_task_by_id(f"task-{i}") == tasks[i], i
+        assert tm.get_task_by_id("missing") is None
+        print("✓ Parquet rows read by row group across 3 groups")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    print("\n" + "="*60)
+    print("TASK CATALOG TEST SUITE")
+    print("="*60)
+
+    try:
+        test_filters_and_lookup()
+        test_random_selection_exhausts_without_repeats()
+        test_duplicate_task_ids_assigned_once()
+        test_parquet_reads_row_groups()
+        print("\n🎉 ALL TESTS PASSED!")
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)